@@ -0,0 +1,135 @@
+import threading
+from collections import OrderedDict
+from domain.ports import PersistencePort, WATCHED_POSITION
+from typing import Any
+
+DEFAULT_MAX_PENDING = 1024
+
+class AsyncPersistenceAdapter(PersistencePort):
+    """Runs the writes of any PersistencePort on a dedicated thread.
+
+    Pending writes are coalesced per key (last write wins) in a bounded
+    queue; callers only block when the queue is full. Reads see pending
+    writes first, so the caller always reads back what it saved. flush() is
+    a barrier that returns once everything queued so far has been written.
+    """
+
+    def __init__(self, inner: PersistencePort, max_pending: int = DEFAULT_MAX_PENDING):
+        self.inner = inner
+        self.max_pending = max_pending
+        # (namespace, key) -> (method name, args)
+        self._pending: OrderedDict = OrderedDict()
+        # Write currently being applied by the worker, still visible to reads
+        self._inflight = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="PersistenceWorker", daemon=True)
+        self._worker.start()
+
+    def _submit(self, slot: tuple, method: str, *args):
+        with self._cond:
+            if slot in self._pending:
+                # Coalesce: replace the queued write but keep its place in line
+                self._pending[slot] = (method, args)
+                return
+            while len(self._pending) >= self.max_pending and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("AsyncPersistenceAdapter is closed")
+            self._pending[slot] = (method, args)
+            self._cond.notify_all()
+
+    def _has_pending(self, slot: tuple) -> bool:
+        # Caller holds self._cond
+        return slot in self._pending or (self._inflight is not None and self._inflight[0] == slot)
+
+    def _pending_entry(self, slot: tuple):
+        # Caller holds self._cond; returns (method name, args) or None
+        entry = self._pending.get(slot)
+        if entry is None and self._inflight is not None and self._inflight[0] == slot:
+            entry = self._inflight[1]
+        return entry
+
+    def _pending_value(self, slot: tuple):
+        # Caller holds self._cond
+        entry = self._pending_entry(slot)
+        return entry[1][-1] if entry else None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                slot, (method, args) = self._pending.popitem(last=False)
+                self._inflight = (slot, (method, args))
+                self._cond.notify_all()
+            try:
+                getattr(self.inner, method)(*args)
+            except Exception as e:
+                print(f"ERROR: persistence write {method}{args[:1]} failed: {e}")
+            finally:
+                with self._cond:
+                    self._inflight = None
+                    self._cond.notify_all()
+
+    def flush(self):
+        with self._cond:
+            while self._pending or self._inflight is not None:
+                self._cond.wait()
+        self.inner.flush()
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+        if hasattr(self.inner, "close"):
+            self.inner.close()
+
+    def save_progress(self, path: str, position: int):
+        self._submit(("progress", path), "save_progress", path, position)
+
+    def load_progress(self, path: str) -> int:
+        with self._cond:
+            entry = self._pending_entry(("progress", path))
+        if entry is None:
+            return self.inner.load_progress(path)
+        method, args = entry
+        return 0 if method == "delete_progress" else args[-1]
+
+    def load_progress_many(self, paths: list[str]) -> dict[str, int]:
+        # Pending writes override what the backend has; deletes remove the entry
+        overrides = {}
+        with self._cond:
+            for path in paths:
+                entry = self._pending_entry(("progress", path))
+                if entry is not None:
+                    overrides[path] = entry
+        result = self.inner.load_progress_many([p for p in paths if p not in overrides])
+        for path, (method, args) in overrides.items():
+            if method != "delete_progress" and (args[-1] > 0 or args[-1] == WATCHED_POSITION):
+                result[path] = args[-1]
+        return result
+
+    def delete_progress(self, path: str):
+        self._submit(("progress", path), "delete_progress", path)
+
+    def save_setting(self, key: str, value: Any):
+        self._submit(("setting", key), "save_setting", key, value)
+
+    def load_setting(self, key: str, default: Any = None) -> Any:
+        with self._cond:
+            if self._has_pending(("setting", key)):
+                return self._pending_value(("setting", key))
+        return self.inner.load_setting(key, default)
+
+    def get_recent_videos(self) -> list[str]:
+        with self._cond:
+            videos = self._pending_value(("recent",))
+        return list(videos) if videos is not None else self.inner.get_recent_videos()
+
+    def save_recent_videos(self, videos: list[str]):
+        self._submit(("recent",), "save_recent_videos", list(videos))
@@ -0,0 +1,112 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+# Binary codecs write MAGIC + codec id before the payload so a file can be
+# decoded without knowing how it was written. JSON codecs write plain JSON
+# with no header, which stays readable by anything (main.py, old versions)
+# and is recognised by its first character.
+MAGIC = b"\x00SPD"
+
+class UnavailableCodecError(RuntimeError):
+    """The file is valid but written with a codec that isn't installed here."""
+
+class Codec(ABC):
+    name: str = ""
+    codec_id: int = 0
+    binary: bool = True
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        pass
+
+class JsonCodec(Codec):
+    binary = False
+
+    def __init__(self, name: str = "json", indent: int = None):
+        self.name = name
+        self.indent = indent
+        self.separators = None if indent else (',', ':')
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, indent=self.indent, separators=self.separators).encode('utf-8')
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+class OrjsonCodec(Codec):
+    """Compact JSON through orjson, when installed."""
+    name = "orjson"
+    binary = False
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def encode(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+    def decode(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+    # Id 2 belonged to a built-in binary codec that was dropped, don't reuse it
+    codec_id = 1
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+def _available() -> dict:
+    codecs = {
+        "json": JsonCodec("json"),
+        "json-pretty": JsonCodec("json-pretty", indent=4),
+    }
+    for factory in (OrjsonCodec, MsgpackCodec):
+        try:
+            codec = factory()
+        except ImportError:
+            continue
+        codecs[codec.name] = codec
+    return codecs
+
+CODECS = _available()
+_BY_ID = {codec.codec_id: codec for codec in CODECS.values() if codec.binary}
+
+# Errors loads() may raise on damaged input. UnavailableCodecError is not one
+# of them: that file is fine, just not readable by this install.
+DECODE_ERRORS = (ValueError, TypeError, IndexError, KeyError)
+
+def get_codec(name: str) -> Codec:
+    """Codec by name. Unavailable optional codecs fall back to compact JSON."""
+    codec = CODECS.get(name)
+    if codec is None:
+        print(f"WARNING: codec '{name}' is not available, using json")
+        codec = CODECS["json"]
+    return codec
+
+def dumps(value: Any, codec: Codec) -> bytes:
+    if codec.binary:
+        return MAGIC + bytes([codec.codec_id]) + codec.encode(value)
+    return codec.encode(value)
+
+def loads(data: bytes) -> Any:
+    """Decode bytes written by dumps() with any codec."""
+    if data.startswith(MAGIC):
+        codec_id = data[len(MAGIC)]
+        codec = _BY_ID.get(codec_id)
+        if codec is None:
+            raise UnavailableCodecError(f"File written with unavailable codec id {codec_id}")
+        return codec.decode(data[len(MAGIC) + 1:])
+    return CODECS.get("orjson", CODECS["json"]).decode(data)
@@ -0,0 +1,62 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class EvictionPolicy:
+    """Limits for the progress history. None disables a limit."""
+    max_entries: Optional[int] = 100000
+    max_age_days: Optional[float] = 365
+    batch_size: int = 200
+
+    def cutoff(self, now: float) -> Optional[float]:
+        """Last-access time before which an entry is expired."""
+        if self.max_age_days is None:
+            return None
+        return now - self.max_age_days * 86400
+
+class ProgressEvictor:
+    """Background thread that trims the progress history of a store.
+
+    The store must implement evict_progress(policy, limit, now) -> int,
+    removing at most `limit` entries per call so its lock is only held for
+    one small batch at a time.
+    """
+
+    def __init__(self, store, policy: EvictionPolicy = None, interval: float = 300.0, pause: float = 0.05):
+        self.store = store
+        self.policy = policy or EvictionPolicy()
+        self.interval = interval
+        self.pause = pause
+        self.evicted = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ProgressEvictor", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def run_once(self) -> int:
+        """Evict in batches until nothing is left to evict."""
+        total = 0
+        while not self._stop.is_set():
+            removed = self.store.evict_progress(self.policy, self.policy.batch_size, time.time())
+            total += removed
+            if removed < self.policy.batch_size:
+                break
+            self._stop.wait(self.pause)
+        self.evicted += total
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"ERROR: progress eviction failed: {e}")
+            self._stop.wait(self.interval)
@@ -0,0 +1,45 @@
+import os
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+class FileLock:
+    """Exclusive advisory lock on `path`, shared between processes.
+
+    Used as a context manager around read-modify-write cycles of a data
+    file; the lock file itself stays empty.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.01):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fh = None
+
+    def __enter__(self):
+        self._fh = open(self.path, 'a+b')
+        if os.name == 'nt':
+            self._fh.seek(0)
+            while True:
+                try:
+                    # LK_LOCK itself gives up after ~10 s, keep waiting
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(self.poll_interval)
+        else:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if os.name == 'nt':
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._fh.close()
+            self._fh = None
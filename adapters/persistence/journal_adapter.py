@@ -0,0 +1,224 @@
+import json
+import os
+import struct
+import threading
+import zlib
+from domain.ports import PersistencePort, WATCHED_POSITION
+from typing import Any
+
+# Record layout (little endian):
+#   crc32 (I) | kind (B) | key length (H) | value length (I) | key | value
+# The CRC covers everything after itself, so a torn or partially written
+# tail record is detected and dropped on replay.
+_HEADER = struct.Struct("<IBHI")
+_POSITION = struct.Struct("<q")
+
+KIND_PROGRESS = 1
+KIND_SETTING = 2
+KIND_RECENT = 3
+KIND_DELETE_PROGRESS = 4
+
+DEFAULT_COMPACT_THRESHOLD = 1024 * 1024
+
+class JournalPersistenceAdapter(PersistencePort):
+    """Log-structured store: every save appends one record to a journal and a
+    background compactor folds the journal into a JSON snapshot.
+
+    Saving is O(1) regardless of history size. Startup loads the snapshot and
+    replays the journal tail on top of it.
+
+    Benchmark only (benchmarks/bench_persistence.py), not an app backend: it
+    has no evict_progress() for ProgressEvictor, no last-access times, and
+    keeps settings in the journal instead of settings.json, which
+    main._read_engine_setting reads before the backend is opened.
+    """
+
+    def __init__(self, base_path: str = "user_data", compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        self.snapshot_path = base_path + ".snapshot.json"
+        self.journal_path = base_path + ".journal"
+        # Journal being folded into the snapshot by the compactor
+        self.compacting_path = base_path + ".journal.compacting"
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._progress: dict[str, int] = {}
+        self._settings: dict[str, Any] = {}
+        self._recent: list[str] = []
+
+        self._load_snapshot()
+        self._replay(self.compacting_path, truncate=False)
+        self._replay(self.journal_path, truncate=True)
+
+        self._journal = open(self.journal_path, 'ab')
+        self._journal_size = self._journal.tell()
+
+        self._compact_event = threading.Event()
+        self._closed = False
+        self._compactor = threading.Thread(target=self._compactor_loop, name="JournalCompactor", daemon=True)
+        self._compactor.start()
+        # A leftover compacting journal means the last compaction never finished
+        if os.path.exists(self.compacting_path):
+            self._compact_event.set()
+
+    # --- Recovery ---
+
+    def _load_snapshot(self):
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self._progress = dict(data.get("progress", {}))
+        self._settings = dict(data.get("settings", {}))
+        self._recent = list(data.get("recent_videos", []))
+
+    def _replay(self, path: str, truncate: bool):
+        try:
+            with open(path, 'rb') as f:
+                buf = f.read()
+        except FileNotFoundError:
+            return
+
+        offset = 0
+        while offset + _HEADER.size <= len(buf):
+            crc, kind, key_len, value_len = _HEADER.unpack_from(buf, offset)
+            end = offset + _HEADER.size + key_len + value_len
+            if end > len(buf):
+                break
+            if zlib.crc32(buf[offset + 4:end]) != crc:
+                break
+            key_start = offset + _HEADER.size
+            key = buf[key_start:key_start + key_len].decode('utf-8')
+            value = buf[key_start + key_len:end]
+            try:
+                self._apply(kind, key, value)
+            except (ValueError, struct.error):
+                break
+            offset = end
+
+        if truncate and offset < len(buf):
+            # Drop the torn tail so new records are appended after valid data
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+
+    def _apply(self, kind: int, key: str, value: bytes):
+        if kind == KIND_PROGRESS:
+            self._progress[key] = _POSITION.unpack(value)[0]
+        elif kind == KIND_SETTING:
+            self._settings[key] = json.loads(value)
+        elif kind == KIND_RECENT:
+            self._recent = json.loads(value)
+        elif kind == KIND_DELETE_PROGRESS:
+            self._progress.pop(key, None)
+        else:
+            raise ValueError(f"Unknown journal record kind {kind}")
+
+    # --- Journal ---
+
+    def _append(self, kind: int, key: str, value: bytes):
+        # Caller holds self._lock
+        key_bytes = key.encode('utf-8')
+        body = _HEADER.pack(0, kind, len(key_bytes), len(value))[4:] + key_bytes + value
+        record = struct.pack("<I", zlib.crc32(body)) + body
+        self._journal.write(record)
+        self._journal.flush()
+        self._journal_size += len(record)
+        if self._journal_size >= self.compact_threshold:
+            self._compact_event.set()
+
+    def _compactor_loop(self):
+        while True:
+            self._compact_event.wait()
+            self._compact_event.clear()
+            if self._closed:
+                return
+            self.compact()
+
+    def compact(self):
+        """Fold the journal into the snapshot. Runs on the compactor thread."""
+        with self._compact_lock:
+            with self._lock:
+                if self._closed:
+                    return
+                if not os.path.exists(self.compacting_path):
+                    if self._journal_size == 0:
+                        return
+                    # Rotate: new saves go to a fresh journal while the old one is folded
+                    self._journal.close()
+                    os.replace(self.journal_path, self.compacting_path)
+                    self._journal = open(self.journal_path, 'ab')
+                    self._journal_size = 0
+                snapshot = {
+                    "progress": dict(self._progress),
+                    "settings": dict(self._settings),
+                    "recent_videos": list(self._recent),
+                }
+
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            os.remove(self.compacting_path)
+
+    def flush(self):
+        with self._lock:
+            if not self._closed:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+
+    def close(self):
+        self.flush()
+        if os.path.exists(self.compacting_path):
+            # Don't leave a half-finished compaction behind
+            self.compact()
+        with self._lock:
+            self._closed = True
+            self._journal.close()
+        self._compact_event.set()
+        self._compactor.join()
+
+    # --- PersistencePort ---
+
+    def save_progress(self, path: str, position: int):
+        if position <= 0 and position != WATCHED_POSITION:
+            self.delete_progress(path)
+            return
+        with self._lock:
+            if self._progress.get(path) == position:
+                return
+            self._progress[path] = position
+            self._append(KIND_PROGRESS, path, _POSITION.pack(position))
+
+    def load_progress(self, path: str) -> int:
+        with self._lock:
+            return self._progress.get(path, 0)
+
+    def load_progress_many(self, paths: list[str]) -> dict[str, int]:
+        with self._lock:
+            return {path: self._progress[path] for path in paths if path in self._progress}
+
+    def delete_progress(self, path: str):
+        with self._lock:
+            if self._progress.pop(path, None) is not None:
+                self._append(KIND_DELETE_PROGRESS, path, b"")
+
+    def save_setting(self, key: str, value: Any):
+        with self._lock:
+            self._settings[key] = value
+            self._append(KIND_SETTING, key, json.dumps(value).encode('utf-8'))
+
+    def load_setting(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._settings.get(key, default)
+
+    def get_recent_videos(self) -> list[str]:
+        with self._lock:
+            return list(self._recent)
+
+    def save_recent_videos(self, videos: list[str]):
+        with self._lock:
+            self._recent = list(videos)
+            self._append(KIND_RECENT, "", json.dumps(self._recent).encode('utf-8'))
@@ -1,52 +1,179 @@
-import json
 import os
-from domain.ports import PersistencePort
+import threading
+import time
+from domain.ports import PersistencePort, WATCHED_POSITION
+from adapters.persistence.json_store import (
+    JsonStore, SETTINGS_FILE, LEGACY_FILE, split_legacy_data, read_legacy_file
+)
 from typing import Any
 
+def _progress_stamp(entry) -> float:
+    # [position, last_access]; bare positions from old files have no stamp
+    return entry[1] if isinstance(entry, list) else 0
+
 class JsonPersistenceAdapter(PersistencePort):
-    def __init__(self, file_path: str = "user_data.json"):
-        self.file_path = file_path
-        self._ensure_file_exists()
-
-    def _ensure_file_exists(self):
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, 'w') as f:
-                json.dump({}, f)
-
-    def _load_data(self) -> dict:
-        try:
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-
-    def _save_data(self, data: dict):
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+    def __init__(self, data_dir: str = ".", flush_delay: float = 1.0, legacy_path: str = LEGACY_FILE,
+                 codec: str = "json"):
+        # Settings, progress and recents are separate namespaces with their
+        # own files, so a progress save never rewrites settings and a path
+        # can't collide with a setting key.
+        # Several processes may share these files: each flush merges this
+        # process's changes into what is on disk, and for progress the entry
+        # with the newest last_access wins.
+        # `codec` applies to progress and recents; settings stay readable JSON.
+        self.settings = JsonStore(os.path.join(data_dir, SETTINGS_FILE), codec="json-pretty")
+        self.progress = JsonStore(os.path.join(data_dir, "progress.json"), stamp=_progress_stamp, codec=codec)
+        self.recent = JsonStore(os.path.join(data_dir, "recent_videos.json"), default_factory=list, codec=codec)
+
+        # Writes are coalesced: the first change arms a timer and everything
+        # that changes before it fires goes out in a single flush.
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._flush_timer = None
+        self._dirty: set = set()
+
+        if legacy_path and not os.path.isabs(legacy_path):
+            legacy_path = os.path.join(data_dir, legacy_path)
+        self._migrate_legacy(legacy_path)
+        self._upgrade_progress_entries()
+
+    def _migrate_legacy(self, legacy_path: str):
+        # One-off split of the old flat user_data.json
+        if self.progress.exists():
+            return
+        data = read_legacy_file(legacy_path)
+        if data is None:
+            return
+        progress, settings, recent = split_legacy_data(data)
+        self.progress.replace(progress)
+        self.progress.commit()
+        if not self.settings.exists():
+            self.settings.replace(settings)
+            self.settings.commit()
+        if not self.recent.exists():
+            self.recent.replace(recent)
+            self.recent.commit()
+
+    def _upgrade_progress_entries(self):
+        # Entries are [position, last_access]; older files stored bare positions.
+        # Keep the dict in least-recently-used order so eviction can work from
+        # the front without scanning.
+        data = self.progress.data
+        if all(isinstance(v, list) for v in data.values()):
+            return
+        now = int(time.time())
+        entries = []
+        for key, value in data.items():
+            if not isinstance(value, list):
+                value = [value, now]
+            if value[0] > 0 or value[0] == WATCHED_POSITION:
+                entries.append((key, value))
+        entries.sort(key=lambda item: item[1][1])
+        self.progress.replace(dict(entries))
+        self._mark_dirty(self.progress)
+
+    def _touch(self, key: str, position: int):
+        # Caller holds self._lock; moves the entry to the most-recent end
+        self.progress.set(key, [position, int(time.time())])
+
+    def _mark_dirty(self, store: JsonStore):
+        # Caller holds self._lock
+        self._dirty.add(store)
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        # The disk write happens outside self._lock so callers on the UI
+        # thread never wait for it; _write_lock keeps flushes in order.
+        with self._write_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                batches = [(store, store.take_changes()) for store in self._dirty]
+                self._dirty.clear()
+            for store, changes in batches:
+                try:
+                    merged = store.merge_write(changes)
+                except OSError as e:
+                    # Keep the changes for the next flush (the next save arms it)
+                    print(f"WARNING: could not write {store.file_path}: {e}")
+                    with self._lock:
+                        store.restore_changes(changes)
+                        self._dirty.add(store)
+                    continue
+                with self._lock:
+                    store.absorb(merged)
 
     def save_progress(self, path: str, position: int):
-        data = self._load_data()
-        data[path] = position
-        self._save_data(data)
+        if position <= 0 and position != WATCHED_POSITION:
+            self.delete_progress(path)
+            return
+        with self._lock:
+            self._touch(path, position)
+            self._mark_dirty(self.progress)
 
     def load_progress(self, path: str) -> int:
-        data = self._load_data()
-        return data.get(path, 0)
+        with self._lock:
+            entry = self.progress.data.get(path)
+            if entry is None:
+                return 0
+            # The access time is only recorded in memory: a read never schedules
+            # a write, it goes out with the next flush of a real change.
+            self._touch(path, entry[0])
+            return entry[0]
+
+    def load_progress_many(self, paths: list[str]) -> dict[str, int]:
+        with self._lock:
+            data = self.progress.data
+            return {path: data[path][0] for path in paths if path in data}
+
+    def delete_progress(self, path: str):
+        with self._lock:
+            if self.progress.delete(path, stamp=int(time.time())):
+                self._mark_dirty(self.progress)
+
+    def evict_progress(self, policy, limit: int, now: float) -> int:
+        """Remove up to `limit` least-recently-used entries that are over the
+        size limit or older than the policy allows."""
+        cutoff = policy.cutoff(now)
+        with self._lock:
+            data = self.progress.data
+            excess = len(data) - policy.max_entries if policy.max_entries is not None else 0
+            victims = []
+            for key, (_, last_access) in data.items():
+                if len(victims) >= limit:
+                    break
+                if len(victims) < excess or (cutoff is not None and last_access < cutoff):
+                    victims.append(key)
+                else:
+                    break
+            for key in victims:
+                # Stamped with its own last access: kept if another process used it since
+                self.progress.delete(key, stamp=data[key][1])
+            if victims:
+                self._mark_dirty(self.progress)
+        return len(victims)
 
     def save_setting(self, key: str, value: Any):
-        data = self._load_data()
-        data[key] = value
-        self._save_data(data)
+        with self._lock:
+            self.settings.set(key, value)
+            self._mark_dirty(self.settings)
 
     def load_setting(self, key: str, default: Any = None) -> Any:
-        data = self._load_data()
-        return data.get(key, default)
+        with self._lock:
+            return self.settings.data.get(key, default)
 
     def get_recent_videos(self) -> list[str]:
-        data = self._load_data()
-        return data.get("recent_videos", [])
+        with self._lock:
+            return list(self.recent.data)
 
     def save_recent_videos(self, videos: list[str]):
-        data = self._load_data()
-        data["recent_videos"] = videos
-        self._save_data(data)
+        with self._lock:
+            self.recent.replace(list(videos))
+            self._mark_dirty(self.recent)
@@ -0,0 +1,208 @@
+import json
+import os
+from adapters.persistence import codecs
+from adapters.persistence.file_lock import FileLock
+from typing import Any, Callable, Optional
+
+# Settings are kept in their own small file for every backend so startup
+# (main._preload_mpv_if_needed) only has to parse this.
+SETTINGS_FILE = "settings.json"
+LEGACY_FILE = "user_data.json"
+
+class _Deleted:
+    """Tombstone for a key removed by this process, stamped with the time of removal."""
+    __slots__ = ("stamp",)
+
+    def __init__(self, stamp=None):
+        self.stamp = stamp
+
+class JsonStore:
+    """A single persistence namespace backed by its own file.
+
+    The file holds one JSON-like value encoded with `codec` (see
+    adapters.persistence.codecs); reading detects the codec from the file,
+    so switching codecs needs no migration.
+
+    Several processes may share the file. Changes made here are tracked per
+    key and written with merge_write(): under an exclusive file lock the file
+    is re-read, only the keys this process changed are applied, and the result
+    is written back. With a `stamp(value)` function returning a value's
+    timestamp, an entry on disk that is newer than the local change wins.
+    """
+
+    def __init__(self, file_path: str, default_factory: Callable[[], Any] = dict,
+                 stamp: Optional[Callable[[Any], float]] = None, codec: str = "json"):
+        self.file_path = file_path
+        self.codec = codecs.get_codec(codec)
+        self._default_factory = default_factory
+        self._stamp = stamp
+        self._lock_path = file_path + ".lock"
+        # key -> new value or _Deleted, since the last take_changes()
+        self._changes: dict = {}
+        # Whole value replaced locally (lists, migrations): overwrite instead of merging
+        self._replaced = False
+        # File written with a codec that isn't installed here: keep changes in memory only
+        self.read_only = False
+        self.data = self.load()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.file_path)
+
+    def load(self) -> Any:
+        try:
+            with open(self.file_path, 'rb') as f:
+                return codecs.loads(f.read())
+        except FileNotFoundError:
+            return self._default_factory()
+        except codecs.UnavailableCodecError as e:
+            # The file is fine for an install that has the codec, leave it alone
+            if not self.read_only:
+                print(f"WARNING: {self.file_path} can't be read here ({e}), changes won't be saved")
+                self.read_only = True
+            return self._default_factory()
+        except codecs.DECODE_ERRORS as e:
+            # Don't let the next write overwrite whatever is left of the file
+            corrupt_path = self.file_path + ".corrupt"
+            print(f"WARNING: {self.file_path} is unreadable ({e}), moved to {corrupt_path}")
+            try:
+                os.replace(self.file_path, corrupt_path)
+            except OSError:
+                pass
+            return self._default_factory()
+
+    def write(self, data: Any):
+        # temp file + fsync + rename, so a crash leaves either the old or the new file
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(codecs.dumps(data, self.codec))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
+
+    # --- Change tracking ---
+
+    def set(self, key: str, value: Any):
+        # Re-inserting moves the key to the end, keeping dicts in update order
+        self.data.pop(key, None)
+        self.data[key] = value
+        self._changes[key] = value
+
+    def delete(self, key: str, stamp=None) -> bool:
+        existed = self.data.pop(key, None) is not None
+        if existed:
+            self._changes[key] = _Deleted(stamp)
+        return existed
+
+    def replace(self, data: Any):
+        self.data = data
+        self._replaced = True
+        self._changes.clear()
+
+    def has_changes(self) -> bool:
+        return self._replaced or bool(self._changes)
+
+    def take_changes(self):
+        """Detach pending changes for merge_write(); the caller serializes access."""
+        if self._replaced:
+            taken = (True, copy_value(self.data))
+        else:
+            taken = (False, self._changes)
+        self._changes = {}
+        self._replaced = False
+        return taken
+
+    def restore_changes(self, taken):
+        """Put back changes from take_changes() whose write failed, so the next
+        write retries them. Changes made since then are newer and win."""
+        replaced, changes = taken
+        if replaced:
+            # self.data still holds the replaced value plus anything changed since
+            self._replaced = True
+            self._changes.clear()
+        elif not self._replaced:
+            for key, value in changes.items():
+                self._changes.setdefault(key, value)
+
+    def merge_write(self, taken) -> Any:
+        """Apply changes from take_changes() to the file under the file lock.
+        Returns the merged value now on disk."""
+        replaced, changes = taken
+        with FileLock(self._lock_path):
+            if replaced:
+                merged = changes
+            else:
+                merged = self.load()
+                for key, value in changes.items():
+                    current = merged.get(key)
+                    deleted = isinstance(value, _Deleted)
+                    if current is not None and self._stamp is not None:
+                        local_stamp = value.stamp if deleted else self._stamp(value)
+                        if local_stamp is not None and self._stamp(current) > local_stamp:
+                            # Another process wrote this key more recently
+                            continue
+                    merged.pop(key, None)
+                    if not deleted:
+                        merged[key] = value
+            if not self.read_only:
+                self.write(merged)
+        return merged
+
+    def absorb(self, merged: Any):
+        """Adopt what merge_write() found on disk, keeping changes made since."""
+        if self._replaced:
+            return
+        if not isinstance(merged, dict):
+            self.data = merged
+            return
+        data = dict(merged)
+        for key, value in self._changes.items():
+            data.pop(key, None)
+            if not isinstance(value, _Deleted):
+                data[key] = value
+        self.data = data
+
+    def commit(self):
+        """take_changes() + merge_write() + absorb() in one go."""
+        if self.has_changes():
+            taken = self.take_changes()
+            try:
+                merged = self.merge_write(taken)
+            except Exception:
+                self.restore_changes(taken)
+                raise
+            self.absorb(merged)
+
+def copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+def split_legacy_data(data: dict) -> tuple[dict, dict, list]:
+    """Split the old flat user_data.json into (progress, settings, recent_videos).
+
+    In that format integer values keyed by a path are progress entries,
+    "recent_videos" is the recent list and everything else is a setting.
+    """
+    progress = {}
+    settings = {}
+    for key, value in data.items():
+        if key == "recent_videos":
+            continue
+        if isinstance(value, int) and not isinstance(value, bool):
+            progress[key] = value
+        else:
+            settings[key] = value
+    recent = data.get("recent_videos", [])
+    return progress, settings, recent if isinstance(recent, list) else []
+
+def read_legacy_file(path: str = LEGACY_FILE):
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    return data if isinstance(data, dict) else None
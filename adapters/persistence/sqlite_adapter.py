@@ -0,0 +1,229 @@
+import json
+import sqlite3
+import threading
+import time
+from domain.ports import PersistencePort, WATCHED_POSITION
+from adapters.persistence.json_store import (
+    JsonStore, SETTINGS_FILE, LEGACY_FILE, split_legacy_data, read_legacy_file
+)
+from typing import Any
+
+# 1: progress, settings and recent_videos tables
+# 2: settings moved out to the shared settings.json
+# 3: progress.last_access (+ index) for eviction
+SCHEMA_VERSION = 3
+
+class SqlitePersistenceAdapter(PersistencePort):
+    """PersistencePort backed by a single SQLite database in WAL mode.
+
+    Progress and recents live in their own tables, progress primary-keyed so
+    a save or lookup is a single indexed statement instead of a full file
+    rewrite. Settings are kept in the small settings.json shared with the
+    JSON backend.
+    """
+
+    # Statements are kept as constants so sqlite3's statement cache reuses
+    # the prepared form on every call.
+    _SQL_SAVE_PROGRESS = (
+        "INSERT INTO progress (path, position, last_access) VALUES (?, ?, ?) "
+        "ON CONFLICT(path) DO UPDATE SET position = excluded.position, last_access = excluded.last_access"
+    )
+    _SQL_LOAD_PROGRESS = "SELECT position FROM progress WHERE path = ?"
+    # One statement for any number of paths: the list is bound as a single JSON parameter
+    _SQL_LOAD_PROGRESS_MANY = (
+        "SELECT path, position FROM progress WHERE path IN (SELECT value FROM json_each(?))"
+    )
+    _SQL_TOUCH_PROGRESS = "UPDATE progress SET last_access = ? WHERE path = ?"
+    _SQL_DELETE_PROGRESS = "DELETE FROM progress WHERE path = ?"
+    _SQL_COUNT_PROGRESS = "SELECT COUNT(*) FROM progress"
+    _SQL_EVICT_PROGRESS = (
+        "DELETE FROM progress WHERE path IN ("
+        "SELECT path FROM progress WHERE last_access < ? LIMIT ?)"
+    )
+    _SQL_EVICT_OLDEST = (
+        "DELETE FROM progress WHERE path IN ("
+        "SELECT path FROM progress ORDER BY last_access LIMIT ?)"
+    )
+    _SQL_LOAD_RECENT = "SELECT path FROM recent_videos ORDER BY rank"
+    _SQL_CLEAR_RECENT = "DELETE FROM recent_videos"
+    _SQL_INSERT_RECENT = "INSERT INTO recent_videos (rank, path) VALUES (?, ?)"
+
+    def __init__(self, db_path: str = "user_data.db", settings_path: str = SETTINGS_FILE,
+                 legacy_json_path: str = LEGACY_FILE):
+        self.db_path = db_path
+        self.legacy_json_path = legacy_json_path
+        self.settings = JsonStore(settings_path, codec="json-pretty")
+        self._lock = threading.Lock()
+        # path -> last access from reads, written with the next real write so
+        # a lookup never writes to the database
+        self._touched: dict[str, int] = {}
+        # Connection may be used from a persistence worker thread; access is
+        # serialized through self._lock.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if version < 1:
+                    self._conn.execute(
+                        "CREATE TABLE IF NOT EXISTS progress ("
+                        "path TEXT PRIMARY KEY, position INTEGER NOT NULL) WITHOUT ROWID"
+                    )
+                    self._conn.execute(
+                        "CREATE TABLE IF NOT EXISTS recent_videos ("
+                        "rank INTEGER PRIMARY KEY, path TEXT NOT NULL)"
+                    )
+                    self._migrate_legacy_json()
+                if version < 2:
+                    self._migrate_settings_table()
+                if version < 3:
+                    self._conn.execute(
+                        "ALTER TABLE progress ADD COLUMN last_access INTEGER NOT NULL DEFAULT 0"
+                    )
+                    self._conn.execute("DELETE FROM progress WHERE position <= 0")
+                    # Unknown access time: start the clock now rather than expire everything
+                    self._conn.execute("UPDATE progress SET last_access = ?", (int(time.time()),))
+                    self._conn.execute(
+                        "CREATE INDEX IF NOT EXISTS progress_last_access ON progress (last_access)"
+                    )
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _migrate_legacy_json(self):
+        # One-off import of the old flat user_data.json
+        data = read_legacy_file(self.legacy_json_path)
+        if data is None:
+            return
+        progress, settings, recent = split_legacy_data(data)
+        # Schema 1 table, last_access is added by the version 3 step
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO progress (path, position) VALUES (?, ?)",
+            [(path, position) for path, position in progress.items() if position > 0],
+        )
+        self._conn.executemany(self._SQL_INSERT_RECENT, list(enumerate(recent)))
+        self._merge_settings(settings)
+
+    def _migrate_settings_table(self):
+        # Schema 1 kept settings in the database
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'settings'"
+        ).fetchone()
+        if not exists:
+            return
+        rows = self._conn.execute("SELECT key, value FROM settings").fetchall()
+        self._merge_settings({key: json.loads(value) for key, value in rows})
+        self._conn.execute("DROP TABLE settings")
+
+    def _merge_settings(self, settings: dict):
+        # Values already in settings.json win over migrated ones
+        for key, value in settings.items():
+            if key not in self.settings.data:
+                self.settings.set(key, value)
+        self.settings.commit()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, sql: str, params: tuple = ()):
+        # Caller holds self._lock; pending access times go out in the same transaction
+        if not self._touched:
+            return self._conn.execute(sql, params)
+        touched = [(stamp, path) for path, stamp in self._touched.items()]
+        self._touched.clear()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(self._SQL_TOUCH_PROGRESS, touched)
+            cursor = self._conn.execute(sql, params) if sql else None
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return cursor
+
+    def flush(self):
+        with self._lock:
+            if self._touched:
+                self._write(None)
+
+    def save_progress(self, path: str, position: int):
+        if position <= 0 and position != WATCHED_POSITION:
+            self.delete_progress(path)
+            return
+        with self._lock:
+            self._touched.pop(path, None)
+            self._write(self._SQL_SAVE_PROGRESS, (path, int(position), int(time.time())))
+
+    def load_progress(self, path: str) -> int:
+        with self._lock:
+            row = self._conn.execute(self._SQL_LOAD_PROGRESS, (path,)).fetchone()
+            if row:
+                self._touched[path] = int(time.time())
+        return row[0] if row else 0
+
+    def load_progress_many(self, paths: list[str]) -> dict[str, int]:
+        if not paths:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(self._SQL_LOAD_PROGRESS_MANY, (json.dumps(list(paths)),)).fetchall()
+        return dict(rows)
+
+    def delete_progress(self, path: str):
+        with self._lock:
+            self._touched.pop(path, None)
+            self._write(self._SQL_DELETE_PROGRESS, (path,))
+
+    def evict_progress(self, policy, limit: int, now: float) -> int:
+        """Remove up to `limit` expired entries, then the least recently used
+        ones while over the size limit."""
+        cutoff = policy.cutoff(now)
+        with self._lock:
+            if self._touched:
+                # Recent reads count as access
+                self._write(None)
+            removed = self._conn.execute(
+                self._SQL_EVICT_PROGRESS, (cutoff if cutoff is not None else -1, limit)
+            ).rowcount
+            if policy.max_entries is not None and removed < limit:
+                count = self._conn.execute(self._SQL_COUNT_PROGRESS).fetchone()[0]
+                excess = min(count - policy.max_entries, limit - removed)
+                if excess > 0:
+                    removed += self._conn.execute(self._SQL_EVICT_OLDEST, (excess,)).rowcount
+        return removed
+
+    def save_setting(self, key: str, value: Any):
+        # Settings change rarely, write them straight through
+        with self._lock:
+            self.settings.set(key, value)
+            self.settings.commit()
+
+    def load_setting(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self.settings.data.get(key, default)
+
+    def get_recent_videos(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(self._SQL_LOAD_RECENT).fetchall()
+        return [row[0] for row in rows]
+
+    def save_recent_videos(self, videos: list[str]):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(self._SQL_CLEAR_RECENT)
+                self._conn.executemany(self._SQL_INSERT_RECENT, list(enumerate(videos)))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
@@ -2,7 +2,7 @@ import os
 import ctypes
 from domain.ports import VideoPlayerPort
 from domain.models import PlaybackState, MediaStatus
-from typing import List, Any
+from typing import List, Any, Optional
 
 class MpvPlayer(VideoPlayerPort):
     def __init__(self, mpv_path: str = "mpv"):
@@ -32,13 +32,19 @@ class MpvPlayer(VideoPlayerPort):
         
         try:
             self.mpv = mpv.MPV()
-            self.mpv['keep-open'] = 'yes'
+            # 'always': never move on to a preloaded playlist entry by itself, the service decides
+            self.mpv['keep-open'] = 'always'
+            # Open and buffer the next playlist entry while the current one ends
+            self.mpv['prefetch-playlist'] = 'yes'
         except Exception as e:
             print(f"MPV init error: {type(e).__name__}: {e}")
             raise
         
         # Internal state
         self._pending_seek = None
+        self._preloaded = None # path appended to mpv's playlist by preload()/queue_next()
+        self._gapless = False
+        self._on_track_advanced = None
         
         # Callbacks
         self._on_position_changed = None
@@ -89,6 +95,14 @@ class MpvPlayer(VideoPlayerPort):
                     if not self.mpv.idle_active:
                          self._on_media_status_changed(MediaStatus.LOADED)
 
+        @self.mpv.property_observer('path')
+        def on_path(name, value):
+            # In gapless mode mpv moves on to the queued entry by itself
+            if self._gapless and value is not None and value == self._preloaded:
+                self._preloaded = None
+                if self._on_track_advanced:
+                    self._on_track_advanced(value)
+
         @self.mpv.property_observer('eof-reached')
         def on_eof(name, value):
             if value and self._on_media_status_changed:
@@ -103,14 +117,66 @@ class MpvPlayer(VideoPlayerPort):
             else:
                 self._on_playback_state_changed(PlaybackState.PLAYING)
 
-    def load(self, path: str):
+    def load(self, path: str, start_position: int = 0):
         # Notify loading
         if self._on_media_status_changed:
             self._on_media_status_changed(MediaStatus.LOADING)
         
-        self.mpv.play(path)
+        # Cleared first so the path observer doesn't take this for a gapless advance
+        preloaded, self._preloaded = self._preloaded, None
+        self._pending_seek = None
+        if path == preloaded and not start_position and self._playlist_count() > 1:
+            # Already opened by prefetch-playlist
+            self.mpv.command('playlist-next', 'force')
+        else:
+            # start= is a per-file option: mpv opens the file at that point directly
+            options = {"start": f"{start_position / 1000:.3f}"} if start_position > 0 else {}
+            self.mpv.loadfile(path, 'replace', **options)
         self.mpv.pause = True
 
+    def preload(self, path: str):
+        try:
+            # Keeps the current entry, drops an older preload
+            self.mpv.command('playlist-clear')
+            self.mpv.command('loadfile', path, 'append')
+            self._preloaded = path
+        except Exception:
+            self._preloaded = None
+
+    def cancel_preload(self):
+        if self._gapless or self._preloaded is None:
+            # In gapless mode the appended entry is the queue, queue_next() owns it
+            return
+        self.queue_next(None)
+
+    def supports_gapless(self) -> bool:
+        return True
+
+    def set_gapless(self, enabled: bool):
+        self._gapless = enabled
+        # keep-open=yes still stops (with eof-reached) after the last entry, but moves on to a queued one
+        self.mpv['keep-open'] = 'yes' if enabled else 'always'
+        self.mpv['gapless-audio'] = 'yes' if enabled else 'weak'
+
+    def queue_next(self, path: Optional[str]):
+        if path:
+            self.preload(path)
+            return
+        try:
+            self.mpv.command('playlist-clear')
+        except Exception:
+            pass
+        self._preloaded = None
+
+    def set_on_track_advanced(self, callback):
+        self._on_track_advanced = callback
+
+    def _playlist_count(self) -> int:
+        try:
+            return self.mpv.playlist_count or 0
+        except:
+            return 0
+
     def play(self):
         self.mpv.pause = False
 
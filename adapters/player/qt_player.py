@@ -13,6 +13,11 @@ class QtPlayer(QObject, VideoPlayerPort, metaclass=QtPlayerMeta):
         self.player = QMediaPlayer()
         self.audio = QAudioOutput()
         self.player.setAudioOutput(self.audio)
+        self._video_output = None
+        
+        # Second player that opens the next file ahead of time (preload)
+        self._standby = None
+        self._standby_path = None
         
         # Internal state
         self.pending_position = None
@@ -25,11 +30,17 @@ class QtPlayer(QObject, VideoPlayerPort, metaclass=QtPlayerMeta):
         self._on_error = None
         
         # Connect Signals
-        self.player.mediaStatusChanged.connect(self._handle_media_status_changed)
-        self.player.playbackStateChanged.connect(self._handle_playback_state_changed)
-        self.player.positionChanged.connect(self._handle_position_changed)
-        self.player.durationChanged.connect(self._handle_duration_changed)
-        self.player.errorOccurred.connect(self._handle_error)
+        self._connect(self.player)
+
+    def _connect(self, player: QMediaPlayer):
+        # Both players stay connected; only the one currently in use is forwarded
+        def active(handler):
+            return lambda *args: handler(*args) if player is self.player else None
+        player.mediaStatusChanged.connect(active(self._handle_media_status_changed))
+        player.playbackStateChanged.connect(active(self._handle_playback_state_changed))
+        player.positionChanged.connect(active(self._handle_position_changed))
+        player.durationChanged.connect(active(self._handle_duration_changed))
+        player.errorOccurred.connect(active(lambda *args: self._handle_error()))
 
     def _handle_media_status_changed(self, status: QMediaPlayer.MediaStatus):
         # Handle pending seek logic
@@ -97,9 +108,45 @@ class QtPlayer(QObject, VideoPlayerPort, metaclass=QtPlayerMeta):
     def set_on_error(self, callback):
         self._on_error = callback
 
-    def load(self, path: str):
+    def load(self, path: str, start_position: int = 0):
         self.pending_position = None # Clear previous pending
-        self.player.setSource(QUrl.fromLocalFile(path))
+        if self._standby is not None and path == self._standby_path:
+            self._swap_to_standby()
+        else:
+            self.player.setSource(QUrl.fromLocalFile(path))
+        if start_position > 0:
+            # Set before play() gets going: right away if the media is loaded
+            # (preloaded), otherwise as soon as it is, ahead of the first frame
+            self.seek(start_position)
+
+    def preload(self, path: str):
+        # Opening the file on a player without outputs demuxes it and sets up the decoders
+        if self._standby is None:
+            self._standby = QMediaPlayer()
+            self._connect(self._standby)
+        if path != self._standby_path:
+            self._standby.setSource(QUrl.fromLocalFile(path))
+            self._standby_path = path
+
+    def cancel_preload(self):
+        if self._standby is not None and self._standby_path is not None:
+            self._standby.setSource(QUrl())
+            self._standby_path = None
+
+    def _swap_to_standby(self):
+        old, new = self.player, self._standby
+        old.stop()
+        old.setVideoOutput(None)
+        old.setAudioOutput(None)
+        new.setAudioOutput(self.audio)
+        if self._video_output is not None:
+            new.setVideoOutput(self._video_output)
+        self.player = new
+        self._standby, self._standby_path = old, None
+        old.setSource(QUrl())
+        # The new player loaded while it wasn't forwarded; report where it is now
+        self._handle_duration_changed(new.duration())
+        self._handle_media_status_changed(new.mediaStatus())
 
     def play(self):
         self.player.play()
@@ -161,4 +208,5 @@ class QtPlayer(QObject, VideoPlayerPort, metaclass=QtPlayerMeta):
         return QVideoWidget(parent)
 
     def set_video_output(self, widget: Any):
+        self._video_output = widget
         self.player.setVideoOutput(widget)
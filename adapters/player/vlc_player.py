@@ -53,7 +53,19 @@ class VlcPlayer(VideoPlayerPort):
         
         # Internal state
         self._current_media = None
+        self._preloaded_media = None # parsed ahead of time by preload()
+        self._preloaded_path = None
         self._last_position = 0
+        
+        # Gapless mode: a MediaListPlayer drives self.player through [current, queued next]
+        self._gapless = False
+        self._list_player = None
+        self._media_list = None
+        self._list_index = 0
+        self._list_start_pending = False
+        self._queued_media = None
+        self._queued_path = None
+        self._on_track_advanced = None
         self._pending_seek = None
         
         # Callbacks
@@ -175,6 +187,9 @@ class VlcPlayer(VideoPlayerPort):
             self._on_playback_state_changed(PlaybackState.STOPPED)
     
     def _handle_end_reached(self, event):
+        if self._gapless and self._queued_media is not None:
+            # The list player continues with the queued item
+            return
         if self._on_media_status_changed:
             self._on_media_status_changed(MediaStatus.End)
 
@@ -199,25 +214,137 @@ class VlcPlayer(VideoPlayerPort):
 
     # --- VideoPlayerPort Implementation ---
 
-    def load(self, path: str):
+    def load(self, path: str, start_position: int = 0):
         # Create new media
         abs_path = os.path.abspath(path)
         
         if self._current_media:
             self._current_media.release()
-            
-        self._current_media = self.instance.media_new(abs_path)
+        
+        # Start offset as a media option: VLC opens the file there instead of seeking after playing
+        options = [f":start-time={start_position / 1000:.3f}"] if start_position > 0 else []
+        if self._preloaded_media is not None and self._preloaded_path == abs_path:
+            # Already parsed by preload()
+            self._current_media = self._preloaded_media
+            for option in options:
+                self._current_media.add_option(option)
+        else:
+            self._current_media = self.instance.media_new(abs_path, *options)
+            self._drop_preloaded()
+        self._pending_seek = None
+        self._last_position = start_position
+        self._preloaded_media = None
+        self._preloaded_path = None
         self.player.set_media(self._current_media)
-        pass
+        if self._gapless:
+            # New list starting with this item; queue_next() adds the one after it
+            self._media_list = self.instance.media_list_new()
+            self._media_list.add_media(self._current_media)
+            self._list_player.set_media_list(self._media_list)
+            self._list_index = 0
+            self._queued_media = None
+            self._queued_path = None
+            self._list_start_pending = True
+
+    def preload(self, path: str):
+        # Parsing opens the file and reads its headers and tracks in a libvlc thread,
+        # so set_media() of the same Media object skips that step
+        abs_path = os.path.abspath(path)
+        if abs_path == self._preloaded_path:
+            return
+        self._drop_preloaded()
+        try:
+            media = self.instance.media_new(abs_path)
+            media.parse_with_options(self.vlc.MediaParseFlag.local, 0)
+        except Exception as e:
+            print(f"VLC preload failed: {e}")
+            return
+        self._preloaded_media = media
+        self._preloaded_path = abs_path
+
+    def cancel_preload(self):
+        self._drop_preloaded()
+
+    def _drop_preloaded(self):
+        if self._preloaded_media is not None:
+            self._preloaded_media.release()
+        self._preloaded_media = None
+        self._preloaded_path = None
 
     def play(self):
-        self.player.play()
+        if self._list_start_pending:
+            self._list_start_pending = False
+            self._list_player.play_item_at_index(self._list_index)
+        else:
+            self.player.play()
 
     def pause(self):
         self.player.pause()
 
     def stop(self):
-        self.player.stop()
+        self._list_start_pending = False
+        if self._gapless and self._list_player is not None:
+            self._list_player.stop()
+        else:
+            self.player.stop()
+
+    def supports_gapless(self) -> bool:
+        return True
+
+    def set_gapless(self, enabled: bool):
+        self._gapless = enabled
+        if enabled and self._list_player is None:
+            self._list_player = self.instance.media_list_player_new()
+            self._list_player.set_media_player(self.player)
+            self._list_player.event_manager().event_attach(
+                self.vlc.EventType.MediaListPlayerNextItemSet, self._handle_next_item_set)
+        if not enabled:
+            self._media_list = None
+            self._queued_media = None
+            self._queued_path = None
+            self._list_start_pending = False
+
+    def queue_next(self, path: Optional[str]):
+        if not self._gapless or self._media_list is None:
+            return
+        media_list = self._media_list
+        media_list.lock()
+        try:
+            # Drop a previously queued item, keep what has played
+            while media_list.count() > self._list_index + 1:
+                media_list.remove_index(self._list_index + 1)
+            self._queued_media = None
+            self._queued_path = None
+            if path:
+                media = self.instance.media_new(os.path.abspath(path))
+                media_list.add_media(media)
+                self._queued_media = media
+                self._queued_path = path
+        finally:
+            media_list.unlock()
+
+    def _handle_next_item_set(self, event):
+        # Also fires for the first item of a new list; only a move to the queued one counts
+        queued = self._queued_media
+        current = self.player.get_media()
+        mrl = current.get_mrl() if current is not None else None
+        if current is not None:
+            current.release()
+        if queued is None or mrl != queued.get_mrl():
+            return
+        path = self._queued_path
+        self._list_index += 1
+        if self._current_media:
+            self._current_media.release()
+        self._current_media = queued
+        self._queued_media = None
+        self._queued_path = None
+        self._last_position = 0
+        if self._on_track_advanced:
+            self._on_track_advanced(path)
+
+    def set_on_track_advanced(self, callback):
+        self._on_track_advanced = callback
 
     def seek(self, position: int):
         pos = int(position)
@@ -0,0 +1,82 @@
+import json
+import shutil
+import subprocess
+import sys
+from typing import Optional
+from domain.models import MediaInfo
+from domain.ports import MediaProberPort
+
+# Don't flash a console window per probe on Windows
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0) if sys.platform == "win32" else 0
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+def _track_name(stream: dict) -> str:
+    tags = stream.get("tags") or {}
+    parts = [tags.get("title"), tags.get("language"), stream.get("codec_name")]
+    return " - ".join(p for p in parts if p) or f"Track {stream.get('index', '?')}"
+
+def parse_ffprobe_output(data: dict) -> MediaInfo:
+    """MediaInfo from `ffprobe -print_format json -show_format -show_streams -show_chapters` output."""
+    fmt = data.get("format") or {}
+    info = MediaInfo(
+        bitrate=_int(fmt.get("bit_rate")),
+        container=fmt.get("format_name"),
+    )
+    seconds = fmt.get("duration")
+    for stream in data.get("streams") or []:
+        kind = stream.get("codec_type")
+        if kind == "video":
+            disposition = stream.get("disposition") or {}
+            if disposition.get("attached_pic") or info.video_codec:
+                # Cover art, or a second video stream
+                continue
+            info.video_codec = stream.get("codec_name")
+            info.width = _int(stream.get("width"))
+            info.height = _int(stream.get("height"))
+            seconds = seconds or stream.get("duration")
+        elif kind == "audio":
+            info.audio_tracks.append(_track_name(stream))
+            info.audio_codec = info.audio_codec or stream.get("codec_name")
+        elif kind == "subtitle":
+            info.subtitle_tracks.append(_track_name(stream))
+    if seconds is not None:
+        info.duration = _int(float(seconds) * 1000)
+    for chapter in data.get("chapters") or []:
+        start = _int(float(chapter.get("start_time", 0)) * 1000) or 0
+        title = (chapter.get("tags") or {}).get("title", "")
+        info.chapters.append((start, title))
+    return info
+
+class FfprobeProber(MediaProberPort):
+    """Probes files with the ffprobe executable from FFmpeg."""
+
+    def __init__(self, executable: str = "ffprobe", timeout: float = 20.0):
+        self.executable = executable
+        self.timeout = timeout
+
+    @staticmethod
+    def find(executable: str = "ffprobe") -> Optional["FfprobeProber"]:
+        """A prober if ffprobe is on PATH, else None."""
+        path = shutil.which(executable)
+        return FfprobeProber(path) if path else None
+
+    def probe(self, path: str) -> Optional[MediaInfo]:
+        cmd = [self.executable, "-v", "error", "-print_format", "json",
+               "-show_format", "-show_streams", "-show_chapters", path]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=self.timeout,
+                                    creationflags=_CREATION_FLAGS)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"ffprobe failed for {path}: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+        try:
+            return parse_ffprobe_output(json.loads(result.stdout))
+        except ValueError:
+            return None
@@ -87,6 +87,7 @@ class RecentVideoItemWidget(QWidget):
 class HomeScreen(QWidget):
     video_selected = Signal(str)
     files_selected = Signal(list)
+    folder_selected = Signal(str)
 
     def __init__(self, persistence, on_engine_change=None):
         super().__init__()
@@ -116,6 +117,12 @@ class HomeScreen(QWidget):
         self.open_button.clicked.connect(self.browse_file)
         left_layout.addWidget(self.open_button, alignment=Qt.AlignCenter)
 
+        self.open_folder_button = QPushButton("Open Folder")
+        self.open_folder_button.setFixedSize(200, 50)
+        self.open_folder_button.setStyleSheet("font-size: 16px; margin-top: 10px;")
+        self.open_folder_button.clicked.connect(self.browse_folder)
+        left_layout.addWidget(self.open_folder_button, alignment=Qt.AlignCenter)
+
         self.settings_button = QPushButton("Settings")
         self.settings_button.setFixedSize(200, 50)
         self.settings_button.setStyleSheet("font-size: 16px; margin-top: 10px;")
@@ -231,7 +238,7 @@ class HomeScreen(QWidget):
         dialog.exec()
 
     def browse_file(self):
-        file_paths, _ = QFileDialog.getOpenFileNames(self, "Open Video(s)", "", "Video Files (*.mp4 *.mkv *.avi *.mov *.wmv)")
+        file_paths, _ = QFileDialog.getOpenFileNames(self, "Open Video(s)", "", "Video Files (*.mp4 *.mkv *.avi *.mov *.wmv);;Playlists (*.m3u *.m3u8 *.pls)")
         if file_paths:
             # We treat the first one as "most recent" for the list logic, or add all?
             # Let's add the first one so it appears in recent.
@@ -243,3 +250,8 @@ class HomeScreen(QWidget):
 
             # Signal main window to play these files
             self.files_selected.emit(file_paths)
+
+    def browse_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Open Folder")
+        if folder:
+            self.folder_selected.emit(folder)
@@ -1,9 +1,11 @@
+import os
 from PySide6.QtWidgets import QMainWindow, QStackedWidget
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QKeyEvent, QCloseEvent
 from adapters.ui.home_screen import HomeScreen
 from adapters.ui.player_screen import PlayerScreen
 from app.services import VideoService
+from app.playlist_files import is_playlist_file
 
 class MainWindow(QMainWindow):
     def __init__(self, service: VideoService):
@@ -15,6 +17,8 @@ class MainWindow(QMainWindow):
 
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
+        # Files and folders can be dropped anywhere on the window
+        self.setAcceptDrops(True)
 
         self.home_screen = HomeScreen(self.service.persistence, self.handle_engine_change)
         self.player_screen = PlayerScreen(service)
@@ -27,6 +31,7 @@ class MainWindow(QMainWindow):
     def setup_connections(self):
         self.home_screen.video_selected.connect(self.on_video_selected)
         self.home_screen.files_selected.connect(self.on_files_selected)
+        self.home_screen.folder_selected.connect(self.on_folder_selected)
 
         self.player_screen.back_clicked.connect(self.show_home)
         self.player_screen.toggle_fullscreen.connect(self.toggle_fullscreen_state)
@@ -38,7 +43,9 @@ class MainWindow(QMainWindow):
             super().keyPressEvent(event)
 
     def closeEvent(self, event: QCloseEvent):
+        self.service.shutdown()
         self.service.close_video()
+        self.service.persistence.flush()
         super().closeEvent(event)
 
     def toggle_fullscreen_state(self):
@@ -72,6 +79,38 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentWidget(self.player_screen)
 
 
+    def on_folder_selected(self, folder: str):
+        self.service.play_folders([folder])
+        self.stack.setCurrentWidget(self.player_screen)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        folders = [p for p in paths if os.path.isdir(p)]
+        extensions = self.service.media_extensions()
+        files = [p for p in paths if os.path.isfile(p)
+                 and (os.path.splitext(p)[1].lower() in extensions or is_playlist_file(p))]
+        if not files and not folders:
+            return
+        event.acceptProposedAction()
+        
+        if self.stack.currentWidget() is self.player_screen and self.service.playlist:
+            # Already watching something: queue the drop
+            self.service.add_files(files)
+            self.service.add_folders(folders)
+            return
+        
+        if files:
+            self.service.play_files(files)
+            if folders:
+                self.service.add_folders(folders)
+        else:
+            self.service.play_folders(folders)
+        self.stack.setCurrentWidget(self.player_screen)
+
     def show_home(self):
         # Exit fullscreen mode if active before returning to home
         if self.isFullScreen():
@@ -3,9 +3,11 @@ from domain.models import PlaybackState, MediaStatus, LoopMode
 from app.services import VideoService
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QSlider, QLabel, QComboBox, QApplication, QStackedLayout,
-                               QListWidget, QListWidgetItem, QFrame, QFileDialog, QSizePolicy,
+                               QListView, QFrame, QFileDialog, QSizePolicy,
                                QAbstractItemView)
-from PySide6.QtCore import Qt, QTimer, Signal, QEvent, QSize
+from PySide6.QtCore import (Qt, QTimer, Signal, QEvent, QSize, QAbstractListModel, QModelIndex,
+                            QMimeData, QByteArray)
+from PySide6.QtGui import QFont, QBrush
 
 # Constants for Win32 API
 GWL_EXSTYLE = -20
@@ -13,6 +15,14 @@ WS_EX_LAYERED = 0x80000
 LWA_COLORKEY = 0x1
 LWA_ALPHA = 0x2
 
+def format_time(ms):
+    seconds = (ms // 1000) % 60
+    minutes = (ms // 60000) % 60
+    hours = (ms // 3600000)
+    if hours > 0:
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+    return f"{minutes:02}:{seconds:02}"
+
 class ClickableOverlay(QWidget):
     double_clicked = Signal()
     clicked = Signal()
@@ -75,6 +85,210 @@ class ClickableOverlay(QWidget):
         event.ignore() 
         super().mouseMoveEvent(event)
 
+ROWS_MIME_TYPE = "application/x-shadowplayer-playlist-rows"
+
+class PlaylistModel(QAbstractListModel):
+    """List model reading straight from VideoService.playlist.
+
+    Nothing is copied per row: data() formats a row only when a view asks for
+    it, and the service's fine-grained playlist signals are forwarded as model
+    notifications so views update just the affected rows.
+    """
+    VideoRole = Qt.UserRole
+
+    def __init__(self, service: VideoService, parent=None):
+        super().__init__(parent)
+        self.service = service
+        self._bold = QFont()
+        self._bold.setBold(True)
+        self._playing = QBrush(Qt.green)
+        # The service signals arrive after the playlist changed, so the row count
+        # seen by views is tracked here and only changes between begin/end calls
+        self._rows = len(service.playlist)
+        # Between a change and its begin* call, views still see the old rows:
+        # old row -> row in the changed playlist, or -1 for a removed one
+        self._old_row = None
+
+        service.playlist_rows_inserted.connect(self._on_rows_inserted)
+        service.playlist_rows_removed.connect(self._on_rows_removed)
+        service.playlist_rows_moved.connect(self._on_rows_moved)
+        service.playlist_reset.connect(self._on_reset)
+        service.current_index_changed.connect(self._on_current_index_changed)
+        service.media_info_changed.connect(self._on_media_info_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if self._old_row is not None:
+            row = self._old_row(row)
+        if not 0 <= row < len(self.service.playlist):
+            return None
+        video = self.service.playlist[row]
+        if role == Qt.DisplayRole:
+            text = f"{row + 1}. {video.title}"
+            if video.duration:
+                text += f"  ({format_time(video.duration)})"
+            if video.resume_position:
+                # Partially watched
+                text += f"  [{format_time(video.resume_position)}]"
+            elif video.watched:
+                text += "  [watched]"
+            return text
+        if role == Qt.ToolTipRole:
+            info = video.info
+            if info is None:
+                return video.path
+            details = [d for d in (info.resolution, info.video_codec, info.audio_codec) if d]
+            if info.bitrate:
+                details.append(f"{info.bitrate // 1000} kb/s")
+            return video.path + ("\n" + ", ".join(details) if details else "")
+        if role == self.VideoRole:
+            return video
+        if row == self.service.current_index:
+            # Highlight playing
+            if role == Qt.FontRole:
+                return self._bold
+            if role == Qt.ForegroundRole:
+                return self._playing
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    # Drag and drop: rows travel as their indices and are moved by the service
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self):
+        return [ROWS_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        rows = sorted({index.row() for index in indexes if index.isValid()})
+        mime = QMimeData()
+        mime.setData(ROWS_MIME_TYPE, QByteArray(",".join(map(str, rows)).encode()))
+        return mime
+
+    def canDropMimeData(self, data, action, row, column, parent):
+        return data.hasFormat(ROWS_MIME_TYPE) and action == Qt.MoveAction
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if not self.canDropMimeData(data, action, row, column, parent):
+            return False
+        raw = bytes(data.data(ROWS_MIME_TYPE)).decode()
+        if not raw:
+            return False
+        if row < 0:
+            # Dropped onto an item or below the last one
+            row = parent.row() if parent.isValid() else self.rowCount()
+        source = int(raw.split(",")[0])
+        # The rows are moved here, nothing is left for the view to remove afterwards
+        return self.moveRows(QModelIndex(), source, 1, QModelIndex(), row)
+
+    def moveRows(self, sourceParent, sourceRow, count, destinationParent, destinationChild):
+        # destinationChild is the row to insert before, counted before the move
+        if count != 1 or sourceParent.isValid() or destinationParent.isValid():
+            return False
+        to = destinationChild - 1 if destinationChild > sourceRow else destinationChild
+        to = min(to, self.rowCount() - 1)
+        if to == sourceRow:
+            return False
+        self.service.reorder_playlist(sourceRow, to)
+        return True
+
+    # Service notifications
+
+    def _on_rows_inserted(self, first, last):
+        count = last - first + 1
+        self._old_row = lambda row: row if row < first else row + count
+        self.beginInsertRows(QModelIndex(), first, last)
+        self._old_row = None
+        self._rows += count
+        self.endInsertRows()
+        self._renumber(last + 1, self.rowCount() - 1)
+
+    def _on_rows_removed(self, first, last):
+        count = last - first + 1
+        self._old_row = lambda row: row if row < first else (-1 if row <= last else row - count)
+        self.beginRemoveRows(QModelIndex(), first, last)
+        self._old_row = None
+        self._rows -= count
+        self.endRemoveRows()
+        self._renumber(first, self.rowCount() - 1)
+
+    def _on_rows_moved(self, first, last, to):
+        count = last - first + 1
+
+        def old_row(row):
+            if first <= row <= last:
+                return to + row - first
+            row = row if row < first else row - count
+            return row + count if row >= to else row
+
+        # Qt wants the destination as the row to insert before, counted before the move
+        destination = to + count if to > first else to
+        self._old_row = old_row
+        moving = self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), destination)
+        self._old_row = None
+        if not moving:
+            # A no-op move: Qt has nothing to end
+            return
+        self.endMoveRows()
+        self._renumber(min(first, to), max(last, to + last - first))
+
+    def _on_reset(self):
+        self.beginResetModel()
+        self._rows = len(self.service.playlist)
+        self.endResetModel()
+
+    def _on_current_index_changed(self, previous, current):
+        for row in (previous, current):
+            if 0 <= row < self.rowCount():
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def _on_media_info_changed(self, videos):
+        # Arrives in batches; only the rows of the batch change, one signal per
+        # contiguous run. Shuffled rows not drawn yet haven't been shown either,
+        # they read the new info when they are.
+        playlist = self.service.playlist
+        rows = sorted(row for row in (playlist.position_of(video, draw=False) for video in videos)
+                      if 0 <= row < self._rows)
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] > rows[i - 1] + 1:
+                self.dataChanged.emit(self.index(rows[start]), self.index(rows[i - 1]),
+                                      [Qt.DisplayRole, Qt.ToolTipRole])
+                start = i
+
+    def _renumber(self, first, last):
+        # Row labels carry their number; views only repaint what is visible
+        if first <= last:
+            self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+
+class PlaylistView(QListView):
+    """QListView for long playlists: rows all have the same height, laid out in batches."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        # Lay out rows a slice at a time so a huge playlist shows up immediately
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(1000)
+
+    def dataChanged(self, topLeft, bottomRight, roles=()):
+        # QListView re-lays out every row on any data change; with uniform row
+        # heights a repaint of the changed rows is enough
+        QAbstractItemView.dataChanged(self, topLeft, bottomRight, roles)
+
 class PlaylistPanel(QWidget):
     close_clicked = Signal()
 
@@ -83,7 +297,6 @@ class PlaylistPanel(QWidget):
         self.service = service
         self.setup_ui()
         self.setup_connections()
-        self.refresh_playlist()
 
     def setup_ui(self):
         # Playlist Panel Style
@@ -97,6 +310,12 @@ class PlaylistPanel(QWidget):
         header_lbl.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
         header_layout.addWidget(header_lbl)
         
+        # Total length of the probed entries
+        self.duration_lbl = QLabel("")
+        self.duration_lbl.setStyleSheet("color: #aaa;")
+        header_layout.addWidget(self.duration_lbl)
+        header_layout.addStretch()
+        
         self.close_btn = QPushButton("X")
         self.close_btn.setFixedSize(30, 30)
         self.close_btn.clicked.connect(self.close_clicked.emit)
@@ -111,6 +330,15 @@ class PlaylistPanel(QWidget):
         self.add_btn.clicked.connect(self.add_files)
         toolbar_layout.addWidget(self.add_btn)
         
+        self.add_folder_btn = QPushButton("+ Folder")
+        self.add_folder_btn.clicked.connect(self.add_folder)
+        toolbar_layout.addWidget(self.add_folder_btn)
+        
+        self.save_btn = QPushButton("Save")
+        self.save_btn.setToolTip("Save playlist as M3U8/PLS")
+        self.save_btn.clicked.connect(self.save_playlist)
+        toolbar_layout.addWidget(self.save_btn)
+        
         self.shuffle_btn = QPushButton("Shuffle")
         self.shuffle_btn.setCheckable(True)
         self.shuffle_btn.clicked.connect(self.toggle_shuffle)
@@ -120,30 +348,89 @@ class PlaylistPanel(QWidget):
         self.loop_btn.clicked.connect(self.cycle_loop_mode)
         toolbar_layout.addWidget(self.loop_btn)
         
-        panel_layout.addLayout(toolbar_layout)
+        self.gapless_btn = QPushButton("Gapless")
+        self.gapless_btn.setCheckable(True)
+        self.gapless_btn.setToolTip("Play the next item without a pause in between (MPV/VLC)")
+        self.gapless_btn.clicked.connect(self.service.set_gapless)
+        toolbar_layout.addWidget(self.gapless_btn)
         
-        # List
-        self.list_widget = QListWidget()
-        self.list_widget.setDragDropMode(QAbstractItemView.InternalMove)
-        self.list_widget.setStyleSheet("background-color: transparent; border: none; color: white;")
-        self.list_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
-        self.list_widget.model().rowsMoved.connect(self.on_rows_moved)
+        panel_layout.addLayout(toolbar_layout)
         
-        panel_layout.addWidget(self.list_widget)
+        # Folder scan status, only visible while a scan runs
+        self.scan_row = QWidget()
+        scan_layout = QHBoxLayout(self.scan_row)
+        scan_layout.setContentsMargins(0, 0, 0, 0)
+        self.scan_label = QLabel("Scanning...")
+        self.scan_label.setStyleSheet("color: #aaa;")
+        scan_layout.addWidget(self.scan_label)
+        self.scan_cancel_btn = QPushButton("Cancel")
+        self.scan_cancel_btn.clicked.connect(self.service.cancel_scan)
+        scan_layout.addWidget(self.scan_cancel_btn)
+        self.scan_row.setVisible(self.service.is_scanning())
+        panel_layout.addWidget(self.scan_row)
+        
+        # List: a model over the service playlist, only visible rows are materialised
+        self.model = PlaylistModel(self.service, self)
+        self.list_view = PlaylistView()
+        self.list_view.setModel(self.model)
+        self.list_view.setDragDropMode(QAbstractItemView.InternalMove)
+        self.list_view.setDefaultDropAction(Qt.MoveAction)
+        self.list_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.list_view.setStyleSheet("background-color: transparent; border: none; color: white;")
+        self.list_view.doubleClicked.connect(self.on_item_double_clicked)
+        
+        panel_layout.addWidget(self.list_view)
 
     def setup_connections(self):
-        self.service.playlist_updated.connect(self.refresh_playlist)
         self.service.loop_mode_changed.connect(self.update_loop_ui)
         self.service.shuffle_mode_changed.connect(self.update_shuffle_ui)
+        self.service.gapless_mode_changed.connect(self.update_gapless_ui)
+        self.update_gapless_ui(self.service.gapless)
+        self.service.scan_progress.connect(self.update_scan_progress)
+        self.service.scan_finished.connect(self.on_scan_finished)
+        self.service.playlist_duration_changed.connect(self.update_duration_label)
+        self.update_duration_label(*self.service.playlist_duration())
         # self.transparent_area.mousePressEvent = self.on_transparent_click # Handled by event filter
 
     # Removed event filter for transparent click
 
     def add_files(self):
-        file_paths, _ = QFileDialog.getOpenFileNames(self, "Add to Playlist", "", "Video Files (*.mp4 *.mkv *.avi *.mov *.wmv)")
+        file_paths, _ = QFileDialog.getOpenFileNames(self, "Add to Playlist", "", "Video Files (*.mp4 *.mkv *.avi *.mov *.wmv);;Playlists (*.m3u *.m3u8 *.pls)")
         if file_paths:
             self.service.add_files(file_paths)
 
+    def add_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Add Folder to Playlist")
+        if folder:
+            self.service.add_folders([folder])
+            self.scan_label.setText("Scanning...")
+            self.scan_row.setVisible(True)
+
+    def save_playlist(self):
+        if not self.service.playlist:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Playlist", "playlist.m3u8",
+                                              "M3U8 Playlist (*.m3u8);;M3U Playlist (*.m3u);;PLS Playlist (*.pls)")
+        if path:
+            try:
+                self.service.save_playlist_file(path)
+            except OSError as e:
+                print(f"Error saving playlist: {e}")
+
+    def update_scan_progress(self, folders, files):
+        self.scan_row.setVisible(True)
+        self.scan_label.setText(f"Scanning... {files} files in {folders} folders")
+
+    def update_duration_label(self, total, unknown):
+        if not total:
+            self.duration_lbl.setText("")
+            return
+        # "+" while some entries haven't been probed yet
+        self.duration_lbl.setText(format_time(total) + ("+" if unknown else ""))
+
+    def on_scan_finished(self, files, cancelled):
+        self.scan_row.setVisible(False)
+
     def toggle_shuffle(self):
         self.service.toggle_shuffle()
 
@@ -169,40 +456,12 @@ class PlaylistPanel(QWidget):
         self.shuffle_btn.setChecked(is_shuffled)
         self.shuffle_btn.setText("Shuffle: On" if is_shuffled else "Shuffle")
 
-    def refresh_playlist(self):
-        self.list_widget.blockSignals(True)
-        self.list_widget.clear()
-        for idx, video in enumerate(self.service.playlist):
-            item = QListWidgetItem(f"{idx + 1}. {video.title}")
-            item.setData(Qt.UserRole, video)
-            if idx == self.service.current_index:
-                # Highlight playing
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                item.setForeground(Qt.green)
-            self.list_widget.addItem(item)
-        self.list_widget.blockSignals(False)
-            
-    def on_item_double_clicked(self, item):
-        # We find the index based on the row in the list
-        idx = self.list_widget.row(item)
-        self.service.play_at_index(idx)
-
-    def on_rows_moved(self, parent, start, end, destination, row):
-        new_list = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            video = item.data(Qt.UserRole)
-            new_list.append(video)
-        
-        # Block signal to avoid recursion/refresh while we just rebuilt it
-        self.service.playlist_updated.disconnect(self.refresh_playlist)
-        self.service.update_playlist(new_list)
-        self.service.playlist_updated.connect(self.refresh_playlist)
-        
-        # Manually trigger refresh to update indices in titles
-        self.refresh_playlist()
+    def update_gapless_ui(self, enabled):
+        self.gapless_btn.setEnabled(self.service.gapless_supported())
+        self.gapless_btn.setChecked(enabled)
+
+    def on_item_double_clicked(self, index):
+        self.service.play_at_index(index.row())
 
 class PlayerScreen(QWidget):
     # ... (signals)
@@ -448,14 +707,6 @@ class PlayerScreen(QWidget):
     # --- UI Logic ---
 
     def update_time_label(self, position, duration):
-        def format_time(ms):
-            seconds = (ms // 1000) % 60
-            minutes = (ms // 60000) % 60
-            hours = (ms // 3600000)
-            if hours > 0:
-                return f"{hours:02}:{minutes:02}:{seconds:02}"
-            return f"{minutes:02}:{seconds:02}"
-            
         self.time_label.setText(f"{format_time(position)} / {format_time(duration)}")
 
     def toggle_play(self):
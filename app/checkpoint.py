@@ -0,0 +1,87 @@
+import time
+from typing import Callable, Optional
+
+DEFAULT_INTERVAL_MS = 15000
+DEFAULT_JUMP_THRESHOLD_MS = 5000
+
+class ProgressCheckpointer:
+    """Decides when the current playback position is worth persisting.
+
+    Fed with every position update. A checkpoint becomes due after
+    `interval_ms` of actual playback or when the position jumps by more than
+    `jump_threshold_ms` (seek). Due checkpoints are coalesced so the save
+    callback runs at most once per interval, and a position equal to the last
+    saved one is never written again.
+    """
+
+    def __init__(self, save: Callable[[str, int], None],
+                 interval_ms: int = DEFAULT_INTERVAL_MS,
+                 jump_threshold_ms: int = DEFAULT_JUMP_THRESHOLD_MS,
+                 clock: Callable[[], float] = time.monotonic):
+        self._save = save
+        self.interval_ms = interval_ms
+        self.jump_threshold_ms = jump_threshold_ms
+        self._clock = clock
+
+        self.writes = 0
+        self.skipped = 0
+
+        self._key: Optional[str] = None
+        self._last_saved = 0
+        self._last_seen = 0
+        self._played_ms = 0
+        self._jumped = False
+        self._coalesced = False
+        self._last_write_time = 0.0
+
+    def reset(self, key: Optional[str], position: int = 0):
+        """Start tracking a new item whose stored position is `position`."""
+        self._key = key
+        self._last_saved = position
+        self._last_seen = position
+        self._played_ms = 0
+        self._jumped = False
+        self._coalesced = False
+        self._last_write_time = self._clock()
+
+    def on_position(self, position: int):
+        if self._key is None:
+            return
+        delta = position - self._last_seen
+        self._last_seen = position
+        if 0 < delta <= self.jump_threshold_ms:
+            self._played_ms += delta
+        elif abs(delta) > self.jump_threshold_ms:
+            self._jumped = True
+
+        if self._played_ms < self.interval_ms and not self._jumped:
+            return
+        # Coalesce: never more than one write per interval of wall time
+        if (self._clock() - self._last_write_time) * 1000 < self.interval_ms:
+            # Counted once per due checkpoint, not per position update
+            if not self._coalesced:
+                self._coalesced = True
+                self.skipped += 1
+            return
+        self.checkpoint(position)
+
+    def checkpoint(self, position: int) -> bool:
+        """Persist `position` now unless it is unchanged. Returns True if written."""
+        if self._key is None:
+            return False
+        self._last_seen = position
+        self._played_ms = 0
+        self._jumped = False
+        self._coalesced = False
+        if position == self._last_saved:
+            self.skipped += 1
+            return False
+        self._save(self._key, position)
+        self._last_saved = position
+        self._last_write_time = self._clock()
+        self.writes += 1
+        return True
+
+    def stats(self) -> dict:
+        """writes: saves done; skipped: due checkpoints dropped as unchanged or coalesced."""
+        return {"writes": self.writes, "skipped": self.skipped}
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+SAMPLE_SIZE = 64 * 1024
+FINGERPRINT_PREFIX = "fp:"
+
+def compute_fingerprint(path: str, sample_size: int = SAMPLE_SIZE) -> str:
+    """Content fingerprint from the file size plus head, middle and tail samples.
+
+    Reads at most 3 * sample_size bytes, so it stays in the low milliseconds
+    even for multi-GB files, and is the same for a file regardless of where it
+    is mounted or what it is called.
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(size.to_bytes(8, 'little'))
+    with open(path, 'rb') as f:
+        if size <= sample_size * 3:
+            digest.update(f.read())
+        else:
+            for offset in (0, (size - sample_size) // 2, size - sample_size):
+                f.seek(offset)
+                digest.update(f.read(sample_size))
+    return f"{FINGERPRINT_PREFIX}{size:x}:{digest.hexdigest()}"
+
+class FileIdentity:
+    """Resolves a path to a stable progress key, caching fingerprints by
+    (path, mtime, size) so unchanged files are never re-hashed.
+
+    With a `cache_path` the fingerprints are kept across runs, as JSON lines
+    of [path, mtime_ns, size, fingerprint] appended as they are computed, so
+    peek() knows the files played in earlier sessions too.
+    """
+
+    def __init__(self, max_entries: int = 10000, cache_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.cache_path = cache_path
+        self._cache: OrderedDict = OrderedDict()
+        # path -> most recent fingerprint, for I/O-free bulk lookups
+        self._latest: dict = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_lines = 0 # records in the file, live or not
+        if cache_path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        path, mtime_ns, size, fingerprint = json.loads(line)
+                    except (ValueError, TypeError):
+                        # Torn last line from a crash; the rest is still good
+                        continue
+                    self._file_lines += 1
+                    self._remember((path, mtime_ns, size), fingerprint)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not read file identity cache {self.cache_path}: {e}")
+        if self._file_lines > 2 * len(self._cache) + 1000:
+            self._rewrite()
+
+    def _remember(self, cache_key: tuple, fingerprint: str):
+        # Caller holds the lock (or is __init__)
+        path = cache_key[0]
+        self._cache.pop(cache_key, None)
+        self._cache[cache_key] = fingerprint
+        self._latest.pop(path, None)
+        self._latest[path] = fingerprint
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        if len(self._latest) > self.max_entries:
+            self._latest.pop(next(iter(self._latest)))
+
+    def _append(self, cache_key: tuple, fingerprint: str):
+        # Caller holds the lock
+        try:
+            if self._file is None:
+                self._file = open(self.cache_path, "a", encoding="utf-8")
+            self._file.write(json.dumps([*cache_key, fingerprint], ensure_ascii=False) + "\n")
+            self._file.flush()
+            self._file_lines += 1
+        except OSError as e:
+            print(f"Could not write file identity cache {self.cache_path}: {e}")
+            return
+        if self._file_lines > 2 * len(self._cache) + 1000:
+            self._rewrite()
+
+    def _rewrite(self):
+        """Write only the live entries, oldest first. Caller holds the lock."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for cache_key, fingerprint in self._cache.items():
+                    f.write(json.dumps([*cache_key, fingerprint], ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Could not write file identity cache {self.cache_path}: {e}")
+            return
+        self._file_lines = len(self._cache)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def peek(self, path: str):
+        """Last fingerprint computed for `path` without touching the disk, or None.
+
+        May be stale if the file changed since; use key_for() when it matters.
+        """
+        with self._lock:
+            return self._latest.get(path)
+
+    def key_for(self, path: str) -> str:
+        """Fingerprint key for `path`, or the path itself if it can't be read."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return path
+        cache_key = (path, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            fingerprint = self._cache.get(cache_key)
+            if fingerprint is not None:
+                self._cache.move_to_end(cache_key)
+                return fingerprint
+        try:
+            fingerprint = compute_fingerprint(path)
+        except OSError:
+            return path
+        with self._lock:
+            self._remember(cache_key, fingerprint)
+            if self.cache_path:
+                self._append(cache_key, fingerprint)
+        return fingerprint
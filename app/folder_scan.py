@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterable, Iterator, Optional
+from PySide6.QtCore import QObject, Signal
+
+# Used when the "media_extensions" setting isn't set
+DEFAULT_MEDIA_EXTENSIONS = frozenset({
+    ".mp4", ".mkv", ".avi", ".mov", ".wmv", ".webm", ".m4v", ".mpg", ".mpeg",
+    ".ts", ".m2ts", ".flv", ".ogv", ".3gp",
+})
+
+def normalize_extensions(extensions: Iterable[str]) -> frozenset:
+    """Lowercase, dotted extensions: ["MKV", ".mp4"] -> {".mkv", ".mp4"}."""
+    return frozenset(
+        ext.lower() if ext.startswith(".") else "." + ext.lower()
+        for ext in extensions if ext
+    )
+
+def _sort_key(name: str):
+    return name.casefold()
+
+def iter_media_files(root: str, extensions: frozenset,
+                     cancelled: Callable[[], bool] = lambda: False,
+                     on_directory: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+    """Yield media files under `root` in folder order, depth first.
+
+    Uses os.scandir so file types come from the directory listing without an
+    extra stat per entry. Directory symlinks are not followed, which also
+    keeps the walk out of symlink loops.
+    """
+    stack = [root]
+    while stack and not cancelled():
+        directory = stack.pop()
+        if on_directory:
+            on_directory(directory)
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"Skipping folder {directory}: {e}")
+            continue
+
+        subdirs = []
+        files = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                    files.append(entry.path)
+            except OSError:
+                continue
+
+        files.sort(key=_sort_key)
+        for path in files:
+            if cancelled():
+                return
+            yield path
+        # Reversed so the stack pops subfolders in name order
+        subdirs.sort(key=_sort_key, reverse=True)
+        stack.extend(subdirs)
+
+class FolderScan(QObject):
+    """Walks folders on a worker thread and streams the files found in batches.
+
+    Signals are emitted from the worker thread; Qt queues them to the thread
+    the receivers live in, so slots run on the main thread.
+    """
+    files_found = Signal(object) # list of paths; object avoids a QVariantList round trip per batch
+    progress = Signal(int, int) # folders scanned, files found
+    finished = Signal(int, bool) # files found, cancelled
+
+    def __init__(self, roots: list[str], extensions: Iterable[str] = DEFAULT_MEDIA_EXTENSIONS,
+                 batch_size: int = 500, batch_interval: float = 0.25):
+        super().__init__()
+        self.roots = list(roots)
+        self._queued_roots = deque(self.roots)
+        self._accepting = True # False once the worker has run out of roots
+        self._lock = threading.Lock()
+        self.extensions = normalize_extensions(extensions)
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.folders_scanned = 0
+        self.files_found_count = 0
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="FolderScan", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def add_roots(self, roots: list[str]) -> bool:
+        """Queue more folders onto this walk. False if it already finished or
+        was cancelled; the caller then needs a new scan."""
+        with self._lock:
+            if not self._accepting or self._cancel.is_set():
+                return False
+            self.roots.extend(roots)
+            self._queued_roots.extend(roots)
+            return True
+
+    def _next_root(self) -> Optional[str]:
+        with self._lock:
+            if not self._queued_roots or self._cancel.is_set():
+                self._accepting = False
+                return None
+            return self._queued_roots.popleft()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: float = None):
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _on_directory(self, directory: str):
+        self.folders_scanned += 1
+
+    def _run(self):
+        batch = []
+        last_emit = 0.0 # the first file goes out on its own so playback can start
+        try:
+            while True:
+                # Roots may be queued by add_roots() while this runs
+                root = self._next_root()
+                if root is None:
+                    break
+                for path in iter_media_files(root, self.extensions, self._cancel.is_set, self._on_directory):
+                    batch.append(path)
+                    self.files_found_count += 1
+                    now = time.monotonic()
+                    if len(batch) >= self.batch_size or now - last_emit >= self.batch_interval:
+                        self._emit_batch(batch)
+                        batch = []
+                        last_emit = now
+            if batch and not self._cancel.is_set():
+                self._emit_batch(batch)
+        except Exception as e:
+            print(f"Folder scan failed: {e}")
+        finally:
+            with self._lock:
+                self._accepting = False
+            self.progress.emit(self.folders_scanned, self.files_found_count)
+            self.finished.emit(self.files_found_count, self._cancel.is_set())
+
+    def _emit_batch(self, batch: list):
+        self.files_found.emit(batch)
+        self.progress.emit(self.folders_scanned, self.files_found_count)
@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import astuple, fields
+from typing import Iterable, Optional
+from domain.models import MediaInfo
+
+CACHE_VERSION = 1
+_INFO_FIELDS = len(fields(MediaInfo))
+
+def _encode(path: str, mtime_ns: int, size: int, info: MediaInfo) -> str:
+    # Positional, one entry per line: [path, mtime_ns, size, <MediaInfo fields in order>]
+    return json.dumps([path, mtime_ns, size, *astuple(info)], separators=(',', ':'), ensure_ascii=False)
+
+def _decode(record: list) -> tuple:
+    path, mtime_ns, size, *values = record
+    if len(values) != _INFO_FIELDS:
+        raise ValueError("MediaInfo layout changed")
+    info = MediaInfo(*values)
+    info.chapters = [tuple(chapter) for chapter in info.chapters]
+    return path, (mtime_ns, size), info
+
+class MediaInfoCache:
+    """On-disk cache of MediaInfo keyed by (path, mtime, size).
+
+    The file is JSON lines: a version header, then one positional record per
+    entry. New entries are appended as they arrive; the file is rewritten
+    (in LRU order, so recency survives restarts) on close or when it holds
+    more superseded lines than live ones. An entry whose file changed size or
+    mtime is dropped on lookup. Thread-safe.
+    """
+
+    def __init__(self, path: str = "media_cache.jsonl", max_entries: int = 50000):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict() # path -> ((mtime_ns, size), MediaInfo), oldest first
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_lines = 0 # records in the file, live or not
+        self._reordered = False # hits or evictions the file doesn't reflect yet
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "null")
+                if not isinstance(header, dict) or header.get("version") != CACHE_VERSION:
+                    print(f"Media cache {self.path} has an unknown format, starting empty")
+                    self._rewrite()
+                    return
+                for line in f:
+                    try:
+                        path, stat_key, info = _decode(json.loads(line))
+                    except (ValueError, TypeError):
+                        # Torn last line from a crash, or garbage; the rest is still good
+                        continue
+                    self._file_lines += 1
+                    self._entries.pop(path, None)
+                    self._entries[path] = (stat_key, info)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Could not read media cache {self.path}: {e}")
+        self._evict()
+        if self._file_lines > 2 * len(self._entries) + 1000:
+            self._rewrite()
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, MediaInfo]:
+        """Cached MediaInfo for those of `paths` whose file is unchanged.
+
+        Stats each file, so call it off the UI thread for large playlists.
+        """
+        stats = [(path, self._stat_key(path)) for path in paths]
+        found = {}
+        with self._lock:
+            for path, stat_key in stats:
+                entry = self._entries.get(path)
+                if entry is None:
+                    self.misses += 1
+                    continue
+                if entry[0] != stat_key:
+                    # File was replaced or edited (or is gone)
+                    del self._entries[path]
+                    self.invalidations += 1
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(path)
+                self._reordered = True
+                found[path] = entry[1]
+                self.hits += 1
+        return found
+
+    def get(self, path: str) -> Optional[MediaInfo]:
+        return self.get_many([path]).get(path)
+
+    def put_many(self, items: Iterable[tuple[str, MediaInfo]]):
+        """Store (path, MediaInfo) pairs under the files' current mtime and size."""
+        records = []
+        for path, info in items:
+            stat_key = self._stat_key(path)
+            if stat_key is not None and info is not None:
+                records.append((path, stat_key, info))
+        if not records:
+            return
+        with self._lock:
+            lines = []
+            for path, stat_key, info in records:
+                self._entries.pop(path, None)
+                self._entries[path] = (stat_key, info)
+                lines.append(_encode(path, *stat_key, info) + "\n")
+            self._evict()
+            self._append(lines)
+
+    def invalidate(self, path: str):
+        with self._lock:
+            if self._entries.pop(path, None) is not None:
+                self.invalidations += 1
+                self._reordered = True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._rewrite()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            self._reordered = True
+
+    def _append(self, lines: list[str]):
+        try:
+            if self._file is None:
+                new_file = not os.path.exists(self.path)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if new_file:
+                    self._file.write(json.dumps({"version": CACHE_VERSION}) + "\n")
+            self._file.writelines(lines)
+            self._file.flush()
+            self._file_lines += len(lines)
+        except OSError as e:
+            print(f"Could not write media cache {self.path}: {e}")
+            return
+        if self._file_lines > 2 * len(self._entries) + 1000:
+            self._rewrite()
+
+    def _rewrite(self):
+        """Write only the live entries, least recently used first. Caller holds the lock."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": CACHE_VERSION}) + "\n")
+                for path, (stat_key, info) in self._entries.items():
+                    f.write(_encode(path, *stat_key, info) + "\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not write media cache {self.path}: {e}")
+            return
+        self._file_lines = len(self._entries)
+        self._reordered = False
+
+    def close(self):
+        """Persist recency and drop superseded lines, if anything changed."""
+        with self._lock:
+            if self._reordered or self._file_lines != len(self._entries):
+                self._rewrite()
+            elif self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,128 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+from PySide6.QtCore import QObject, Signal
+from domain.ports import MediaProberPort
+from app.media_cache import MediaInfoCache
+
+def _probe_chunk(prober: MediaProberPort, paths: list[str]) -> list:
+    # Runs in a worker process
+    results = []
+    for path in paths:
+        try:
+            info = prober.probe(path)
+        except Exception as e:
+            print(f"Probe failed for {path}: {e}")
+            info = None
+        results.append((path, info))
+    return results
+
+class MediaProbeQueue(QObject):
+    """Runs a MediaProberPort over files on a process pool.
+
+    Paths are sent to the workers in small chunks; each finished chunk is
+    emitted as one `probed` batch. The signal comes from the executor's
+    thread and is queued to the receivers' thread, so the UI never waits.
+
+    With a cache, paths are first looked up there on a helper thread; hits
+    are emitted right away and only the misses reach the prober. The prober
+    may be None to serve from the cache alone.
+    """
+    probed = Signal(object) # list of (path, MediaInfo or None)
+
+    def __init__(self, prober: Optional[MediaProberPort], max_workers: Optional[int] = None, chunk_size: int = 8,
+                 cache: Optional[MediaInfoCache] = None):
+        super().__init__()
+        self.prober = prober
+        self.cache = cache
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self._executor = None
+        self._lookups = None
+        self._generation = 0 # bumped by cancel_pending so running lookups stop forwarding
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def submit(self, paths: list[str]):
+        if not paths:
+            return
+        if self.cache is None:
+            self._submit_probes(paths)
+            return
+        if self._lookups is None:
+            self._lookups = ThreadPoolExecutor(1, thread_name_prefix="MediaCacheLookup")
+        future = self._lookups.submit(self._lookup, paths, self._generation)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_lookup_done)
+
+    def _lookup(self, paths: list[str], generation: int):
+        found = self.cache.get_many(paths)
+        if found:
+            self.probed.emit(list(found.items()))
+        misses = [path for path in paths if path not in found]
+        if misses and generation == self._generation:
+            self._submit_probes(misses)
+
+    def _on_lookup_done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Media cache lookup failed: {future.exception()}")
+
+    def _submit_probes(self, paths: list[str]):
+        if self.prober is None:
+            return
+        if self._executor is None:
+            # spawn: forking a process that runs Qt and other threads isn't safe
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        for i in range(0, len(paths), self.chunk_size):
+            future = self._executor.submit(_probe_chunk, self.prober, paths[i:i + self.chunk_size])
+            with self._lock:
+                self._futures.add(future)
+            future.add_done_callback(self._on_done)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+    def cancel_pending(self):
+        """Drop chunks that haven't started; running ones still report."""
+        self._generation += 1
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self):
+        self._generation += 1
+        if self._lookups is not None:
+            self._lookups.shutdown(wait=True, cancel_futures=True)
+            self._lookups = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self.cache is not None:
+            self.cache.close()
+
+    def _on_done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+        if future.cancelled():
+            return
+        try:
+            results = future.result()
+        except BrokenProcessPool as e:
+            # A worker died; start a fresh pool on the next submit
+            print(f"Media probe pool failed: {e}")
+            self._executor = None
+            return
+        except Exception as e:
+            print(f"Media probe failed: {e}")
+            return
+        if self.cache is not None:
+            self.cache.put_many(results)
+        self.probed.emit(results)
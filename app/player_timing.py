@@ -0,0 +1,261 @@
+import bisect
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, List, Optional
+from domain.ports import VideoPlayerPort
+from domain.models import PlaybackState, MediaStatus
+
+# Bucket upper bounds in ms; the last bucket is everything above
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+# A seek counts as done at the first position within this distance of its
+# target; keyframe seeks can land a little before it. Shorter seeks aren't timed.
+SEEK_TOLERANCE_MS = 2000
+
+LOAD_METRICS = ("load_to_loading", "load_to_loaded", "load_to_first_position", "load_to_playing")
+SEEK_METRIC = "seek_to_position"
+
+class LatencyHistogram:
+    """Fixed log-spaced buckets plus the most recent samples for percentiles."""
+
+    def __init__(self, keep: int = 1000):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.recent = deque(maxlen=keep)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.recent.append(ms)
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    def snapshot(self) -> dict:
+        buckets = {}
+        for i, n in enumerate(self.counts):
+            if n:
+                label = f"<={BUCKET_BOUNDS_MS[i]}" if i < len(BUCKET_BOUNDS_MS) else f">{BUCKET_BOUNDS_MS[-1]}"
+                buckets[label] = n
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": buckets,
+        }
+
+class PlayerTimings:
+    """Load and seek latencies per engine, fed by TimedPlayer.
+
+    For every load(): time to LOADING, to LOADED, to the first position
+    update and to the first PLAYING state. For every seek(): time to the first
+    position update near the target. Callbacks may come from engine threads.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[str, LatencyHistogram]] = {} # engine -> metric -> histogram
+        self._engine = None
+        self._load_started = None
+        self._load_pending: set = set()
+        self._seek_started = None
+        self._seek_target = 0
+        self._last_position = 0
+
+    def _record(self, metric: str, started: float):
+        ms = (self._clock() - started) * 1000
+        metrics = self._histograms.setdefault(self._engine, {})
+        metrics.setdefault(metric, LatencyHistogram()).add(ms)
+
+    def on_load(self, engine: str):
+        with self._lock:
+            self._engine = engine
+            self._load_started = self._clock()
+            self._load_pending = set(LOAD_METRICS)
+            self._seek_started = None
+
+    def _load_event(self, metric: str):
+        # Caller holds the lock
+        if metric in self._load_pending:
+            self._load_pending.discard(metric)
+            self._record(metric, self._load_started)
+
+    def on_status(self, status: MediaStatus):
+        with self._lock:
+            if status == MediaStatus.LOADING:
+                self._load_event("load_to_loading")
+            elif status == MediaStatus.LOADED:
+                self._load_event("load_to_loaded")
+
+    def on_state(self, state: PlaybackState):
+        if state == PlaybackState.PLAYING:
+            with self._lock:
+                self._load_event("load_to_playing")
+
+    def on_seek(self, engine: str, target: int):
+        with self._lock:
+            if abs(target - self._last_position) <= SEEK_TOLERANCE_MS:
+                return
+            self._engine = engine
+            self._seek_started = self._clock()
+            self._seek_target = target
+
+    def on_position(self, position: int):
+        with self._lock:
+            self._last_position = position
+            self._load_event("load_to_first_position")
+            if self._seek_started is not None and abs(position - self._seek_target) <= SEEK_TOLERANCE_MS:
+                self._record(SEEK_METRIC, self._seek_started)
+                self._seek_started = None
+
+    def stats(self) -> dict:
+        """{engine: {metric: histogram snapshot}}"""
+        with self._lock:
+            return {
+                engine: {metric: hist.snapshot() for metric, hist in metrics.items()}
+                for engine, metrics in self._histograms.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def dump(self, write: Callable[[str], None] = print):
+        """Human-readable table of stats(), one line per engine and metric."""
+        stats = self.stats()
+        if not stats:
+            write("Player timings: no samples")
+            return
+        write("Player timings (ms):")
+        for engine, metrics in sorted(stats.items()):
+            for metric in LOAD_METRICS + (SEEK_METRIC,):
+                s = metrics.get(metric)
+                if not s:
+                    continue
+                buckets = " ".join(f"{label}:{n}" for label, n in s["buckets"].items())
+                write(f"  {engine:<10} {metric:<24} n={s['count']:<5} p50={s['p50_ms']:8.1f} "
+                      f"p90={s['p90_ms']:8.1f} p99={s['p99_ms']:8.1f} max={s['max_ms']:8.1f}  [{buckets}]")
+
+class TimedPlayer(VideoPlayerPort):
+    """Wraps any VideoPlayerPort and reports its load/seek timings to a PlayerTimings.
+
+    Timestamps are taken in the engine's callbacks themselves, before any
+    queuing to the UI thread, so every engine is measured the same way.
+    """
+
+    def __init__(self, inner: VideoPlayerPort, timings: PlayerTimings):
+        self.inner = inner
+        self.timings = timings
+        self.engine = type(inner).__name__
+        inner.set_on_position_changed(self._position_changed)
+        inner.set_on_playback_state_changed(self._playback_state_changed)
+        inner.set_on_media_status_changed(self._media_status_changed)
+        self._on_position_changed = None
+        self._on_playback_state_changed = None
+        self._on_media_status_changed = None
+
+    def __getattr__(self, name):
+        # Engine specific extras
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def _position_changed(self, position: int):
+        self.timings.on_position(position)
+        if self._on_position_changed:
+            self._on_position_changed(position)
+
+    def _playback_state_changed(self, state: PlaybackState):
+        self.timings.on_state(state)
+        if self._on_playback_state_changed:
+            self._on_playback_state_changed(state)
+
+    def _media_status_changed(self, status: MediaStatus):
+        self.timings.on_status(status)
+        if self._on_media_status_changed:
+            self._on_media_status_changed(status)
+
+    def load(self, path: str, start_position: int = 0):
+        self.timings.on_load(self.engine)
+        self.inner.load(path, start_position)
+
+    def seek(self, position: int):
+        self.timings.on_seek(self.engine, position)
+        self.inner.seek(position)
+
+    def play(self):
+        self.inner.play()
+
+    def pause(self):
+        self.inner.pause()
+
+    def stop(self):
+        self.inner.stop()
+
+    def get_duration(self) -> int:
+        return self.inner.get_duration()
+
+    def get_position(self) -> int:
+        return self.inner.get_position()
+
+    def set_subtitle_track(self, index: int):
+        self.inner.set_subtitle_track(index)
+
+    def set_audio_track(self, index: int):
+        self.inner.set_audio_track(index)
+
+    def get_subtitle_tracks(self) -> List[str]:
+        return self.inner.get_subtitle_tracks()
+
+    def get_audio_tracks(self) -> List[str]:
+        return self.inner.get_audio_tracks()
+
+    def create_video_widget(self, parent: Any = None) -> Any:
+        return self.inner.create_video_widget(parent)
+
+    def set_video_output(self, widget: Any):
+        self.inner.set_video_output(widget)
+
+    def preload(self, path: str):
+        self.inner.preload(path)
+
+    def cancel_preload(self):
+        self.inner.cancel_preload()
+
+    def supports_gapless(self) -> bool:
+        return self.inner.supports_gapless()
+
+    def set_gapless(self, enabled: bool):
+        self.inner.set_gapless(enabled)
+
+    def queue_next(self, path: Optional[str]):
+        self.inner.queue_next(path)
+
+    def set_on_track_advanced(self, callback):
+        self.inner.set_on_track_advanced(callback)
+
+    def set_on_position_changed(self, callback):
+        self._on_position_changed = callback
+
+    def set_on_duration_changed(self, callback):
+        self.inner.set_on_duration_changed(callback)
+
+    def set_on_playback_state_changed(self, callback):
+        self._on_playback_state_changed = callback
+
+    def set_on_media_status_changed(self, callback):
+        self._on_media_status_changed = callback
+
+    def set_on_error(self, callback):
+        self.inner.set_on_error(callback)
@@ -0,0 +1,289 @@
+import random
+from typing import Iterable, Iterator, Optional
+from domain.models import Video
+
+class _ShuffledOrder:
+    """Shuffled play order over the playlist's own entry list, drawn lazily.
+
+    Rows are produced on demand with a seeded Fisher–Yates over the first
+    `len(entries)` slots of `entries`; swaps are kept in a sparse dict, so
+    starting a shuffle is O(1) and playing through it costs O(1) per track.
+    The list is shared, not copied: the owner only appends to it and leaves
+    removed entries in their slot while the pool is in use. Entries added
+    while shuffled are queued after the pool, entries removed before being
+    drawn are skipped when the draw reaches them.
+    """
+
+    def __init__(self, entries: list[Video], seed: Optional[int], first: Optional[int] = None):
+        self._pool = entries
+        self._size = len(entries) # slots of the pool to draw from
+        self._swaps: dict[int, int] = {}
+        self._drawn = 0
+        self._rng = random.Random(seed)
+        self._dead: set[int] = set() # entry_ids removed before being drawn
+        self.order: list[Video] = [] # rows drawn so far
+        self.positions: dict[int, int] = {} # entry_id -> row in order
+        self.tail: list[Video] = [] # added while shuffled, after the pool
+        self._tail_ids: set[int] = set()
+        if first is not None:
+            self._draw(first)
+
+    def __len__(self) -> int:
+        return len(self.order) + self._size - self._drawn - len(self._dead) + len(self.tail)
+
+    def _draw(self, r: Optional[int] = None) -> bool:
+        """Move one more entry from the pool to the end of order. False when none are left."""
+        pool = self._pool
+        swaps = self._swaps
+        while self._drawn < self._size:
+            k = self._drawn
+            if r is None:
+                r = self._rng.randrange(k, self._size)
+            picked = swaps.get(r, r)
+            swaps[r] = swaps.pop(k, k)
+            self._drawn += 1
+            video = pool[picked]
+            if video.entry_id in self._dead:
+                self._dead.discard(video.entry_id)
+                r = None
+                continue
+            self.positions[video.entry_id] = len(self.order)
+            self.order.append(video)
+            return True
+        if self._size:
+            # Pool exhausted: let go of the entry list and queue what was added meanwhile
+            self._pool = []
+            self._size = 0
+            self._swaps = {}
+            self._drawn = 0
+        if self.tail:
+            tail, self.tail = self.tail, []
+            self._tail_ids.clear()
+            start = len(self.order)
+            self.order.extend(tail)
+            self.reindex(start, len(self.order))
+            return True
+        return False
+
+    def materialize(self, row: int):
+        """Draw until `row` exists (or everything is drawn)."""
+        while len(self.order) <= row and self._draw():
+            pass
+
+    def materialize_all(self):
+        while self._draw():
+            pass
+
+    def reindex(self, start: int, stop: int):
+        order = self.order
+        positions = self.positions
+        for i in range(start, stop):
+            positions[order[i].entry_id] = i
+
+    def find(self, video: Video) -> int:
+        entry_id = video.entry_id
+        if entry_id in self._tail_ids:
+            self.materialize_all()
+        while entry_id not in self.positions and self._draw():
+            pass
+        return self.positions.get(entry_id, -1)
+
+    def append(self, videos: list[Video]):
+        if self._drawn < self._size or self.tail:
+            self.tail.extend(videos)
+            self._tail_ids.update(video.entry_id for video in videos)
+        else:
+            start = len(self.order)
+            self.order.extend(videos)
+            self.reindex(start, len(self.order))
+
+    def discard(self, video: Video):
+        """Forget an entry wherever it is: drawn, queued or still in the pool."""
+        entry_id = video.entry_id
+        if entry_id in self.positions:
+            row = self.positions.pop(entry_id)
+            del self.order[row]
+            self.reindex(row, len(self.order))
+        elif entry_id in self._tail_ids:
+            self._tail_ids.discard(entry_id)
+            self.tail.remove(video)
+        else:
+            self._dead.add(entry_id)
+
+class Playlist:
+    """Ordered playlist entries with an entry_id -> position index.
+
+    Entries are identified by Video.entry_id, so the same file added twice is
+    two distinct entries. The index is updated incrementally: a move only
+    touches the rows between its two ends and an append only the new rows.
+
+    Rows are in canonical order, or in a shuffled order drawn lazily over the
+    canonical one while shuffle is on; both stay consistent through
+    add/remove/move.
+    """
+
+    def __init__(self, videos: Iterable[Video] = ()):
+        self._items: list[Video] = []
+        self._positions: dict[int, int] = {}
+        self._shuffle: Optional[_ShuffledOrder] = None
+        # While shuffled, removed entries stay in _items (the shuffle draws
+        # over it by slot) and are only counted here until _compact()
+        self._holes = 0
+        self.extend(videos)
+
+    def __len__(self) -> int:
+        if self._shuffle is not None:
+            return len(self._shuffle)
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._positions)
+
+    def __iter__(self) -> Iterator[Video]:
+        if self._shuffle is not None:
+            self._shuffle.materialize_all()
+            return iter(self._shuffle.order)
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> Video:
+        if self._shuffle is None:
+            return self._items[index]
+        if index < 0:
+            index += len(self)
+        if index < 0:
+            raise IndexError("playlist index out of range")
+        self._shuffle.materialize(index)
+        return self._shuffle.order[index]
+
+    def __contains__(self, video) -> bool:
+        return isinstance(video, Video) and video.entry_id in self._positions
+
+    @property
+    def is_shuffled(self) -> bool:
+        return self._shuffle is not None
+
+    def shuffle(self, seed: Optional[int] = None, first: Optional[Video] = None):
+        """Switch to a shuffled order; the same seed over the same playlist gives the same order.
+
+        `first`, typically the playing video, is put at row 0.
+        """
+        self._compact()
+        first_row = self._positions.get(first.entry_id) if first is not None else None
+        self._shuffle = _ShuffledOrder(self._items, seed, first_row)
+
+    def unshuffle(self):
+        self._shuffle = None
+        self._compact()
+
+    def _compact(self):
+        # Drop the slots of entries removed while shuffled; costs what the
+        # removals would have cost unshuffled
+        if self._holes:
+            positions = self._positions
+            self._items = [video for video in self._items if video.entry_id in positions]
+            self._holes = 0
+            self._reindex(0, len(self._items))
+
+    def position_of(self, video: Video, draw: bool = True) -> int:
+        """Row of `video`, or -1 if it isn't in the playlist. O(1) except for
+        shuffled entries that haven't been drawn yet; with draw=False those
+        give -1 instead of drawing up to them."""
+        if video is None or video.entry_id not in self._positions:
+            return -1
+        if self._shuffle is not None:
+            if not draw:
+                return self._shuffle.positions.get(video.entry_id, -1)
+            return self._shuffle.find(video)
+        return self._positions[video.entry_id]
+
+    def to_list(self) -> list[Video]:
+        return list(self)
+
+    def _reindex(self, start: int, stop: int):
+        items = self._items
+        positions = self._positions
+        for i in range(start, stop):
+            positions[items[i].entry_id] = i
+
+    def extend(self, videos: Iterable[Video]):
+        videos = list(videos)
+        start = len(self._items)
+        self._items.extend(videos)
+        self._reindex(start, len(self._items))
+        if self._shuffle is not None:
+            self._shuffle.append(videos)
+
+    def insert(self, index: int, video: Video):
+        index = max(0, min(index, len(self)))
+        if self._shuffle is None:
+            self._items.insert(index, video)
+            self._reindex(index, len(self._items))
+            return
+        # Shuffled: the row is placed in the shuffled order, canonically it's added at the end
+        self._items.append(video)
+        self._positions[video.entry_id] = len(self._items) - 1
+        self._shuffle.materialize(index - 1)
+        self._shuffle.order.insert(index, video)
+        self._shuffle.reindex(index, len(self._shuffle.order))
+
+    def pop(self, index: int) -> Video:
+        video = self[index]
+        self._remove_canonical(video)
+        if self._shuffle is not None:
+            self._shuffle.discard(video)
+        return video
+
+    def _remove_canonical(self, video: Video):
+        row = self._positions.pop(video.entry_id)
+        if self._shuffle is not None:
+            # The shuffle may still draw over _items by slot; leave a hole
+            self._holes += 1
+            return
+        del self._items[row]
+        self._reindex(row, len(self._items))
+
+    def remove(self, video: Video) -> int:
+        """Remove `video` by identity. Returns its former row, or -1."""
+        index = self.position_of(video)
+        if index >= 0:
+            self.pop(index)
+        return index
+
+    def move(self, from_index: int, to_index: int):
+        """Move a row; while shuffled only the shuffled order changes."""
+        if self._shuffle is None:
+            items, reindex = self._items, self._reindex
+        else:
+            self._shuffle.materialize(max(from_index, to_index))
+            items, reindex = self._shuffle.order, self._shuffle.reindex
+        video = items.pop(from_index)
+        items.insert(to_index, video)
+        reindex(min(from_index, to_index), max(from_index, to_index) + 1)
+
+    def reset(self, videos: Iterable[Video]):
+        """Replace the rows with `videos`. While shuffled this sets the shuffled
+        order; the canonical order keeps its entries that are still present and
+        appends the new ones."""
+        videos = list(videos)
+        if self._shuffle is None:
+            self._items = videos
+            self._positions = {}
+            self._reindex(0, len(self._items))
+            return
+        keep = {video.entry_id for video in videos}
+        positions = self._positions
+        canonical = [video for video in self._items if video.entry_id in keep and video.entry_id in positions]
+        canonical.extend(video for video in videos if video.entry_id not in positions)
+        self._items = canonical
+        self._holes = 0
+        self._positions = {}
+        self._reindex(0, len(self._items))
+        self._shuffle = _ShuffledOrder([], None)
+        self._shuffle.append(videos)
+
+    def clear(self):
+        self._items.clear()
+        self._positions.clear()
+        self._holes = 0
+        if self._shuffle is not None:
+            self._shuffle = _ShuffledOrder([], None)
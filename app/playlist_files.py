@@ -0,0 +1,120 @@
+import os
+import re
+from typing import Iterable, Iterator, Optional
+from urllib.parse import unquote, urlparse
+from domain.models import Video
+
+PLAYLIST_EXTENSIONS = (".m3u", ".m3u8", ".pls")
+
+_PLS_ENTRY = re.compile(r"^(file|title|length)(\d+)$", re.IGNORECASE)
+
+def is_playlist_file(path: str) -> bool:
+    return path.lower().endswith(PLAYLIST_EXTENSIONS)
+
+def _resolve(entry: str, base_dir: str) -> str:
+    """Absolute local path for a playlist entry; other URLs are kept as they are."""
+    if entry.lower().startswith("file:"):
+        parsed = urlparse(entry)
+        path = unquote(parsed.path)
+        if os.name == "nt" and re.match(r"^/[A-Za-z]:", path):
+            path = path[1:]
+        return os.path.normpath(path)
+    if re.match(r"^[A-Za-z][A-Za-z0-9+.-]+://", entry):
+        return entry
+    if os.sep != "\\" and "\\" in entry and not re.match(r"^[A-Za-z]:\\", entry):
+        # Playlist written on Windows with relative paths
+        entry = entry.replace("\\", "/")
+    return os.path.normpath(os.path.join(base_dir, entry))
+
+def iter_playlist_file(path: str) -> Iterator[tuple[str, str]]:
+    """Yield (path, title) for each entry of an M3U/M3U8/PLS file, one line at a time.
+
+    Relative entries are resolved against the playlist's folder. The title is
+    "" when the file doesn't carry one (#EXTINF for M3U, TitleN for PLS).
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        first = f.readline()
+        if first.strip().lower() == "[playlist]" or path.lower().endswith(".pls"):
+            yield from _iter_pls(f, first, base_dir)
+        else:
+            yield from _iter_m3u(f, first, base_dir)
+
+def _iter_m3u(lines: Iterable[str], first: str, base_dir: str) -> Iterator[tuple[str, str]]:
+    title = ""
+    for line in _chain(first, lines):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            if line[:8].upper() == "#EXTINF:":
+                # #EXTINF:<seconds>[ attributes],<title>
+                _, _, title = line.partition(",")
+                title = title.strip()
+            continue
+        yield _resolve(line, base_dir), title
+        title = ""
+
+def _iter_pls(lines: Iterable[str], first: str, base_dir: str) -> Iterator[tuple[str, str]]:
+    # Entries are numbered and normally grouped (File1, Title1, Length1, File2...);
+    # an entry is emitted once the next number shows up so only one is held at a time
+    pending: dict[int, list] = {}
+    current: Optional[int] = None
+    for line in _chain(first, lines):
+        key, sep, value = line.strip().partition("=")
+        match = _PLS_ENTRY.match(key.strip()) if sep else None
+        if not match:
+            continue
+        field, number = match.group(1).lower(), int(match.group(2))
+        if number != current:
+            if current is not None and pending.get(current, [None])[0]:
+                entry = pending.pop(current)
+                yield _resolve(entry[0], base_dir), entry[1]
+            current = number
+        entry = pending.setdefault(number, [None, ""])
+        if field == "file":
+            entry[0] = value.strip()
+        elif field == "title":
+            entry[1] = value.strip()
+    # Whatever is left, including out-of-order entries, in number order
+    for number in sorted(pending):
+        file_path, title = pending[number]
+        if file_path:
+            yield _resolve(file_path, base_dir), title
+
+def _chain(first: str, rest: Iterable[str]) -> Iterator[str]:
+    yield first
+    yield from rest
+
+def _entry_path(video_path: str, base_dir: str) -> str:
+    # Relative to the playlist where possible so the folder can be moved as a whole
+    if "://" in video_path:
+        return video_path
+    try:
+        rel = os.path.relpath(video_path, base_dir)
+    except ValueError:
+        # Different drive on Windows
+        return video_path
+    return video_path if rel.startswith(os.pardir) else rel
+
+def write_playlist_file(path: str, videos: Iterable[Video]):
+    """Write `videos` as M3U8 (or PLS for a .pls path), atomically."""
+    base_dir = os.path.dirname(os.path.abspath(path))
+    tmp_path = path + ".tmp"
+    pls = path.lower().endswith(".pls")
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        if pls:
+            f.write("[playlist]\n")
+        else:
+            f.write("#EXTM3U\n")
+        for video in videos:
+            count += 1
+            entry = _entry_path(video.path, base_dir)
+            if pls:
+                f.write(f"File{count}={entry}\nTitle{count}={video.title}\nLength{count}=-1\n")
+            else:
+                f.write(f"#EXTINF:-1,{video.title}\n{entry}\n")
+        if pls:
+            f.write(f"NumberOfEntries={count}\nVersion=2\n")
+    os.replace(tmp_path, path)
@@ -0,0 +1,114 @@
+import os
+import statistics
+import threading
+import time
+from typing import Callable, Optional
+
+DEFAULT_WINDOW_MS = 15000
+DEFAULT_HEAD_BYTES = 16 * 1024 * 1024
+_READ_CHUNK = 1024 * 1024
+
+def warm_file_head(path: str, nbytes: int = DEFAULT_HEAD_BYTES):
+    """Pull the first `nbytes` of a file into the OS page cache.
+
+    Uses posix_fadvise(WILLNEED) where available, which lets the kernel read
+    ahead without copying; elsewhere the bytes are read and thrown away.
+    """
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, nbytes, os.POSIX_FADV_WILLNEED)
+                return
+            remaining = nbytes
+            while remaining > 0:
+                chunk = f.read(min(_READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+    except OSError:
+        # Streams, vanished files: nothing to warm
+        pass
+
+def warm_file_head_async(path: str, nbytes: int = DEFAULT_HEAD_BYTES) -> threading.Thread:
+    thread = threading.Thread(target=warm_file_head, args=(path, nbytes), name="WarmFileHead", daemon=True)
+    thread.start()
+    return thread
+
+class NextItemPrefetcher:
+    """Decides when to warm up the next playlist entry.
+
+    Fed with position and duration updates like ProgressCheckpointer. Once
+    playback is within `window_ms` of the end, `prefetch()` is called one
+    time for the current item.
+    """
+
+    def __init__(self, prefetch: Callable[[], None], window_ms: int = DEFAULT_WINDOW_MS):
+        self._prefetch = prefetch
+        self.window_ms = window_ms
+        self._duration = 0
+        self._done = True
+
+    def reset(self, duration: Optional[int] = None):
+        """Start tracking a new item; `duration` if already known (e.g. probed)."""
+        self._duration = duration or 0
+        self._done = False
+
+    def disable(self):
+        self._done = True
+
+    def on_duration(self, duration: int):
+        if duration > 0:
+            self._duration = duration
+
+    def on_position(self, position: int):
+        if self._done or self._duration <= 0:
+            return
+        if self._duration - position <= self.window_ms:
+            self._done = True
+            self._prefetch()
+
+class SwitchTimer:
+    """Measures auto-advance latency: from the end of one item to the first
+    position update of the next, split by whether the next one was prefetched."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, keep: int = 200):
+        self._clock = clock
+        self.keep = keep
+        self._started: Optional[float] = None
+        self._prefetched = False
+        self.samples = {True: [], False: []} # prefetched -> latencies in ms
+
+    def start(self, prefetched: bool):
+        self._started = self._clock()
+        self._prefetched = prefetched
+
+    def cancel(self):
+        self._started = None
+
+    def on_position(self, position: int):
+        if self._started is None:
+            return
+        latency = (self._clock() - self._started) * 1000
+        self._started = None
+        samples = self.samples[self._prefetched]
+        samples.append(latency)
+        if len(samples) > self.keep:
+            del samples[0]
+
+    @staticmethod
+    def _summary(samples: list) -> dict:
+        if not samples:
+            return {"count": 0}
+        ordered = sorted(samples)
+        return {
+            "count": len(ordered),
+            "p50_ms": statistics.median(ordered),
+            "p90_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+            "max_ms": ordered[-1],
+        }
+
+    def stats(self) -> dict:
+        return {
+            "prefetched": self._summary(self.samples[True]),
+            "cold": self._summary(self.samples[False]),
+        }
@@ -1,9 +1,24 @@
-from PySide6.QtCore import QObject, Signal
-from domain.ports import VideoPlayerPort, PersistencePort
-from domain.models import Video, PlaybackState, MediaStatus
+from PySide6.QtCore import QObject, Signal, QTimer
+from domain.ports import VideoPlayerPort, PersistencePort, MediaProberPort, WATCHED_POSITION
+from domain.models import Video, PlaybackState, MediaStatus, LoopMode
 from typing import Any
+from collections import deque
+from itertools import islice
 import random
-from domain.models import Video, PlaybackState, MediaStatus, LoopMode
+from app.checkpoint import ProgressCheckpointer
+from app.prefetch import NextItemPrefetcher, SwitchTimer, warm_file_head_async
+from app.player_timing import PlayerTimings, TimedPlayer
+from app.file_identity import FileIdentity
+from app.playlist import Playlist
+from app.folder_scan import FolderScan, DEFAULT_MEDIA_EXTENSIONS, normalize_extensions
+from app.playlist_files import is_playlist_file, iter_playlist_file, write_playlist_file
+from app.media_probe import MediaProbeQueue
+from app.media_cache import MediaInfoCache
+
+# Positions this close to the end count as watched and drop the resume point
+FINISHED_MARGIN_MS = 5000
+# Playlist file entries appended per event loop turn
+PLAYLIST_IMPORT_CHUNK = 2000
 
 class VideoService(QObject):
     # Signals
@@ -13,30 +28,91 @@ class VideoService(QObject):
     duration_changed = Signal(int)
     error_occurred = Signal(str)
     playlist_updated = Signal() # Emitted when playlist content or order changes
+    # Fine-grained playlist changes, emitted before playlist_updated so views can update only affected rows
+    playlist_rows_inserted = Signal(int, int) # first, last
+    playlist_rows_removed = Signal(int, int) # first, last
+    playlist_rows_moved = Signal(int, int, int) # first, last, new row of first
+    playlist_reset = Signal() # Whole order replaced (clear, shuffle, update_playlist)
+    current_index_changed = Signal(int, int) # previous, current
     loop_mode_changed = Signal(object) # LoopMode
     shuffle_mode_changed = Signal(bool)
     playback_finished = Signal() # Emitted when the entire playlist/session ends
+    scan_progress = Signal(int, int) # folders scanned, files found
+    scan_finished = Signal(int, bool) # files found, cancelled
+    media_info_changed = Signal(object) # list of Videos whose MediaInfo arrived
+    playlist_duration_changed = Signal(int, int) # total ms of known durations, entries without one
+    gapless_mode_changed = Signal(bool)
 
     # Internal signal to bridge non-Qt threads (VLC) to Main Thread
     _internal_status_signal = Signal(object)
+    _internal_track_signal = Signal(object)
 
-    def __init__(self, player: VideoPlayerPort, persistence: PersistencePort):
+    def __init__(self, player: VideoPlayerPort, persistence: PersistencePort, prober: MediaProberPort = None,
+                 media_cache: MediaInfoCache = None, identity: FileIdentity = None):
         super().__init__()
-        self.player = player
+        # Load/seek latencies of whichever engine is in use, see get_timing_stats()
+        self.timings = PlayerTimings()
+        self.player = TimedPlayer(player, self.timings)
         self.persistence = persistence
         self.current_video = None
         
+        # Progress is keyed by content fingerprint so renamed/moved files keep their resume point.
+        # A persistent identity lets playlists resolve resume points in bulk after a restart.
+        self.identity = identity or FileIdentity()
+        self._current_key = None
+        
         # Playlist State
-        self.playlist: list[Video] = []
-        self.original_playlist: list[Video] = [] # For shuffle
+        self.playlist = Playlist()
         self.current_index = -1
         self.loop_mode = LoopMode.NO_LOOP
         self.is_shuffled = False
+        self.shuffle_seed = None # seed of the current shuffle, to reproduce its order
+        
+        # Background folder import
+        self._scan = None
+        self._play_first_found = False
+        # Playlist files being expanded, a chunk per event loop turn
+        self._imports = deque()
+        self._import_scheduled = False
+        
+        # Metadata probing in worker processes, results fill Video.info.
+        # Known files come from the cache without probing.
+        self.probes = MediaProbeQueue(prober, cache=media_cache) if prober or media_cache else None
+        if self.probes:
+            self.probes.probed.connect(self._on_probed)
+        self._awaiting_info: dict[str, list[Video]] = {}
+        self._total_duration = 0
+        self._timed_entries = 0
+        
+        # Periodic progress saves during playback (survives crashes/kills)
+        self.checkpointer = ProgressCheckpointer(self._persist_position)
+        self.position_changed.connect(self.checkpointer.on_position)
+        
+        # Near the end of an item, warm up the next one so auto-advance doesn't show a gap
+        self.prefetcher = NextItemPrefetcher(self._prefetch_next)
+        self.position_changed.connect(self.prefetcher.on_position)
+        self.duration_changed.connect(self.prefetcher.on_duration)
+        self._prefetched_path = None # next item preloaded for the current one
+        self.playlist_updated.connect(self._refresh_prefetch)
+        self.current_index_changed.connect(self._refresh_prefetch)
+        self.loop_mode_changed.connect(self._refresh_prefetch)
+        self.switch_timer = SwitchTimer()
+        self.position_changed.connect(self.switch_timer.on_position)
+        
+        # Gapless: the engine continues with the queued next item by itself and
+        # reports it; the service follows instead of loading on MediaStatus.End
+        self.gapless = False
+        self._queued_path = None
+        self.playlist_updated.connect(self._sync_gapless_queue)
+        self.current_index_changed.connect(self._sync_gapless_queue)
+        self.loop_mode_changed.connect(self._sync_gapless_queue)
         
         # Connect internal signal to handler on Main Thread
         self._internal_status_signal.connect(self._on_media_status_changed)
+        self._internal_track_signal.connect(self._on_track_advanced)
         
         self._bind_player_callbacks()
+        self._apply_gapless(self.persistence.load_setting("gapless", False))
 
     def _bind_player_callbacks(self):
         self.player.set_on_position_changed(self.position_changed.emit)
@@ -48,6 +124,7 @@ class VideoService(QObject):
         self.player.set_on_media_status_changed(self._internal_status_signal.emit)
         
         self.player.set_on_error(self.error_occurred.emit)
+        self.player.set_on_track_advanced(self._internal_track_signal.emit)
 
     def _on_media_status_changed(self, status):
         # Forward the signal first
@@ -55,15 +132,6 @@ class VideoService(QObject):
         
         if status == MediaStatus.End:
              self._on_video_ended()
-        elif status == MediaStatus.LOADED:
-            if hasattr(self, '_pending_initial_seek') and self._pending_initial_seek > 0:
-                 from PySide6.QtCore import QTimer
-                 QTimer.singleShot(250, self._execute_initial_seek)
-
-    def _execute_initial_seek(self):
-        if hasattr(self, '_pending_initial_seek') and self._pending_initial_seek > 0:
-             self.player.seek(self._pending_initial_seek)
-             self._pending_initial_seek = 0
 
     def open_video(self, path: str):
         # Legacy support or single file open
@@ -72,45 +140,293 @@ class VideoService(QObject):
     def play_files(self, paths: list[str]):
         """Replaces current playlist with new files and plays the first one."""
         self.cleanup_playlist()
+        self._play_first_found = True
         self.add_files(paths)
-        if self.playlist:
+        self._play_first_if_pending()
+
+    def _play_first_if_pending(self):
+        # Folder scans and playlist imports fill the playlist later, play as soon as there is something
+        if self._play_first_found and self.current_index < 0 and self.playlist:
+            self._play_first_found = False
             self.play_at_index(0)
 
+    def media_extensions(self) -> frozenset:
+        """Extensions picked up by folder imports, configurable via the "media_extensions" setting."""
+        return normalize_extensions(self.persistence.load_setting("media_extensions", DEFAULT_MEDIA_EXTENSIONS))
+
+    def play_folders(self, folders: list[str]):
+        """Replaces the playlist with the media under `folders`, playing the first file as soon as it's found."""
+        self.cleanup_playlist()
+        self._start_scan(folders, play_first=True)
+
+    def add_folders(self, folders: list[str]):
+        """Appends the media under `folders` to the playlist as the scan finds it."""
+        self._start_scan(folders, play_first=False)
+
+    def is_scanning(self) -> bool:
+        return self._scan is not None
+
+    def cancel_scan(self):
+        scan = self._scan
+        if scan is None:
+            return
+        self._scan = None # batches still in flight are ignored
+        scan.cancel()
+        self.scan_finished.emit(scan.files_found_count, True)
+
+    def _start_scan(self, folders: list[str], play_first: bool):
+        if not folders:
+            return
+        if self._scan is not None and not play_first:
+            if self._scan.add_roots(folders):
+                # Walked after the folders already queued, under the same progress row
+                return
+            # Its walk just ended on its own; the batches still on the way are
+            # added, the new scan takes over the progress row
+            self._scan = None
+        self.cancel_scan()
+        scan = FolderScan(folders, self.media_extensions())
+        self._scan = scan
+        if play_first:
+            self._play_first_found = True
+        # Emitted from the scan thread, queued to the main thread
+        scan.files_found.connect(lambda paths: self._on_scan_files(scan, paths))
+        scan.progress.connect(lambda folders_done, found: self._on_scan_progress(scan, folders_done, found))
+        scan.finished.connect(lambda found, cancelled: self._on_scan_finished(scan, found, cancelled))
+        scan.start()
+
+    def _on_scan_files(self, scan: FolderScan, paths: list[str]):
+        if scan.is_cancelled():
+            return
+        self.add_files(paths)
+        self._play_first_if_pending()
+
+    def _on_scan_progress(self, scan: FolderScan, folders_done: int, found: int):
+        if scan is self._scan:
+            self.scan_progress.emit(folders_done, found)
+
+    def _on_scan_finished(self, scan: FolderScan, found: int, cancelled: bool):
+        if scan is not self._scan:
+            return
+        self._scan = None
+        self.scan_finished.emit(found, cancelled)
+
     def add_files(self, paths: list[str]):
-        """Appends files to the playlist."""
-        new_videos = [Video(path) for path in paths]
+        """Appends files to the playlist. Playlist files (.m3u/.m3u8/.pls) are expanded in chunks."""
+        media = []
+        for path in paths:
+            if is_playlist_file(path):
+                self._queue_playlist_import(path)
+            else:
+                media.append(path)
+        self._append_videos([Video(path) for path in media])
+
+    def save_playlist_file(self, path: str):
+        """Exports the playlist in its current order as M3U8, or PLS for a .pls path."""
+        write_playlist_file(path, self.playlist)
+
+    def _queue_playlist_import(self, path: str):
+        self._imports.append(iter_playlist_file(path))
+        if not self._import_scheduled:
+            self._import_scheduled = True
+            QTimer.singleShot(0, self._import_next_chunk)
+
+    def _import_next_chunk(self):
+        self._import_scheduled = False
+        if not self._imports:
+            return
+        entries = self._imports[0]
+        try:
+            chunk = list(islice(entries, PLAYLIST_IMPORT_CHUNK))
+        except OSError as e:
+            print(f"Error reading playlist: {e}")
+            self.error_occurred.emit(f"Could not read playlist: {e}")
+            chunk = []
+        if len(chunk) < PLAYLIST_IMPORT_CHUNK:
+            self._imports.popleft()
+        if chunk:
+            self._append_videos([Video(path, title) for path, title in chunk])
+            self._play_first_if_pending()
+        if self._imports:
+            self._import_scheduled = True
+            QTimer.singleShot(0, self._import_next_chunk)
+
+    def _cancel_imports(self):
+        while self._imports:
+            self._imports.popleft().close()
+
+    def _append_videos(self, new_videos: list[Video]):
+        if not new_videos:
+            return
+        self._attach_resume_positions(new_videos)
+        first = len(self.playlist)
+        # While shuffled, new entries are queued after the shuffled ones
         self.playlist.extend(new_videos)
         
-        if self.is_shuffled:
-            # If shuffled, also add to original in correct place? 
-            # Or just append to original and shuffle newly added? Only full reshuffle for now.
-            self.original_playlist.extend(new_videos)
-            # We don't auto-reshuffle here to avoid disturbing current order too much, 
-            # just append to end of current shuffle view.
-        else:
-            self.original_playlist.extend(new_videos)
-            
+        self.playlist_rows_inserted.emit(first, len(self.playlist) - 1)
         self.playlist_updated.emit()
+        self._request_info(new_videos)
+        self._emit_playlist_duration()
+
+    def _request_info(self, videos: list[Video]):
+        if self.probes is None:
+            return
+        paths = []
+        for video in videos:
+            waiting = self._awaiting_info.get(video.path)
+            if waiting is None:
+                self._awaiting_info[video.path] = [video]
+                paths.append(video.path)
+            else:
+                waiting.append(video)
+        self.probes.submit(paths)
+
+    def _on_probed(self, results: list):
+        updated = []
+        for path, info in results:
+            for video in self._awaiting_info.pop(path, ()):
+                # Entries removed meanwhile are skipped
+                if info is None or video not in self.playlist:
+                    continue
+                video.info = info
+                updated.append(video)
+                if info.duration:
+                    self._total_duration += info.duration
+                    self._timed_entries += 1
+        if updated:
+            self.media_info_changed.emit(updated)
+            self._emit_playlist_duration()
+
+    def playlist_duration(self) -> tuple[int, int]:
+        """(total ms of entries with a known duration, number of entries without one)"""
+        return self._total_duration, len(self.playlist) - self._timed_entries
+
+    def _emit_playlist_duration(self):
+        self.playlist_duration_changed.emit(*self.playlist_duration())
+
+    def _recount_duration(self):
+        durations = [video.duration for video in self.playlist if video.duration]
+        self._total_duration = sum(durations)
+        self._timed_entries = len(durations)
+        self._emit_playlist_duration()
+
+    def _attach_resume_positions(self, videos: list[Video]):
+        """Fill Video.resume_position for a batch with a single persistence lookup."""
+        # Only fingerprints already known are used, adding files must not hash them
+        fingerprints = {video.path: self.identity.peek(video.path) for video in videos}
+        keys = set(fingerprints)
+        keys.update(fp for fp in fingerprints.values() if fp)
+        found = self.persistence.load_progress_many(list(keys))
+        for video in videos:
+            fingerprint = fingerprints[video.path]
+            if fingerprint and fingerprint in found:
+                self._set_stored_position(video, found[fingerprint])
+            elif video.path in found:
+                self._set_stored_position(video, found[video.path])
+            elif fingerprint:
+                self._set_stored_position(video, 0)
+            # else: stays unknown, resolved when played
+
+    @staticmethod
+    def _set_stored_position(video: Video, position: int):
+        video.watched = position == WATCHED_POSITION
+        video.resume_position = max(position, 0)
 
     def play_at_index(self, index: int):
         if 0 <= index < len(self.playlist):
-            self.current_index = index
             video = self.playlist[index]
             self._load_and_play(video)
-            self.playlist_updated.emit() # update UI for active item
+            # current_index_changed updates the active row and queues the item after
+            # this one; the explicit sync covers replaying the same index
+            self._set_current_index(index)
+            self._sync_gapless_queue()
 
     def _load_and_play(self, video: Video):
         self.current_video = video
-        self.player.load(video.path)
+        self._current_key = self.identity.key_for(video.path)
+        if video.resume_position is None:
+            self._set_stored_position(video, self._stored_position(video.path, self._current_key))
+        saved_position = video.resume_position
         
-        saved_position = self.persistence.load_progress(video.path)
-        if saved_position > 0:
-            self._pending_initial_seek = saved_position
-        else:
-            self._pending_initial_seek = 0
+        if self._prefetched_path not in (None, video.path):
+            # Jumped elsewhere: the preloaded item isn't coming
+            self._cancel_prefetch()
+        # The engine opens the file at the resume point, no seek after loading
+        self.player.load(video.path, saved_position)
+        self._prefetched_path = None
+        # load() replaces the engine's queue; play_at_index queues the next one once the index is set
+        self._queued_path = None
+        self.checkpointer.reset(self._current_key, saved_position)
+        self.prefetcher.reset(video.duration)
             
         self.player.play()
 
+    def load_progress(self, path: str, key: str = None) -> int:
+        """Resume point for `path`: 0 if never started or watched to the end."""
+        return max(self._stored_position(path, key), 0)
+
+    def _stored_position(self, path: str, key: str = None) -> int:
+        # Position as persisted, WATCHED_POSITION included
+        key = key or self.identity.key_for(path)
+        position = self.persistence.load_progress(key)
+        if position == 0 and key != path:
+            # Entries saved before fingerprinting are keyed by path: move them over
+            position = self.persistence.load_progress(path)
+            if position != 0:
+                self.persistence.save_progress(key, position)
+                self.persistence.delete_progress(path)
+        return position
+
+    def _delete_progress(self, key: str, path: str):
+        self.persistence.delete_progress(key)
+        if key != path:
+            # A path-keyed entry from before fingerprinting may not be migrated yet
+            self.persistence.delete_progress(path)
+
+    def _mark_watched(self, key: str, path: str):
+        self.persistence.save_progress(key, WATCHED_POSITION)
+        if key != path:
+            self.persistence.delete_progress(path)
+
+    def _finish_current(self):
+        # The current item played to its end: nothing to resume, but keep it as watched
+        if self.current_video:
+            self._mark_watched(self._current_key, self.current_video.path)
+            self.current_video.resume_position = 0
+            self.current_video.watched = True
+
+    def _forget_current_progress(self):
+        # Progress reset: as if never played
+        if self.current_video:
+            self._delete_progress(self._current_key, self.current_video.path)
+            self.current_video.resume_position = 0
+            self.current_video.watched = False
+
+    def save_progress(self, path: str, position: int):
+        self.persistence.save_progress(self.identity.key_for(path), position)
+
+    def _persist_position(self, key: str, position: int):
+        duration = self.player.get_duration()
+        video = self.current_video
+        path = video.path if video else key
+        watched = video is not None and video.watched
+        if duration > 0 and position >= duration - FINISHED_MARGIN_MS:
+            # Finished: nothing to resume
+            self._mark_watched(key, path)
+            position = 0
+            watched = True
+        elif position <= 0:
+            # Never started: nothing to resume, an earlier watched marker stays
+            if not watched:
+                self._delete_progress(key, path)
+            position = 0
+        else:
+            self.persistence.save_progress(key, position)
+            watched = False
+        if video:
+            video.resume_position = position
+            video.watched = watched
+
     def _on_video_ended(self):
         # Handle Loop One
         if self.loop_mode == LoopMode.LOOP_ONE:
@@ -118,7 +434,11 @@ class VideoService(QObject):
             self.player.play()
             return
 
-        # Auto-advance
+        # Auto-advance; the last checkpoint may be up to an interval before the end
+        self._finish_current()
+        next_video = self._next_video()
+        if next_video is not None:
+            self.switch_timer.start(prefetched=next_video.path == self._prefetched_path)
         if self.cur_has_next():
             self.play_next()
         elif self.loop_mode == LoopMode.LOOP_ALL:
@@ -128,6 +448,111 @@ class VideoService(QObject):
             self.close_video(reset_progress=True)
             self.playback_finished.emit()
 
+    def _next_video(self):
+        """What auto-advance will play after the current item, or None."""
+        if self.loop_mode == LoopMode.LOOP_ONE:
+            return None
+        if self.cur_has_next():
+            return self.playlist[self.current_index + 1]
+        if self.loop_mode == LoopMode.LOOP_ALL and self.playlist:
+            return self.playlist[0]
+        return None
+
+    def _prefetch_next(self):
+        video = self._next_video()
+        if video is None or video is self.current_video:
+            return
+        if self.gapless and video.path == self._queued_path:
+            # The engine already has it queued
+            return
+        self._prefetched_path = video.path
+        # Page cache first (a thread, the engine is about to read the same bytes), then the engine
+        if "://" not in video.path:
+            warm_file_head_async(video.path)
+        self.player.preload(video.path)
+
+    def _cancel_prefetch(self):
+        self._prefetched_path = None
+        if not self.gapless:
+            # In gapless mode the engine's queue is kept in sync instead
+            self.player.cancel_preload()
+
+    def _refresh_prefetch(self, *args):
+        """The playlist, index or loop mode changed: if the item prefetched is
+        no longer the next one, drop it and prefetch the new next item."""
+        if self._prefetched_path is None:
+            return
+        video = self._next_video()
+        if video is not None and video.path == self._prefetched_path:
+            return
+        self._cancel_prefetch()
+        self._prefetch_next()
+
+    def gapless_supported(self) -> bool:
+        return self.player.supports_gapless()
+
+    def set_gapless(self, enabled: bool):
+        """Turns gapless playlist playback on or off (where the engine supports it) and saves it."""
+        self.persistence.save_setting("gapless", bool(enabled))
+        self._apply_gapless(enabled)
+
+    def _apply_gapless(self, enabled: bool):
+        self.gapless = bool(enabled and self.player.supports_gapless())
+        self.player.set_gapless(self.gapless)
+        self._queued_path = None
+        self._sync_gapless_queue()
+        self.gapless_mode_changed.emit(self.gapless)
+
+    def _sync_gapless_queue(self, *args):
+        """Keeps the engine's queued next item equal to what auto-advance would play."""
+        if not self.gapless or self.current_video is None:
+            return
+        video = self._next_video()
+        path = video.path if video is not None else None
+        if path != self._queued_path:
+            self._queued_path = path
+            self.player.queue_next(path)
+
+    def _on_track_advanced(self, path: str):
+        # The engine moved on to the queued item without a load()
+        self._queued_path = None
+        video = self._next_video()
+        if video is None or video.path != path:
+            # The playlist changed before the engine picked up the new queue
+            print(f"Gapless advance to {path} doesn't match the playlist, reloading")
+            if video is None:
+                self.close_video(reset_progress=True)
+                self.playback_finished.emit()
+            else:
+                self.play_at_index(self.playlist.position_of(video))
+            return
+        
+        self._finish_current()
+        
+        index = self.current_index + 1 if self.cur_has_next() else 0
+        self.current_video = video
+        self._current_key = self.identity.key_for(video.path)
+        # Starts from the beginning: seeking to a resume point would bring the gap back
+        video.resume_position = 0
+        self._prefetched_path = None
+        self.checkpointer.reset(self._current_key, 0)
+        self.prefetcher.reset(video.duration)
+        # Moves the active row and queues the item after this one (a one-item
+        # LOOP_ALL playlist keeps its index, hence the explicit sync)
+        self._set_current_index(index)
+        self._sync_gapless_queue()
+
+    def get_timing_stats(self) -> dict:
+        """Load and seek latency histograms per engine, see PlayerTimings."""
+        return self.timings.stats()
+
+    def dump_timings(self):
+        self.timings.dump()
+
+    def get_switch_stats(self) -> dict:
+        """Auto-advance latency (end of item -> first position of the next), with and without prefetch."""
+        return self.switch_timer.stats()
+
     def cur_has_next(self):
         return self.current_index + 1 < len(self.playlist)
 
@@ -144,98 +569,107 @@ class VideoService(QObject):
              self.play_at_index(len(self.playlist) - 1)
 
     def cleanup_playlist(self):
+        self.cancel_scan()
+        self._cancel_imports()
+        self._play_first_found = False
+        if self.probes:
+            self.probes.cancel_pending()
+        self._awaiting_info.clear()
         self.playlist.clear()
-        self.original_playlist.clear()
-        self.current_index = -1
+        self._total_duration = 0
+        self._timed_entries = 0
+        self._emit_playlist_duration()
+        self.playlist_reset.emit()
+        self._set_current_index(-1)
         self.playlist_updated.emit()
 
+    def shutdown(self):
+        """Stops background work (folder scans, playlist imports, probes) before exit."""
+        self.cancel_scan()
+        self._cancel_imports()
+        if self.probes:
+            self.probes.shutdown()
+        self.identity.close()
+        if self.persistence.load_setting("log_player_timings", False):
+            self.timings.dump()
+
+    def _set_current_index(self, index: int):
+        previous = self.current_index
+        self.current_index = index
+        if previous != index:
+            self.current_index_changed.emit(previous, index)
+
     def set_loop_mode(self, mode: LoopMode):
         self.loop_mode = mode
         self.loop_mode_changed.emit(mode)
 
-    def toggle_shuffle(self):
+    def toggle_shuffle(self, seed: int = None):
+        """Turns shuffle on or off. The same seed over the same playlist gives the same order."""
         self.is_shuffled = not self.is_shuffled
+        current_video = self.playlist[self.current_index] if 0 <= self.current_index < len(self.playlist) else None
         
         if self.is_shuffled:
-            # Save current playing video to keep it playing
-            current_video = self.playlist[self.current_index] if 0 <= self.current_index < len(self.playlist) else None
-            
-            # Shuffle
-            # self.original_playlist is already up to date if we maintained it
-            # But wait, self.playlist is currently authoritative. 
-            # Ensure original is synced if we modified playlist (reorder)
-            if not self.original_playlist:
-                 self.original_playlist = list(self.playlist)
-
-            random.shuffle(self.playlist)
-            
-            # If playing, move current video to top or find its new index
-            if current_video:
-                new_index = self.playlist.index(current_video)
-                self.current_index = new_index
+            # The playing video stays first, the rest is drawn lazily as it's reached
+            self.shuffle_seed = seed if seed is not None else random.getrandbits(32)
+            self.playlist.shuffle(self.shuffle_seed, first=current_video)
         else:
-            # Restore order
-            # We need to find where the current video is in the original list
-            current_video = self.playlist[self.current_index] if 0 <= self.current_index < len(self.playlist) else None
-            
-            if self.original_playlist:
-                self.playlist = list(self.original_playlist)
-            
-            if current_video and current_video in self.playlist:
-                self.current_index = self.playlist.index(current_video)
-            else:
-                self.current_index = 0 # Fallback
+            # Back to the canonical order, which add/remove kept up to date
+            self.playlist.unshuffle()
+        
+        self.playlist_reset.emit()
+        if current_video:
+            self._set_current_index(self.playlist.position_of(current_video))
+        elif self.playlist:
+            self._set_current_index(0) # Fallback
                 
         self.shuffle_mode_changed.emit(self.is_shuffled)
         self.playlist_updated.emit()
 
     def update_playlist(self, new_playlist: list[Video]):
-        self.playlist = new_playlist
-        if not self.is_shuffled:
-            self.original_playlist = list(self.playlist)
+        self.playlist.reset(new_playlist)
         
-        if self.current_video and self.current_video in self.playlist:
-             self.current_index = self.playlist.index(self.current_video)
-        else:
-             self.current_index = -1
+        self.playlist_reset.emit()
+        self._recount_duration()
+        # -1 if the current video is no longer in the playlist
+        self._set_current_index(self.playlist.position_of(self.current_video))
              
         self.playlist_updated.emit()
 
     def reorder_playlist(self, from_index: int, to_index: int):
-        if 0 <= from_index < len(self.playlist) and 0 <= to_index < len(self.playlist):
-            item = self.playlist.pop(from_index)
-            self.playlist.insert(to_index, item)
-            
-            # If we moved the playing video, update current_index
-            if self.current_index == from_index:
-                self.current_index = to_index
-            elif from_index < self.current_index <= to_index:
-                self.current_index -= 1
-            elif to_index <= self.current_index < from_index:
-                self.current_index += 1
-            
-            # If not shuffled, update original too
-            if not self.is_shuffled:
-                 item_orig = self.original_playlist.pop(from_index)
-                 self.original_playlist.insert(to_index, item_orig)
+        if from_index == to_index or not (0 <= from_index < len(self.playlist) and 0 <= to_index < len(self.playlist)):
+            # Nothing moves; views reject a no-op move
+            return
+        # While shuffled only the shuffled order changes
+        self.playlist.move(from_index, to_index)
+        self.playlist_rows_moved.emit(from_index, from_index, to_index)
+        
+        # If we moved the playing video, update current_index
+        if self.current_index == from_index:
+            self._set_current_index(to_index)
+        elif from_index < self.current_index <= to_index:
+            self._set_current_index(self.current_index - 1)
+        elif to_index <= self.current_index < from_index:
+            self._set_current_index(self.current_index + 1)
 
-            self.playlist_updated.emit()
+        self.playlist_updated.emit()
 
     def remove_from_playlist(self, index: int):
          if 0 <= index < len(self.playlist):
              # removing currently playing?
-             was_playing = (index == self.current_index)
-             
              removed = self.playlist.pop(index)
-             if not self.is_shuffled:
-                 self.original_playlist.remove(removed)
+             self.playlist_rows_removed.emit(index, index)
+             if removed.duration:
+                 self._total_duration -= removed.duration
+                 self._timed_entries -= 1
+             self._emit_playlist_duration()
                  
              if index < self.current_index:
-                 self.current_index -= 1
+                 self._set_current_index(self.current_index - 1)
              elif index == self.current_index:
                  # If we removed the playing one, play next?
-                 if self.cur_has_next():
-                     self.play_at_index(self.current_index) # Index is now next item
+                 self._set_current_index(-1) # a different entry takes the row
+                 if index < len(self.playlist):
+                     self.play_at_index(index) # Index is now next item
                  elif self.playlist:
                       self.play_at_index(len(self.playlist)-1)
                  else:
@@ -247,7 +681,11 @@ class VideoService(QObject):
         # We can use the last known position from player
         if self.current_video:
             pos = self.player.get_position()
-            self.persistence.save_progress(self.current_video.path, pos)
+            self.checkpointer.checkpoint(pos)
+
+    def get_checkpoint_stats(self) -> dict:
+        """Number of progress writes made and skipped (unchanged position)."""
+        return self.checkpointer.stats()
 
     def play(self):
         self.player.play()
@@ -264,11 +702,16 @@ class VideoService(QObject):
         """Stops the video, saves progress, and releases the current video context."""
         if self.current_video:
             if reset_progress:
-                self.persistence.save_progress(self.current_video.path, 0)
+                self._forget_current_progress()
             else:
                 self._save_current_progress()
             self.player.stop()
             self.current_video = None
+            self.checkpointer.reset(None)
+            self.prefetcher.disable()
+            self.switch_timer.cancel()
+            if self._prefetched_path is not None:
+                self._cancel_prefetch()
 
     def swap_player(self, new_player: VideoPlayerPort):
         """Swap the player adapter at runtime."""
@@ -277,12 +720,17 @@ class VideoService(QObject):
             self._save_current_progress()
             self.player.stop()
             self.current_video = None
+            self.checkpointer.reset(None)
+            self.prefetcher.disable()
+            self.switch_timer.cancel()
             
         # Replace player
-        self.player = new_player
+        self.player = TimedPlayer(new_player, self.timings)
+        self._prefetched_path = None
         
         # Re-bind callbacks
         self._bind_player_callbacks()
+        self._apply_gapless(self.persistence.load_setting("gapless", False))
 
     def seek(self, position: int):
         self.player.seek(position)
@@ -0,0 +1,76 @@
+"""Compare persistence codecs: save/load time and file size of a progress map.
+
+    python benchmarks/bench_codecs.py [--sizes 1000 10000 100000] [--json out.json]
+"""
+import sys
+import os
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.codecs import CODECS
+from adapters.persistence.json_store import JsonStore
+
+def make_progress(entries: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    now = int(time.time())
+    return {
+        f"fp:{rng.getrandbits(36):x}:{rng.getrandbits(128):032x}": [rng.randrange(1, 7_200_000), now - rng.randrange(0, 86400 * 365)]
+        for _ in range(entries)
+    }
+
+def bench(codec_name: str, data: dict, tmp_dir: str, repeat: int) -> dict:
+    path = os.path.join(tmp_dir, f"progress.{codec_name}")
+    store = JsonStore(path, codec=codec_name)
+    save_times = []
+    load_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        store.write(data)
+        save_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        loaded = store.load()
+        load_times.append(time.perf_counter() - start)
+    assert loaded == data, f"{codec_name} did not round-trip"
+    return {
+        "codec": codec_name,
+        "entries": len(data),
+        "save_ms": min(save_times) * 1000,
+        "load_ms": min(load_times) * 1000,
+        "bytes": os.path.getsize(path),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--codecs", nargs="+", default=sorted(CODECS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    results = []
+    try:
+        for size in args.sizes:
+            data = make_progress(size)
+            for codec_name in args.codecs:
+                result = bench(codec_name, data, tmp_dir, args.repeat)
+                results.append(result)
+                print(f"{size:>8} {codec_name:<12} save {result['save_ms']:9.2f} ms"
+                      f"  load {result['load_ms']:9.2f} ms  {result['bytes']:>11,} bytes")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
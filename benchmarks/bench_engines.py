@@ -0,0 +1,344 @@
+"""Cross-engine playback benchmarks: QtPlayer, MpvPlayer and VlcPlayer on the same clips.
+
+Test media is generated locally (raw Y4M video, PCM WAV audio), so no network
+or sample files are needed. Each engine runs headless in its own subprocess
+so libraries don't interfere and CPU/RSS are per engine. Measured per clip:
+open latency (load -> LOADED / PLAYING / first position), seek latency, CPU
+time and RSS during playback, and stop() latency over repeated load/stop
+cycles. Results are saved as JSON together with the engine versions.
+
+    python benchmarks/bench_engines.py [--engines qt mpv vlc] [--cycles 100] [--json bench_engines.json]
+"""
+import sys
+import os
+import argparse
+import json
+import math
+import platform
+import random
+import shutil
+import statistics
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+ENGINES = ("qt", "mpv", "vlc")
+
+# --- Synthetic media ---
+
+def write_y4m(path: str, width: int = 320, height: int = 240, fps: int = 25, seconds: float = 10):
+    """Raw YUV 4:2:0 video with a moving gradient, readable by every engine's demuxer."""
+    frames = int(fps * seconds)
+    base = bytes(x & 0xFF for x in range(width + 256))
+    chroma = bytes([128]) * (width // 2 * height // 2)
+    with open(path, "wb") as f:
+        f.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C420jpeg\n".encode("ascii"))
+        for i in range(frames):
+            shift = (i * 4) % 256
+            row = base[shift:shift + width]
+            f.write(b"FRAME\n")
+            f.write(row * height)
+            f.write(chroma)
+            f.write(chroma)
+
+def write_wav(path: str, seconds: float = 10, rate: int = 48000, freq: float = 440.0):
+    """16-bit stereo sine tone."""
+    period = int(rate / freq) * 4
+    cycle = b"".join(
+        struct.pack("<hh", v, v)
+        for v in (int(12000 * math.sin(2 * math.pi * freq * n / rate)) for n in range(period))
+    )
+    total = int(rate * seconds)
+    with wave.open(path, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        written = 0
+        while written < total:
+            n = min(period, total - written)
+            w.writeframes(cycle[:n * 4])
+            written += n
+
+def make_media(media_dir: str, seconds: float, size: str, fps: int) -> dict:
+    width, height = (int(v) for v in size.lower().split("x"))
+    clips = {
+        "video_y4m": os.path.join(media_dir, f"clip_{width}x{height}_{fps}fps_{seconds:g}s.y4m"),
+        "audio_wav": os.path.join(media_dir, f"clip_{seconds:g}s.wav"),
+    }
+    if not os.path.exists(clips["video_y4m"]):
+        write_y4m(clips["video_y4m"], width, height, fps, seconds)
+    if not os.path.exists(clips["audio_wav"]):
+        write_wav(clips["audio_wav"], seconds)
+    return clips
+
+# --- Process measurements ---
+
+def _rss_bytes():
+    """Current resident set size, where the OS reports it."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _summary(samples: list) -> dict:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": statistics.median(ordered),
+        "p90_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        "max_ms": ordered[-1],
+    }
+
+# --- Engine side (runs in the child process) ---
+
+def _create_engine(name: str):
+    """Engine adapter configured to run without a window or sound device."""
+    if name == "mpv":
+        from adapters.player.mpv_player import MpvPlayer
+        player = MpvPlayer()
+        player.mpv['vo'] = 'null'
+        player.mpv['ao'] = 'null'
+        version = player.mpv.mpv_version
+    elif name == "vlc":
+        from adapters.player.vlc_player import VlcPlayer
+        player = VlcPlayer()
+        # Same adapter, on an instance with dummy outputs
+        player.instance = player.vlc.Instance("--no-video-title-show", "--quiet", "--vout=dummy", "--aout=dummy")
+        player.player = player.instance.media_player_new()
+        player.event_manager = player.player.event_manager()
+        player._bind_events()
+        version = player.vlc.libvlc_get_version().decode()
+    else:
+        from PySide6 import __version__ as pyside_version
+        from adapters.player.qt_player import QtPlayer
+        player = QtPlayer()
+        widget = player.create_video_widget()
+        widget.resize(320, 240)
+        widget.show()
+        player.set_video_output(widget)
+        player._bench_widget = widget
+        version = f"PySide6 {pyside_version}"
+    return player, version
+
+class _Probe:
+    """Engine callbacks turned into events the benchmark can wait on."""
+
+    def __init__(self, player):
+        from domain.models import PlaybackState
+        self.PlaybackState = PlaybackState
+        self.position = 0
+        self.state = None
+        self.moved = threading.Event()
+        self.stopped = threading.Event()
+        player.set_on_position_changed(self._on_position)
+        player.set_on_playback_state_changed(self._on_state)
+        player.set_on_duration_changed(lambda d: None)
+        player.set_on_error(lambda e: None)
+
+    def _on_position(self, position: int):
+        self.position = position
+        self.moved.set()
+
+    def _on_state(self, state):
+        self.state = state
+        if state == self.PlaybackState.STOPPED:
+            self.stopped.set()
+
+def _wait(app, event: threading.Event, timeout: float = 5.0) -> bool:
+    # Qt delivers its signals through the event loop, mpv/VLC from their own threads
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        if event.wait(0.001):
+            return True
+    return False
+
+def _open(app, player, probe, path: str) -> bool:
+    probe.moved.clear()
+    player.load(path)
+    player.play()
+    return _wait(app, probe.moved)
+
+def _stop(app, player, probe) -> float:
+    probe.stopped.clear()
+    start = time.perf_counter()
+    player.stop()
+    _wait(app, probe.stopped, 2.0)
+    return (time.perf_counter() - start) * 1000
+
+def run_engine(name: str, clips: dict, args) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from app.player_timing import PlayerTimings, TimedPlayer, LOAD_METRICS, SEEK_METRIC, SEEK_TOLERANCE_MS
+    app = QApplication.instance() or QApplication([])
+    rng = random.Random(args.seed)
+
+    engine, version = _create_engine(name)
+    timings = PlayerTimings()
+    player = TimedPlayer(engine, timings)
+    probe = _Probe(player)
+    result = {"engine": name, "version": version, "clips": {}}
+
+    for clip, path in clips.items():
+        timings.reset()
+        failures = 0
+
+        # Open latency, from a stopped player each time
+        for _ in range(args.opens):
+            if not _open(app, player, probe, path):
+                failures += 1
+            _stop(app, player, probe)
+        stats = timings.stats().get(type(engine).__name__, {})
+        open_stats = {metric: stats.get(metric) for metric in LOAD_METRICS}
+
+        # Seeks within the clip while it plays; only jumps the timing layer counts as seeks
+        _open(app, player, probe, path)
+        duration = player.get_duration() or int(args.seconds * 1000)
+        for _ in range(args.seeks):
+            target = rng.randrange(duration // 10, duration * 9 // 10)
+            for _ in range(20):
+                if abs(target - probe.position) > SEEK_TOLERANCE_MS:
+                    break
+                target = rng.randrange(duration // 10, duration * 9 // 10)
+            probe.moved.clear()
+            player.seek(target)
+            _wait(app, probe.moved, 2.0)
+            time.sleep(0.05)
+        seek_stats = timings.stats().get(type(engine).__name__, {}).get(SEEK_METRIC)
+
+        # CPU and memory over a stretch of plain playback
+        player.seek(0)
+        rss = []
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        while time.perf_counter() - wall_start < args.play_seconds:
+            app.processEvents()
+            time.sleep(0.1)
+            sample = _rss_bytes()
+            if sample is not None:
+                rss.append(sample)
+        wall = time.perf_counter() - wall_start
+        playback = {
+            "cpu_percent": (time.process_time() - cpu_start) / wall * 100,
+            "rss_mb_mean": statistics.mean(rss) / 2 ** 20 if rss else None,
+            "rss_mb_peak": max(rss) / 2 ** 20 if rss else None,
+        }
+        _stop(app, player, probe)
+
+        # Teardown over repeated load/stop cycles
+        teardown = []
+        rss_before = _rss_bytes()
+        for _ in range(args.cycles):
+            if not _open(app, player, probe, path):
+                failures += 1
+            teardown.append(_stop(app, player, probe))
+        rss_after = _rss_bytes()
+
+        result["clips"][clip] = {
+            "open": open_stats,
+            "seek": seek_stats,
+            "playback": playback,
+            "teardown": _summary(teardown),
+            # Growth over the cycles, a leak shows up here
+            "rss_mb_growth": (rss_after - rss_before) / 2 ** 20 if rss_before and rss_after else None,
+            "failures": failures,
+        }
+    return result
+
+# --- Driver ---
+
+def _run_child(name: str, clips: dict, args) -> dict:
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", name,
+           "--clips", json.dumps(clips),
+           "--opens", str(args.opens), "--seeks", str(args.seeks), "--cycles", str(args.cycles),
+           "--play-seconds", str(args.play_seconds), "--seconds", str(args.seconds), "--seed", str(args.seed)]
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        return {"engine": name, "error": f"timed out after {args.timeout} s"}
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        error = (proc.stderr.strip().splitlines() or [f"exit code {proc.returncode}"])[-1]
+        return {"engine": name, "error": error}
+    # Adapters print their own messages, the result is the last line
+    result = json.loads(lines[-1])
+    result["wall_s"] = time.perf_counter() - start
+    return result
+
+def _print_result(result: dict):
+    if "error" in result:
+        print(f"\n{result['engine']}: unavailable ({result['error']})")
+        return
+    print(f"\n{result['engine']} ({result['version']})")
+    for clip, r in result["clips"].items():
+        open_ms = (r["open"].get("load_to_first_position") or {}).get("p50_ms")
+        seek_ms = (r["seek"] or {}).get("p50_ms")
+        fmt = lambda v: "   n/a" if v is None else f"{v:6.1f}"
+        print(f"  {clip:<10} open p50 {fmt(open_ms)} ms  seek p50 {fmt(seek_ms)} ms"
+              f"  cpu {r['playback']['cpu_percent']:5.1f}%  rss peak {fmt(r['playback']['rss_mb_peak'])} MB"
+              f"  stop p50 {fmt(r['teardown'].get('p50_ms'))} ms  failures {r['failures']}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    parser.add_argument("--seconds", type=float, default=10, help="Length of the generated clips")
+    parser.add_argument("--size", default="320x240", help="Video frame size, WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=int, default=25)
+    parser.add_argument("--media-dir", help="Keep generated media here (default: a temporary folder)")
+    parser.add_argument("--opens", type=int, default=10, help="Timed opens per clip")
+    parser.add_argument("--seeks", type=int, default=20, help="Timed seeks per clip")
+    parser.add_argument("--play-seconds", type=float, default=5, help="Playback time for CPU/RSS")
+    parser.add_argument("--cycles", type=int, default=100, help="Load/stop cycles for teardown")
+    parser.add_argument("--timeout", type=float, default=600, help="Per engine, in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="bench_engines.json", help="Where to save the results")
+    parser.add_argument("--child", choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument("--clips", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_engine(args.child, json.loads(args.clips), args)))
+        return
+
+    media_dir = args.media_dir or tempfile.mkdtemp()
+    os.makedirs(media_dir, exist_ok=True)
+    try:
+        clips = make_media(media_dir, args.seconds, args.size, args.fps)
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "media": {"seconds": args.seconds, "size": args.size, "fps": args.fps},
+            "opens": args.opens,
+            "seeks": args.seeks,
+            "cycles": args.cycles,
+            "results": [],
+        }
+        for name in args.engines:
+            result = _run_child(name, clips, args)
+            report["results"].append(result)
+            _print_result(result)
+    finally:
+        if not args.media_dir:
+            shutil.rmtree(media_dir, ignore_errors=True)
+
+    with open(args.json, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Persistence micro-benchmarks for PersistencePort implementations.
+
+Each adapter is seeded with a progress history of the given size and then
+driven through the operations the player actually performs: a startup read,
+a burst of progress saves, settings reads, recent-list rewrites and a
+playlist-wide progress lookup. Reports p50/p99 latency per call and bytes
+written per call, and saves everything as JSON for comparison across runs.
+
+    python benchmarks/bench_persistence.py [--adapters json sqlite ...] [--sizes 100 10000 1000000]
+"""
+import sys
+import os
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.async_adapter import AsyncPersistenceAdapter
+from adapters.persistence.codecs import CODECS
+from adapters.persistence.journal_adapter import JournalPersistenceAdapter
+from adapters.persistence.json_adapter import JsonPersistenceAdapter
+from adapters.persistence.sqlite_adapter import SqlitePersistenceAdapter
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+def _json(codec):
+    return lambda d: JsonPersistenceAdapter(d, legacy_path=None, codec=codec)
+
+def _sqlite(d):
+    return SqlitePersistenceAdapter(os.path.join(d, "user_data.db"), os.path.join(d, "settings.json"), legacy_json_path=None)
+
+def _journal(d):
+    return JournalPersistenceAdapter(os.path.join(d, "user_data"))
+
+ADAPTERS = {
+    "json": _json("json"),
+    "json-pretty": _json("json-pretty"),
+    "sqlite": _sqlite,
+    "journal": _journal,
+    "async-json": lambda d: AsyncPersistenceAdapter(_json("json")(d)),
+    "async-sqlite": lambda d: AsyncPersistenceAdapter(_sqlite(d)),
+}
+if "orjson" in CODECS:
+    ADAPTERS["json-orjson"] = _json("orjson")
+if "msgpack" in CODECS:
+    ADAPTERS["json-msgpack"] = _json("msgpack")
+
+def _bytes_written():
+    """Bytes this process has passed to write() so far, where the OS reports it."""
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def _close(store):
+    store.flush()
+    if hasattr(store, "close"):
+        store.close()
+
+def _path(i: int) -> str:
+    return f"D:/Videos/Series {i // 100}/Episode {i:07d}.mkv"
+
+def seed(name: str, data_dir: str, size: int):
+    """Create a history of `size` progress entries, using bulk paths where the API would be too slow."""
+    store = ADAPTERS[name](data_dir)
+    inner = getattr(store, "inner", store)
+    now = int(time.time())
+    if isinstance(inner, SqlitePersistenceAdapter):
+        with inner._lock:
+            inner._conn.execute("BEGIN")
+            inner._conn.executemany(
+                inner._SQL_SAVE_PROGRESS,
+                ((_path(i), i + 1, now) for i in range(size)),
+            )
+            inner._conn.execute("COMMIT")
+    elif isinstance(inner, JsonPersistenceAdapter):
+        with inner._lock:
+            inner.progress.replace({_path(i): [i + 1, now] for i in range(size)})
+            inner._mark_dirty(inner.progress)
+    else:
+        for i in range(size):
+            store.save_progress(_path(i), i + 1)
+    store.save_setting("player_engine", "mpv")
+    store.save_recent_videos([_path(i) for i in range(min(size, 50))])
+    _close(store)
+
+def _measure(samples: list, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    samples.append(time.perf_counter() - start)
+    return result
+
+def _summary(samples: list, written, flushed_written) -> dict:
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, int(len(ordered) * 0.99))
+    result = {
+        "calls": len(samples),
+        "p50_us": statistics.median(ordered) * 1e6,
+        "p99_us": ordered[p99_index] * 1e6,
+        "bytes_per_call": None,
+    }
+    if written is not None and flushed_written is not None:
+        result["bytes_per_call"] = (flushed_written - written) / len(samples)
+    return result
+
+def run(name: str, size: int, ops: int, rng: random.Random) -> dict:
+    data_dir = tempfile.mkdtemp()
+    try:
+        seed(name, data_dir, size)
+        results = {}
+
+        # Startup: open the store and read what the app reads first
+        samples = []
+        written = _bytes_written()
+        for _ in range(5):
+            start = time.perf_counter()
+            store = ADAPTERS[name](data_dir)
+            store.load_setting("player_engine")
+            store.get_recent_videos()
+            samples.append(time.perf_counter() - start)
+            _close(store)
+        results["startup"] = _summary(samples, written, _bytes_written())
+
+        store = ADAPTERS[name](data_dir)
+
+        # Checkpoint-style saves: a few videos being played, occasionally a new one
+        samples = []
+        written = _bytes_written()
+        playing = [_path(rng.randrange(size)) for _ in range(3)]
+        for i in range(ops):
+            path = playing[i % 3] if rng.random() < 0.9 else _path(size + i)
+            _measure(samples, store.save_progress, path, 1000 + i)
+        store.flush()
+        results["save_progress"] = _summary(samples, written, _bytes_written())
+
+        samples = []
+        written = _bytes_written()
+        for i in range(ops):
+            _measure(samples, store.load_progress, _path(rng.randrange(size)))
+        store.flush()
+        results["load_progress"] = _summary(samples, written, _bytes_written())
+
+        samples = []
+        written = _bytes_written()
+        for _ in range(ops):
+            _measure(samples, store.load_setting, "player_engine", "qt")
+        store.flush()
+        results["load_setting"] = _summary(samples, written, _bytes_written())
+
+        samples = []
+        written = _bytes_written()
+        recent = [_path(i) for i in range(50)]
+        for i in range(max(1, ops // 10)):
+            recent.insert(0, recent.pop(rng.randrange(len(recent))))
+            _measure(samples, store.save_recent_videos, list(recent))
+        store.flush()
+        results["save_recent_videos"] = _summary(samples, written, _bytes_written())
+
+        samples = []
+        written = _bytes_written()
+        playlist = [_path(rng.randrange(size)) for _ in range(1000)]
+        for _ in range(10):
+            _measure(samples, store.load_progress_many, playlist)
+        store.flush()
+        results["load_progress_many_1000"] = _summary(samples, written, _bytes_written())
+
+        _close(store)
+        results["disk_bytes"] = sum(
+            os.path.getsize(os.path.join(data_dir, f)) for f in os.listdir(data_dir)
+        )
+        return results
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adapters", nargs="+", default=sorted(ADAPTERS), choices=sorted(ADAPTERS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="History sizes (entries), e.g. 100 10000 1000000")
+    parser.add_argument("--ops", type=int, default=1000, help="Calls per operation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="bench_persistence.json", help="Where to save the results")
+    args = parser.parse_args()
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ops": args.ops,
+        "results": [],
+    }
+    for size in args.sizes:
+        for name in args.adapters:
+            results = run(name, size, args.ops, random.Random(args.seed))
+            report["results"].append({"adapter": name, "entries": size, **results})
+            print(f"\n{name} @ {size:,} entries  (disk {results['disk_bytes']:,} bytes)")
+            for op, r in results.items():
+                if op == "disk_bytes":
+                    continue
+                per_call = "n/a" if r["bytes_per_call"] is None else f"{r['bytes_per_call']:,.0f} B"
+                print(f"  {op:<26} p50 {r['p50_us']:10.1f} us  p99 {r['p99_us']:10.1f} us  written/call {per_call}")
+
+    with open(args.json, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.json}")
+
+if __name__ == "__main__":
+    main()
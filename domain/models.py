@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import itertools
 import os
 from enum import Enum, auto
+from typing import Optional, List, Tuple
 
 class PlaybackState(Enum):
     STOPPED = auto()
@@ -15,10 +17,44 @@ class MediaStatus(Enum):
     End = auto() # End of media
     ERROR = auto()
 
+_entry_ids = itertools.count(1)
+
+@dataclass
+class MediaInfo:
+    """What a probe found out about a media file. Fields are None when unknown."""
+    duration: Optional[int] = None # ms
+    width: Optional[int] = None
+    height: Optional[int] = None
+    video_codec: Optional[str] = None
+    audio_codec: Optional[str] = None
+    bitrate: Optional[int] = None # bits/s
+    container: Optional[str] = None
+    audio_tracks: List[str] = field(default_factory=list)
+    subtitle_tracks: List[str] = field(default_factory=list)
+    chapters: List[Tuple[int, str]] = field(default_factory=list) # (start ms, title)
+
+    @property
+    def resolution(self) -> Optional[str]:
+        if self.width and self.height:
+            return f"{self.width}x{self.height}"
+        return None
+
 @dataclass
 class Video:
     path: str
     title: str = ""
+    # Saved resume point in ms; None while unknown
+    resume_position: Optional[int] = field(default=None, compare=False)
+    # Played to its end before (resume_position is 0 then)
+    watched: bool = field(default=False, compare=False)
+    # Unique per playlist entry, so the same file added twice stays two entries
+    entry_id: int = field(default_factory=lambda: next(_entry_ids), repr=False)
+    # Filled in by the background prober; None until it has run
+    info: Optional[MediaInfo] = field(default=None, compare=False, repr=False)
+
+    @property
+    def duration(self) -> Optional[int]:
+        return self.info.duration if self.info else None
 
     def __post_init__(self):
         if not self.title:
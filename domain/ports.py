@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
-from domain.models import PlaybackState, MediaStatus
+from typing import List, Any, Dict, Optional
+from domain.models import PlaybackState, MediaStatus, MediaInfo
 
 class VideoPlayerPort(ABC):
     @abstractmethod
-    def load(self, path: str):
+    def load(self, path: str, start_position: int = 0):
+        """Open `path`. Playback starts at `start_position` ms, passed to the engine
+        as a start offset so decoding begins there rather than at 0."""
         pass
 
     @abstractmethod
@@ -55,6 +57,34 @@ class VideoPlayerPort(ABC):
     @abstractmethod
     def set_video_output(self, widget: Any):
         pass
+
+    def preload(self, path: str):
+        """Hint that `path` is likely to be loaded next. Engines that can open
+        it ahead of time do so, so the following load() starts faster. No-op by default."""
+        pass
+
+    def cancel_preload(self):
+        """Drop whatever preload() opened; the next item changed. No-op by default."""
+        pass
+
+    # Gapless playback: the engine moves from one item to the queued next one
+    # by itself, without a stop/load in between. Engines without support keep
+    # the defaults and the service falls back to load() on MediaStatus.End.
+    def supports_gapless(self) -> bool:
+        return False
+
+    def set_gapless(self, enabled: bool):
+        pass
+
+    def queue_next(self, path: Optional[str]):
+        """In gapless mode, the item to continue with when the current one ends; None for none.
+        Replaces whatever was queued before."""
+        pass
+
+    def set_on_track_advanced(self, callback):
+        """Callback(path: str), when the engine moved on to the queued item by itself.
+        May be called from an engine thread."""
+        pass
         
     # Observability
     @abstractmethod
@@ -82,15 +112,29 @@ class VideoPlayerPort(ABC):
         """Callback(error_msg: str)"""
         pass
 
+# Stored as the position of an item played to its end, so a lookup can tell
+# "watched" from "never started" (no entry). Saving 0 deletes the entry.
+WATCHED_POSITION = -1
+
 class PersistencePort(ABC):
     @abstractmethod
     def save_progress(self, path: str, position: int):
+        """Store the resume point for `path`, or WATCHED_POSITION."""
         pass
 
     @abstractmethod
     def load_progress(self, path: str) -> int:
         pass
 
+    @abstractmethod
+    def load_progress_many(self, paths: List[str]) -> Dict[str, int]:
+        """Saved positions for all `paths` in one pass. Paths without progress are omitted."""
+        pass
+
+    @abstractmethod
+    def delete_progress(self, path: str):
+        pass
+
     @abstractmethod
     def save_setting(self, key: str, value: Any):
         pass
@@ -98,3 +142,17 @@ class PersistencePort(ABC):
     @abstractmethod
     def load_setting(self, key: str, default: Any = None) -> Any:
         pass
+
+    def flush(self):
+        """Write out any buffered changes. No-op for write-through backends."""
+        pass
+
+class MediaProberPort(ABC):
+    """Reads media metadata without playing the file.
+
+    Implementations must be picklable: probes run in worker processes.
+    """
+    @abstractmethod
+    def probe(self, path: str) -> Optional[MediaInfo]:
+        """Metadata for `path`, or None if it can't be read."""
+        pass
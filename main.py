@@ -7,30 +7,44 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Persistence backend: "json" (progress.json) or "sqlite" (user_data.db).
+# The journal adapter is for benchmarks only, see its docstring.
+PERSISTENCE_BACKEND = "json"
+
+def _read_engine_setting():
+    import json
+    # Both backends keep settings in the small settings.json. Before the
+    # first run migrated it, fall back to the old flat user_data.json.
+    for path in ("settings.json", "user_data.json"):
+        try:
+            with open(path, "r") as f:
+                return json.load(f).get("player_engine")
+        except FileNotFoundError:
+            continue
+        except (json.JSONDecodeError, AttributeError):
+            return None
+    return None
+
 # Pre-load MPV DLL before any Qt imports to avoid conflicts
-# Check settings first using a minimal JSON read
+# Check settings first using a minimal read
 def _preload_mpv_if_needed():
-    import json
     try:
-        with open("user_data.json", "r") as f:
-            data = json.load(f)
-            if data.get("player_engine") == "mpv":
-                mpv_path = os.path.abspath("mpv")
-                if os.path.exists(mpv_path):
-                    os.environ["PATH"] = mpv_path + os.pathsep + os.environ["PATH"]
-                    for dll_name in ["libmpv-2.dll", "mpv-1.dll", "mpv-2.dll"]:
-                        dll_path = os.path.join(mpv_path, dll_name)
-                        if os.path.exists(dll_path):
-                            ctypes.CDLL(dll_path)
-                            break
-    except (FileNotFoundError, json.JSONDecodeError):
+        if _read_engine_setting() == "mpv":
+            mpv_path = os.path.abspath("mpv")
+            if os.path.exists(mpv_path):
+                os.environ["PATH"] = mpv_path + os.pathsep + os.environ["PATH"]
+                for dll_name in ["libmpv-2.dll", "mpv-1.dll", "mpv-2.dll"]:
+                    dll_path = os.path.join(mpv_path, dll_name)
+                    if os.path.exists(dll_path):
+                        ctypes.CDLL(dll_path)
+                        break
+    except OSError:
         pass
 
 _preload_mpv_if_needed()
 
 from PySide6.QtWidgets import QApplication
 from adapters.player.qt_player import QtPlayer
-from adapters.persistence.json_adapter import JsonPersistenceAdapter
 from app.services import VideoService
 from adapters.ui.main_window import MainWindow
 
@@ -38,7 +52,20 @@ def main():
     app = QApplication(sys.argv)
 
     # Composition Root
-    persistence_adapter = JsonPersistenceAdapter()
+    if PERSISTENCE_BACKEND == "sqlite":
+        from adapters.persistence.sqlite_adapter import SqlitePersistenceAdapter
+        persistence_adapter = SqlitePersistenceAdapter()
+    else:
+        from adapters.persistence.json_adapter import JsonPersistenceAdapter
+        persistence_adapter = JsonPersistenceAdapter()
+
+    # Trim old progress entries in the background
+    from adapters.persistence.eviction import ProgressEvictor
+    ProgressEvictor(persistence_adapter).start()
+
+    # Keep all persistence writes off the UI thread
+    from adapters.persistence.async_adapter import AsyncPersistenceAdapter
+    persistence_adapter = AsyncPersistenceAdapter(persistence_adapter)
     
     player_engine = persistence_adapter.load_setting("player_engine", "qt")
     
@@ -51,7 +78,21 @@ def main():
     else:
         player_adapter = QtPlayer()
 
-    video_service = VideoService(player_adapter, persistence_adapter)
+    # Metadata probing needs ffprobe; without it the playlist just shows no durations
+    from adapters.probe.ffprobe_prober import FfprobeProber
+    prober = FfprobeProber.find()
+    if prober is None:
+        print("ffprobe not found, media info disabled")
+
+    # Probe results are kept across runs so known files are never probed twice
+    from app.media_cache import MediaInfoCache
+    media_cache = MediaInfoCache("media_cache.jsonl")
+
+    # Fingerprints too, so resume points of known files are found without hashing them
+    from app.file_identity import FileIdentity
+    identity = FileIdentity(cache_path="file_identity.jsonl")
+
+    video_service = VideoService(player_adapter, persistence_adapter, prober, media_cache, identity)
     main_window = MainWindow(video_service)
 
     main_window.show()
@@ -0,0 +1,139 @@
+import sys
+import os
+import threading
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.async_adapter import AsyncPersistenceAdapter
+from domain.ports import PersistencePort
+
+class GatedStore(PersistencePort):
+    """In-memory store whose writes wait for `gate`, recording them in order."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.writing = threading.Event()
+        self.writes = []
+        self.progress = {}
+        self.settings = {}
+        self.closed = False
+
+    def _write(self, entry):
+        self.writing.set()
+        self.gate.wait(10)
+        self.writes.append(entry)
+
+    def save_progress(self, path, position):
+        self._write(("save", path, position))
+        self.progress[path] = position
+
+    def load_progress(self, path):
+        return self.progress.get(path, 0)
+
+    def load_progress_many(self, paths):
+        return {path: self.progress[path] for path in paths if path in self.progress}
+
+    def delete_progress(self, path):
+        self._write(("delete", path))
+        self.progress.pop(path, None)
+
+    def save_setting(self, key, value):
+        self._write(("setting", key, value))
+        self.settings[key] = value
+
+    def load_setting(self, key, default=None):
+        return self.settings.get(key, default)
+
+    def close(self):
+        self.closed = True
+
+class AsyncPersistenceAdapterTest(unittest.TestCase):
+    def setUp(self):
+        self.inner = GatedStore()
+        self.store = None
+
+    def tearDown(self):
+        self.inner.gate.set()
+        if self.store is not None and not self.store._closed:
+            self.store.close()
+
+    def _open(self, **kwargs):
+        self.store = AsyncPersistenceAdapter(self.inner, **kwargs)
+        return self.store
+
+    def _block_worker(self, store):
+        # The worker picks up one write and waits in it
+        self.inner.gate.clear()
+        store.save_setting("blocker", True)
+        self.assertTrue(self.inner.writing.wait(5))
+
+    def test_repeated_saves_coalesce(self):
+        store = self._open()
+        self._block_worker(store)
+        for position in (1000, 2000, 3000):
+            store.save_progress("/videos/a.mkv", position)
+        store.save_progress("/videos/b.mkv", 500)
+        store.save_progress("/videos/a.mkv", 4000)
+        # Reads see the queued value before it is written
+        self.assertEqual(store.load_progress("/videos/a.mkv"), 4000)
+        self.assertEqual(store.load_progress_many(["/videos/a.mkv", "/videos/b.mkv"]),
+                         {"/videos/a.mkv": 4000, "/videos/b.mkv": 500})
+        self.inner.gate.set()
+        store.flush()
+        # One write per key, in first-queued order, with the last value
+        self.assertEqual(self.inner.writes, [
+            ("setting", "blocker", True),
+            ("save", "/videos/a.mkv", 4000),
+            ("save", "/videos/b.mkv", 500),
+        ])
+
+    def test_full_queue_blocks_until_drained(self):
+        store = self._open(max_pending=2)
+        self._block_worker(store)
+        store.save_progress("/videos/a.mkv", 1)
+        store.save_progress("/videos/b.mkv", 2)
+        # Coalescing into a queued key never waits
+        store.save_progress("/videos/a.mkv", 3)
+        submitted = threading.Event()
+
+        def submit():
+            store.save_progress("/videos/c.mkv", 4)
+            submitted.set()
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+        self.assertFalse(submitted.wait(0.2))
+        self.inner.gate.set()
+        self.assertTrue(submitted.wait(5))
+        thread.join()
+        store.flush()
+        self.assertEqual(self.inner.progress, {"/videos/a.mkv": 3, "/videos/b.mkv": 2, "/videos/c.mkv": 4})
+
+    def test_flush_is_a_barrier(self):
+        store = self._open()
+        for i in range(50):
+            store.save_progress(f"/videos/{i}.mkv", i + 1)
+        store.delete_progress("/videos/0.mkv")
+        store.flush()
+        self.assertEqual(len(self.inner.progress), 49)
+        self.assertEqual(self.inner.load_progress("/videos/49.mkv"), 50)
+        self.assertEqual(store.load_progress("/videos/0.mkv"), 0)
+
+    def test_close_drains_the_queue(self):
+        store = self._open()
+        self._block_worker(store)
+        store.save_progress("/videos/a.mkv", 1000)
+        store.save_setting("volume", 80)
+        threading.Timer(0.1, self.inner.gate.set).start()
+        store.close()
+        self.assertEqual(self.inner.progress, {"/videos/a.mkv": 1000})
+        self.assertEqual(self.inner.settings["volume"], 80)
+        self.assertTrue(self.inner.closed)
+        with self.assertRaises(RuntimeError):
+            store.save_progress("/videos/b.mkv", 1)
+
+if __name__ == "__main__":
+    unittest.main()
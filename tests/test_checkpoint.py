@@ -0,0 +1,79 @@
+import sys
+import os
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.checkpoint import ProgressCheckpointer
+
+class ProgressCheckpointerTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.saved = []
+        self.checkpointer = ProgressCheckpointer(lambda key, pos: self.saved.append((key, pos)),
+                                                 clock=lambda: self.now)
+
+    def play(self, start, end, step=500):
+        """Position updates every `step` ms of playback, with the clock following."""
+        for position in range(start, end + 1, step):
+            if position > start:
+                self.now += step / 1000
+            self.checkpointer.on_position(position)
+
+    def test_writes_after_interval_of_playback(self):
+        self.checkpointer.reset("k", 0)
+        self.play(0, 14500)
+        self.assertEqual(self.saved, [])
+        self.play(14500, 15000)
+        self.assertEqual(self.saved, [("k", 15000)])
+        self.play(15000, 29500)
+        self.assertEqual(len(self.saved), 1)
+        self.play(29500, 30000)
+        self.assertEqual(self.saved[-1], ("k", 30000))
+        self.assertEqual(self.checkpointer.stats(), {"writes": 2, "skipped": 0})
+
+    def test_small_jump_counts_as_playback(self):
+        self.checkpointer.reset("k", 0)
+        self.now = 20
+        self.checkpointer.on_position(4000)
+        self.assertEqual(self.saved, [])
+
+    def test_seek_is_written_once_interval_allows(self):
+        self.checkpointer.reset("k", 0)
+        self.now = 20
+        self.checkpointer.on_position(60000)
+        self.assertEqual(self.saved, [("k", 60000)])
+
+    def test_seeks_are_coalesced_and_counted(self):
+        self.checkpointer.reset("k", 0)
+        self.now = 20
+        self.checkpointer.on_position(60000) # written
+        self.now += 1
+        self.checkpointer.on_position(120000) # coalesced
+        self.now += 1
+        self.checkpointer.on_position(180000) # same due checkpoint, not counted again
+        self.checkpointer.on_position(180500)
+        self.assertEqual(self.saved, [("k", 60000)])
+        self.assertEqual(self.checkpointer.stats(), {"writes": 1, "skipped": 1})
+        self.now += 13
+        self.checkpointer.on_position(181000)
+        self.assertEqual(self.saved[-1], ("k", 181000))
+        self.assertEqual(self.checkpointer.stats(), {"writes": 2, "skipped": 1})
+
+    def test_unchanged_position_is_skipped(self):
+        self.checkpointer.reset("k", 5000)
+        self.assertFalse(self.checkpointer.checkpoint(5000))
+        self.assertTrue(self.checkpointer.checkpoint(6000))
+        self.assertEqual(self.saved, [("k", 6000)])
+        self.assertEqual(self.checkpointer.stats(), {"writes": 1, "skipped": 1})
+
+    def test_no_key_no_writes(self):
+        self.checkpointer.reset(None)
+        self.now = 100
+        self.checkpointer.on_position(60000)
+        self.assertFalse(self.checkpointer.checkpoint(1000))
+        self.assertEqual(self.saved, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence import codecs
+from adapters.persistence.json_store import JsonStore
+
+class JsonStoreLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "progress.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_unavailable_codec_is_left_in_place(self):
+        # Codec id 255 isn't installed anywhere
+        payload = codecs.MAGIC + bytes([255]) + b"\x01\x02\x03"
+        with open(self.path, 'wb') as f:
+            f.write(payload)
+        store = JsonStore(self.path)
+        self.assertEqual(store.data, {})
+        self.assertTrue(store.read_only)
+        store.set("/videos/a.mkv", 1500)
+        store.commit()
+        self.assertEqual(store.data, {"/videos/a.mkv": 1500})
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), payload)
+        self.assertFalse(os.path.exists(self.path + ".corrupt"))
+
+    def test_damaged_file_is_moved_aside(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'{"/videos/a.mkv": 15')
+        store = JsonStore(self.path)
+        self.assertEqual(store.data, {})
+        self.assertFalse(store.read_only)
+        self.assertTrue(os.path.exists(self.path + ".corrupt"))
+
+if __name__ == "__main__":
+    unittest.main()
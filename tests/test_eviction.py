@@ -0,0 +1,86 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.eviction import EvictionPolicy, ProgressEvictor
+from adapters.persistence.json_adapter import JsonPersistenceAdapter
+from adapters.persistence.sqlite_adapter import SqlitePersistenceAdapter
+
+DAY = 86400
+
+class EvictionTests:
+    """Shared by both backends; subclasses provide _open()."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.now = 1000 * DAY
+        patcher = mock.patch("time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = self._open()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def save(self, names, days_apart=1):
+        for name in names:
+            self.store.save_progress(f"/videos/{name}.mkv", 1000)
+            self.now += days_apart * DAY
+
+    def remaining(self, names):
+        found = self.store.load_progress_many([f"/videos/{name}.mkv" for name in names])
+        return sorted(path[len("/videos/"):-len(".mkv")] for path in found)
+
+    def test_age_limit(self):
+        self.save(["old"], days_apart=40)
+        self.save(["new"])
+        policy = EvictionPolicy(max_entries=None, max_age_days=30)
+        self.assertEqual(self.store.evict_progress(policy, 100, self.now), 1)
+        self.assertEqual(self.remaining(["old", "new"]), ["new"])
+
+    def test_count_limit_drops_least_recently_used(self):
+        self.save(["a", "b", "c", "d", "e"])
+        policy = EvictionPolicy(max_entries=3, max_age_days=None)
+        self.assertEqual(self.store.evict_progress(policy, 100, self.now), 2)
+        self.assertEqual(self.remaining("abcde"), ["c", "d", "e"])
+
+    def test_read_keeps_an_entry(self):
+        self.save(["a", "b", "c"])
+        self.assertEqual(self.store.load_progress("/videos/a.mkv"), 1000)
+        self.now += DAY
+        policy = EvictionPolicy(max_entries=2, max_age_days=None)
+        self.assertEqual(self.store.evict_progress(policy, 100, self.now), 1)
+        self.assertEqual(self.remaining("abc"), ["a", "c"])
+
+    def test_per_pass_limit(self):
+        names = [f"v{i}" for i in range(10)]
+        self.save(names)
+        self.now += 100 * DAY
+        policy = EvictionPolicy(max_entries=None, max_age_days=30, batch_size=4)
+        self.assertEqual(self.store.evict_progress(policy, 4, self.now), 4)
+        self.assertEqual(len(self.remaining(names)), 6)
+        # The evictor keeps going in batches until a short one
+        evictor = ProgressEvictor(self.store, policy, pause=0)
+        self.assertEqual(evictor.run_once(), 6)
+        self.assertEqual(self.remaining(names), [])
+
+class JsonEvictionTest(EvictionTests, unittest.TestCase):
+    def _open(self):
+        return JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+
+class SqliteEvictionTest(EvictionTests, unittest.TestCase):
+    def _open(self):
+        store = SqlitePersistenceAdapter(os.path.join(self.tmp_dir, "user_data.db"),
+                                         os.path.join(self.tmp_dir, "settings.json"),
+                                         os.path.join(self.tmp_dir, "user_data.json"))
+        self.addCleanup(store.close)
+        return store
+
+if __name__ == "__main__":
+    unittest.main()
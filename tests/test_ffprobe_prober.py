@@ -0,0 +1,51 @@
+import sys
+import os
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.probe.ffprobe_prober import parse_ffprobe_output
+
+SAMPLE = {
+    "streams": [
+        {"index": 0, "codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080},
+        {"index": 1, "codec_type": "audio", "codec_name": "aac", "tags": {"language": "eng"}},
+        {"index": 2, "codec_type": "audio", "codec_name": "ac3", "tags": {"title": "Commentary"}},
+        {"index": 3, "codec_type": "subtitle", "codec_name": "subrip", "tags": {"language": "fre"}},
+        {"index": 4, "codec_type": "video", "codec_name": "mjpeg", "disposition": {"attached_pic": 1}},
+    ],
+    "chapters": [
+        {"start_time": "0.000000", "tags": {"title": "Intro"}},
+        {"start_time": "95.500000", "tags": {"title": "Part 1"}},
+    ],
+    "format": {"format_name": "matroska,webm", "duration": "1325.480000", "bit_rate": "4500000"},
+}
+
+class ParseFfprobeOutputTest(unittest.TestCase):
+    def test_full_output(self):
+        info = parse_ffprobe_output(SAMPLE)
+        self.assertEqual(info.duration, 1325480)
+        self.assertEqual((info.width, info.height), (1920, 1080))
+        self.assertEqual(info.resolution, "1920x1080")
+        self.assertEqual(info.video_codec, "h264")
+        self.assertEqual(info.audio_codec, "aac")
+        self.assertEqual(info.bitrate, 4500000)
+        self.assertEqual(info.container, "matroska,webm")
+        self.assertEqual(info.audio_tracks, ["eng - aac", "Commentary - ac3"])
+        self.assertEqual(info.subtitle_tracks, ["fre - subrip"])
+        self.assertEqual(info.chapters, [(0, "Intro"), (95500, "Part 1")])
+
+    def test_stream_duration_fallback(self):
+        data = {"streams": [{"codec_type": "video", "codec_name": "vp9", "duration": "10.5"}], "format": {}}
+        info = parse_ffprobe_output(data)
+        self.assertEqual(info.duration, 10500)
+        self.assertIsNone(info.bitrate)
+
+    def test_empty_output(self):
+        info = parse_ffprobe_output({})
+        self.assertIsNone(info.duration)
+        self.assertEqual(info.audio_tracks, [])
+
+if __name__ == "__main__":
+    unittest.main()
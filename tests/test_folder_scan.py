@@ -0,0 +1,75 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.folder_scan import FolderScan, iter_media_files, normalize_extensions
+
+class IterMediaFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for rel in ["b.mkv", "A.MP4", "notes.txt", "Season 2/e02.mkv", "Season 2/e01.mkv",
+                    "season 1/e01.avi", "season 1/extras/clip.mp4"]:
+            path = os.path.join(self.root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def rel(self, paths):
+        return [os.path.relpath(p, self.root).replace(os.sep, "/") for p in paths]
+
+    def test_folder_order_and_extension_filter(self):
+        found = self.rel(iter_media_files(self.root, normalize_extensions(["mkv", ".MP4", "avi"])))
+        self.assertEqual(found, [
+            "A.MP4", "b.mkv",
+            "season 1/e01.avi", "season 1/extras/clip.mp4",
+            "Season 2/e01.mkv", "Season 2/e02.mkv",
+        ])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs symlinks")
+    def test_symlink_loop_is_not_followed(self):
+        try:
+            os.symlink(self.root, os.path.join(self.root, "season 1", "loop"))
+        except OSError:
+            self.skipTest("symlinks not permitted")
+        found = list(iter_media_files(self.root, normalize_extensions(["mkv"])))
+        self.assertEqual(len(found), 3)
+
+    def test_cancel_stops_the_walk(self):
+        found = []
+        for path in iter_media_files(self.root, normalize_extensions(["mkv", "mp4", "avi"]), lambda: len(found) >= 2):
+            found.append(path)
+        self.assertEqual(len(found), 2)
+
+class FolderScanTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for rel in ["one/a.mkv", "two/b.mkv"]:
+            path = os.path.join(self.root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_add_roots_until_finished(self):
+        scan = FolderScan([os.path.join(self.root, "one")])
+        self.assertTrue(scan.add_roots([os.path.join(self.root, "two")]))
+        scan.start()
+        scan.wait(5)
+        self.assertEqual(scan.files_found_count, 2)
+        self.assertEqual(scan.folders_scanned, 2)
+        # The walk is over: a new scan is needed
+        self.assertFalse(scan.add_roots([self.root]))
+        cancelled = FolderScan([self.root])
+        cancelled.cancel()
+        self.assertFalse(cancelled.add_roots([self.root]))
+
+if __name__ == "__main__":
+    unittest.main()
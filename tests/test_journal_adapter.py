@@ -0,0 +1,96 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.journal_adapter import JournalPersistenceAdapter
+
+class JournalCrashRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.tmp_dir, "user_data")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _open(self, **kwargs):
+        return JournalPersistenceAdapter(self.base, **kwargs)
+
+    def test_reopen_replays_journal(self):
+        store = self._open()
+        store.save_progress("/videos/a.mkv", 1500)
+        store.save_progress("/videos/a.mkv", 2500)
+        store.save_setting("player_engine", "mpv")
+        store.save_recent_videos(["/videos/a.mkv"])
+        store.close()
+
+        store = self._open()
+        self.assertEqual(store.load_progress("/videos/a.mkv"), 2500)
+        self.assertEqual(store.load_setting("player_engine"), "mpv")
+        self.assertEqual(store.get_recent_videos(), ["/videos/a.mkv"])
+        store.close()
+
+    def test_truncation_at_every_offset_recovers_a_prefix(self):
+        store = self._open()
+        expected_states = [{}]
+        for i in range(6):
+            store.save_progress(f"/videos/{i % 3}.mp4", (i + 1) * 1000)
+            state = dict(expected_states[-1])
+            state[f"/videos/{i % 3}.mp4"] = (i + 1) * 1000
+            expected_states.append(state)
+        store.close()
+
+        with open(store.journal_path, 'rb') as f:
+            journal = f.read()
+        paths = [f"/videos/{i}.mp4" for i in range(3)]
+
+        for cut in range(len(journal) + 1):
+            with open(store.journal_path, 'wb') as f:
+                f.write(journal[:cut])
+            recovered = self._open()
+            state = {p: recovered.load_progress(p) for p in paths if recovered.load_progress(p)}
+            self.assertIn(state, expected_states, f"Unexpected state after truncating at byte {cut}")
+
+            # The torn tail is dropped, so new records remain readable
+            recovered.save_progress("/videos/new.mp4", 42)
+            recovered.close()
+            reopened = self._open()
+            self.assertEqual(reopened.load_progress("/videos/new.mp4"), 42)
+            reopened.close()
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        store = self._open(compact_threshold=10 ** 9)
+        for i in range(100):
+            store.save_progress(f"/videos/{i}.mp4", i)
+        store.compact()
+        self.assertEqual(os.path.getsize(store.journal_path), 0)
+        store.save_progress("/videos/1.mp4", 999)
+        store.close()
+
+        store = self._open()
+        self.assertEqual(store.load_progress("/videos/50.mp4"), 50)
+        self.assertEqual(store.load_progress("/videos/1.mp4"), 999)
+        store.close()
+
+    def test_interrupted_compaction_is_recovered(self):
+        store = self._open(compact_threshold=10 ** 9)
+        store.save_progress("/videos/a.mp4", 100)
+        store.close()
+        # Simulate a crash right after rotation, before the snapshot was written
+        os.replace(store.journal_path, store.compacting_path)
+
+        store = self._open(compact_threshold=10 ** 9)
+        self.assertEqual(store.load_progress("/videos/a.mp4"), 100)
+        store.close()
+        self.assertFalse(os.path.exists(store.compacting_path))
+
+        store = self._open()
+        self.assertEqual(store.load_progress("/videos/a.mp4"), 100)
+        store.close()
+
+if __name__ == "__main__":
+    unittest.main()
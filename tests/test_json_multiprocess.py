@@ -0,0 +1,148 @@
+import sys
+import os
+import multiprocessing
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.json_adapter import JsonPersistenceAdapter
+from adapters.persistence.json_store import JsonStore
+
+PROCESSES = 4
+SAVES_PER_PROCESS = 200
+
+def _hammer(data_dir: str, worker: int):
+    # Short flush delay so flushes from different processes interleave
+    store = JsonPersistenceAdapter(data_dir, flush_delay=0.001)
+    for i in range(SAVES_PER_PROCESS):
+        store.save_progress(f"/videos/w{worker}/{i}.mkv", i + 1)
+        store.save_setting(f"worker_{worker}", i)
+        if i % 10 == 0:
+            store.flush()
+    store.flush()
+
+def _save_one(data_dir: str, path: str, position: int):
+    store = JsonPersistenceAdapter(data_dir, flush_delay=60)
+    store.save_progress(path, position)
+    store.flush()
+
+class JsonMultiProcessTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_concurrent_processes_lose_no_updates(self):
+        ctx = multiprocessing.get_context("spawn")
+        procs = [ctx.Process(target=_hammer, args=(self.tmp_dir, w)) for w in range(PROCESSES)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+            self.assertEqual(p.exitcode, 0)
+
+        store = JsonPersistenceAdapter(self.tmp_dir)
+        for w in range(PROCESSES):
+            self.assertEqual(store.load_setting(f"worker_{w}"), SAVES_PER_PROCESS - 1)
+            for i in range(SAVES_PER_PROCESS):
+                self.assertEqual(store.load_progress(f"/videos/w{w}/{i}.mkv"), i + 1)
+
+    def test_newest_write_wins(self):
+        first = JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+        second = JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+        first.progress.set("/videos/a.mkv", [1000, 200])
+        first._mark_dirty(first.progress)
+        second.progress.set("/videos/a.mkv", [500, 100])
+        second._mark_dirty(second.progress)
+        first.flush()
+        second.flush()
+
+        # second flushed last but its entry is older
+        self.assertEqual(JsonPersistenceAdapter(self.tmp_dir).progress.data["/videos/a.mkv"][0], 1000)
+        # and it picked up the newer entry while merging
+        self.assertEqual(second.progress.data["/videos/a.mkv"][0], 1000)
+
+    def test_failed_flush_is_merged_on_retry(self):
+        first = JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+        first.save_progress("/videos/a.mkv", 1000)
+        with mock.patch("adapters.persistence.json_store.FileLock.__enter__", side_effect=TimeoutError("lock busy")):
+            first.flush()
+
+        # Another process writes while this one's changes are pending
+        ctx = multiprocessing.get_context("spawn")
+        p = ctx.Process(target=_save_one, args=(self.tmp_dir, "/videos/b.mkv", 2000))
+        p.start()
+        p.join(60)
+        self.assertEqual(p.exitcode, 0)
+
+        first.flush()
+        reopened = JsonPersistenceAdapter(self.tmp_dir)
+        self.assertEqual(reopened.load_progress("/videos/a.mkv"), 1000)
+        self.assertEqual(reopened.load_progress("/videos/b.mkv"), 2000)
+        self.assertEqual(first.load_progress("/videos/b.mkv"), 2000)
+
+    def test_failed_commit_keeps_changes(self):
+        store = JsonStore(os.path.join(self.tmp_dir, "settings.json"))
+        store.set("volume", 80)
+        with mock.patch.object(JsonStore, "write", side_effect=OSError("read-only file system")):
+            with self.assertRaises(OSError):
+                store.commit()
+        self.assertTrue(store.has_changes())
+        store.commit()
+        self.assertEqual(JsonStore(store.file_path).data, {"volume": 80})
+
+class JsonAccessTimeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_reads_dont_schedule_writes(self):
+        store = JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+        store.progress.set("/videos/a.mkv", [1000, 100])
+        store.progress.set("/videos/b.mkv", [2000, 100])
+        store._mark_dirty(store.progress)
+        store.flush()
+
+        self.assertEqual(store.load_progress("/videos/a.mkv"), 1000)
+        self.assertIsNone(store._flush_timer)
+        self.assertEqual(JsonPersistenceAdapter(self.tmp_dir).progress.data["/videos/a.mkv"][1], 100)
+
+        # The access time goes out with the next real write
+        store.save_progress("/videos/b.mkv", 2500)
+        store.flush()
+        on_disk = JsonPersistenceAdapter(self.tmp_dir).progress.data
+        self.assertGreater(on_disk["/videos/a.mkv"][1], 100)
+        self.assertEqual(list(on_disk), ["/videos/a.mkv", "/videos/b.mkv"])
+
+class JsonFlushFailureTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_failed_flush_keeps_changes(self):
+        store = JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+        store.save_progress("/videos/a.mkv", 1000)
+        store.save_progress("/videos/b.mkv", 2000)
+        store.save_recent_videos(["/videos/a.mkv"])
+        with mock.patch.object(JsonStore, "write", side_effect=OSError(28, "No space left on device")):
+            store.flush()
+        # Changed again while the write was failing: the newer value wins
+        store.save_progress("/videos/b.mkv", 2500)
+        store.flush()
+
+        reopened = JsonPersistenceAdapter(self.tmp_dir)
+        self.assertEqual(reopened.load_progress("/videos/a.mkv"), 1000)
+        self.assertEqual(reopened.load_progress("/videos/b.mkv"), 2500)
+        self.assertEqual(reopened.get_recent_videos(), ["/videos/a.mkv"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.media_cache import MediaInfoCache
+from domain.models import MediaInfo
+
+class MediaInfoCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        # Registered first so it runs after the caches are closed
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
+        self.cache_path = os.path.join(self.tmp_dir, "media_cache.jsonl")
+
+    def media(self, name, content=b"data"):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def open(self, **kwargs):
+        cache = MediaInfoCache(self.cache_path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def info(self, duration=1000):
+        return MediaInfo(duration=duration, width=640, height=360, audio_tracks=["eng"], chapters=[(0, "Intro")])
+
+    def test_roundtrip_across_instances(self):
+        a, b = self.media("a.mkv"), self.media("b.mkv")
+        cache = self.open()
+        cache.put_many([(a, self.info(1000)), (b, self.info(2000))])
+        cache.close()
+
+        cache = self.open()
+        found = cache.get_many([a, b, self.media("c.mkv")])
+        self.assertEqual(found[a], self.info(1000))
+        self.assertEqual(found[b].chapters, [(0, "Intro")])
+        self.assertNotIn(os.path.join(self.tmp_dir, "c.mkv"), found)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+    def test_reads_appended_entries_without_close(self):
+        a = self.media("a.mkv")
+        self.open().put_many([(a, self.info())])
+        self.assertEqual(self.open().get(a), self.info())
+
+    def test_changed_file_is_invalidated(self):
+        a = self.media("a.mkv")
+        cache = self.open()
+        cache.put_many([(a, self.info())])
+        with open(a, "ab") as f:
+            f.write(b"more")
+        self.assertIsNone(cache.get(a))
+        self.assertEqual(cache.stats()["invalidations"], 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        paths = [self.media(f"{i}.mkv") for i in range(3)]
+        cache = self.open(max_entries=2)
+        cache.put_many([(paths[0], self.info()), (paths[1], self.info())])
+        cache.get(paths[0]) # 1 is now the least recently used
+        cache.put_many([(paths[2], self.info())])
+        self.assertEqual(cache.stats()["evictions"], 1)
+        cache.close()
+
+        cache = self.open(max_entries=2)
+        self.assertEqual(set(cache.get_many(paths)), {paths[0], paths[2]})
+
+    def test_torn_line_is_skipped(self):
+        a, b = self.media("a.mkv"), self.media("b.mkv")
+        self.open().put_many([(a, self.info()), (b, self.info())])
+        with open(self.cache_path, "rb+") as f:
+            f.truncate(os.path.getsize(self.cache_path) - 10)
+        cache = self.open()
+        self.assertEqual(set(cache.get_many([a, b])), {a})
+
+    def test_compacts_superseded_lines(self):
+        a = self.media("a.mkv")
+        cache = self.open()
+        for i in range(1500):
+            cache.put_many([(a, self.info(i))])
+        cache.close()
+        with open(self.cache_path) as f:
+            self.assertEqual(len(f.readlines()), 2) # header + the one live entry
+        self.assertEqual(self.open().get(a).duration, 1499)
+
+if __name__ == "__main__":
+    unittest.main()
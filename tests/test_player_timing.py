@@ -0,0 +1,92 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.player_timing import LatencyHistogram, PlayerTimings, TimedPlayer
+from domain.models import MediaStatus, PlaybackState
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000
+
+class PlayerTimingsTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timings = PlayerTimings(clock=self.clock)
+        self.inner = mock.MagicMock()
+        self.player = TimedPlayer(self.inner, self.timings)
+        # The callbacks the wrapper installed on the engine
+        self.on_position = self.inner.set_on_position_changed.call_args[0][0]
+        self.on_state = self.inner.set_on_playback_state_changed.call_args[0][0]
+        self.on_status = self.inner.set_on_media_status_changed.call_args[0][0]
+
+    def test_load_milestones(self):
+        forwarded = []
+        self.player.set_on_media_status_changed(forwarded.append)
+        self.player.load("/v/a.mkv", 5000)
+        self.inner.load.assert_called_once_with("/v/a.mkv", 5000)
+        self.clock.advance(3)
+        self.on_status(MediaStatus.LOADING)
+        self.clock.advance(40)
+        self.on_status(MediaStatus.LOADED)
+        self.on_status(MediaStatus.LOADED) # only the first one counts
+        self.clock.advance(10)
+        self.on_state(PlaybackState.PLAYING)
+        self.clock.advance(5)
+        self.on_position(5000)
+        self.assertEqual(forwarded, [MediaStatus.LOADING, MediaStatus.LOADED, MediaStatus.LOADED])
+
+        stats = self.timings.stats()["MagicMock"]
+        self.assertAlmostEqual(stats["load_to_loading"]["p50_ms"], 3)
+        self.assertAlmostEqual(stats["load_to_loaded"]["p50_ms"], 43)
+        self.assertAlmostEqual(stats["load_to_playing"]["p50_ms"], 53)
+        self.assertAlmostEqual(stats["load_to_first_position"]["p50_ms"], 58)
+        self.assertEqual(stats["load_to_loaded"]["count"], 1)
+
+    def test_seek_waits_for_position_near_target(self):
+        self.on_position(1000)
+        self.player.seek(60000)
+        self.clock.advance(20)
+        self.on_position(1250) # still the old position
+        self.clock.advance(30)
+        self.on_position(59000) # keyframe before the target
+        self.on_position(60000)
+        seek = self.timings.stats()["MagicMock"]["seek_to_position"]
+        self.assertEqual(seek["count"], 1)
+        self.assertAlmostEqual(seek["p50_ms"], 50)
+
+    def test_short_seek_not_timed(self):
+        self.on_position(1000)
+        self.player.seek(2000)
+        self.on_position(2000)
+        self.assertEqual(self.timings.stats(), {})
+
+    def test_dump(self):
+        self.player.load("/v/a.mkv")
+        self.on_status(MediaStatus.LOADED)
+        lines = []
+        self.timings.dump(lines.append)
+        self.assertIn("load_to_loaded", lines[1])
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_buckets(self):
+        hist = LatencyHistogram()
+        for ms in (0.5, 1, 3, 150, 20000):
+            hist.add(ms)
+        snap = hist.snapshot()
+        self.assertEqual(snap["buckets"], {"<=1": 2, "<=5": 1, "<=200": 1, ">10000": 1})
+        self.assertEqual(snap["max_ms"], 20000)
+        self.assertEqual(snap["p50_ms"], 3)
+
+if __name__ == "__main__":
+    unittest.main()
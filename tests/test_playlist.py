@@ -0,0 +1,145 @@
+import sys
+import os
+import random
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.playlist import Playlist
+from domain.models import Video
+
+class PlaylistIndexTest(unittest.TestCase):
+    def assertIndexed(self, playlist: Playlist):
+        for i, video in enumerate(playlist):
+            self.assertEqual(playlist.position_of(video), i)
+        self.assertEqual(len(playlist._positions), len(playlist))
+
+    def test_duplicates_are_distinct_entries(self):
+        a1, a2 = Video("/v/a.mkv"), Video("/v/a.mkv")
+        playlist = Playlist([a1, Video("/v/b.mkv"), a2])
+        self.assertNotEqual(a1, a2)
+        self.assertEqual(playlist.position_of(a1), 0)
+        self.assertEqual(playlist.position_of(a2), 2)
+        playlist.remove(a2)
+        self.assertIn(a1, playlist)
+        self.assertNotIn(a2, playlist)
+
+    def test_random_edits_keep_index_consistent(self):
+        rng = random.Random(0)
+        playlist = Playlist(Video(f"/v/{i % 7}.mkv") for i in range(50))
+        for _ in range(500):
+            op = rng.randrange(4)
+            if op == 0:
+                playlist.move(rng.randrange(len(playlist)), rng.randrange(len(playlist)))
+            elif op == 1 and len(playlist) > 1:
+                playlist.pop(rng.randrange(len(playlist)))
+            elif op == 2:
+                playlist.insert(rng.randrange(len(playlist) + 1), Video("/v/new.mkv"))
+            else:
+                playlist.extend([Video("/v/x.mkv"), Video("/v/y.mkv")])
+            self.assertIndexed(playlist)
+
+    def test_shuffle_is_reproducible_and_keeps_first(self):
+        videos = [Video(f"/v/{i}.mkv") for i in range(100)]
+        first, second = Playlist(videos), Playlist(videos)
+        first.shuffle(seed=42, first=videos[10])
+        second.shuffle(seed=42, first=videos[10])
+        self.assertIs(first[0], videos[10])
+        self.assertEqual([v.entry_id for v in first], [v.entry_id for v in second])
+        self.assertEqual(sorted(v.entry_id for v in first), sorted(v.entry_id for v in videos))
+        self.assertIndexed(first)
+        first.unshuffle()
+        self.assertEqual(first.to_list(), videos)
+
+    def test_shuffled_edits_stay_consistent(self):
+        rng = random.Random(1)
+        videos = [Video(f"/v/{i % 7}.mkv") for i in range(300)]
+        # `lazy` only draws rows when an edit needs them, `eager` is fully drawn after every step
+        lazy, eager = Playlist(videos), Playlist(videos)
+        canonical = list(videos)
+        for step in range(400):
+            if step % 100 == 0:
+                current = lazy[rng.randrange(len(lazy))]
+                seed = rng.random()
+                lazy.shuffle(seed, first=current)
+                eager.shuffle(seed, first=current)
+                self.assertEqual(lazy.position_of(current), 0)
+            op = rng.randrange(4)
+            if op == 0 and len(lazy) > 1:
+                index = rng.randrange(len(lazy))
+                removed = lazy.pop(index)
+                self.assertIs(eager.pop(index), removed)
+                canonical.remove(removed)
+            elif op == 1:
+                a, b = rng.randrange(len(lazy)), rng.randrange(len(lazy))
+                lazy.move(a, b)
+                eager.move(a, b)
+            elif op == 2:
+                added = [Video("/v/new.mkv"), Video("/v/new.mkv")]
+                lazy.extend(added)
+                eager.extend(added)
+                canonical.extend(added)
+            else:
+                video = Video("/v/ins.mkv")
+                index = rng.randrange(len(lazy) + 1)
+                lazy.insert(index, video)
+                eager.insert(index, video)
+                canonical.append(video)
+            self.assertEqual(len(lazy), len(canonical))
+            self.assertIndexed(eager)
+        self.assertEqual(list(lazy), list(eager))
+        self.assertEqual(sorted(v.entry_id for v in lazy), sorted(v.entry_id for v in canonical))
+        lazy.unshuffle()
+        self.assertEqual(lazy.to_list(), canonical)
+
+    def test_shuffle_edits_before_drawing(self):
+        videos = [Video(f"/v/{i}.mkv") for i in range(50)]
+        playlist = Playlist(videos)
+        playlist.shuffle(7)
+        # Removed and added entries are tracked by entry_id, nothing is drawn yet
+        for video in videos[10:20]:
+            self.assertGreaterEqual(playlist.remove(video), 0)
+        added = [Video("/v/new.mkv") for _ in range(3)]
+        playlist.extend(added)
+        self.assertEqual(len(playlist), 43)
+        shuffled = list(playlist)
+        self.assertEqual(len(shuffled), 43)
+        self.assertEqual(shuffled[-3:], added)
+        self.assertEqual({v.entry_id for v in shuffled},
+                         {v.entry_id for v in videos[:10] + videos[20:] + added})
+        # Reshuffling and unshuffling see the canonical order without the removed entries
+        playlist.shuffle(8)
+        self.assertEqual(len(list(playlist)), 43)
+        playlist.unshuffle()
+        self.assertEqual(playlist.to_list(), videos[:10] + videos[20:] + added)
+        self.assertIndexed(playlist)
+
+    def test_remove_all_while_shuffled(self):
+        videos = [Video("/v/a.mkv"), Video("/v/b.mkv")]
+        playlist = Playlist(videos)
+        playlist.shuffle(1)
+        for video in videos:
+            playlist.remove(video)
+        self.assertFalse(playlist)
+        self.assertEqual(len(playlist), 0)
+        self.assertEqual(list(playlist), [])
+
+    def test_position_without_drawing(self):
+        videos = [Video(f"/v/{i}.mkv") for i in range(100)]
+        playlist = Playlist(videos)
+        self.assertEqual(playlist.position_of(videos[5], draw=False), 5)
+        playlist.shuffle(3, first=videos[10])
+        self.assertEqual(playlist.position_of(videos[10], draw=False), 0)
+        undrawn = next(v for v in videos if playlist.position_of(v, draw=False) < 0)
+        row = playlist.position_of(undrawn)
+        self.assertIs(playlist[row], undrawn)
+        self.assertEqual(playlist.position_of(undrawn, draw=False), row)
+
+    def test_unknown_entry(self):
+        playlist = Playlist([Video("/v/a.mkv")])
+        self.assertEqual(playlist.position_of(Video("/v/a.mkv")), -1)
+        self.assertEqual(playlist.position_of(None), -1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.playlist_files import iter_playlist_file, write_playlist_file
+from domain.models import Video
+
+class PlaylistFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_m3u_titles_and_relative_paths(self):
+        path = self.write("list.m3u8", "﻿#EXTM3U\n#EXTINF:120,Pilot\nshows/e01.mkv\n\n# comment\n"
+                                       "/abs/e02.mkv\nhttp://example.com/e03.mp4\n")
+        self.assertEqual(list(iter_playlist_file(path)), [
+            (os.path.join(self.tmp_dir, "shows", "e01.mkv"), "Pilot"),
+            (os.path.normpath("/abs/e02.mkv"), ""),
+            ("http://example.com/e03.mp4", ""),
+        ])
+
+    def test_pls(self):
+        path = self.write("list.pls", "[playlist]\nFile1=a.mkv\nTitle1=First\nLength1=-1\n"
+                                      "File3=c.mkv\nFile2=b.mkv\nTitle2=Second\nNumberOfEntries=3\n")
+        self.assertEqual(list(iter_playlist_file(path)), [
+            (os.path.join(self.tmp_dir, "a.mkv"), "First"),
+            (os.path.join(self.tmp_dir, "c.mkv"), ""),
+            (os.path.join(self.tmp_dir, "b.mkv"), "Second"),
+        ])
+
+    def test_round_trip(self):
+        videos = [Video(os.path.join(self.tmp_dir, "sub", "a.mkv"), "A, part 1"),
+                  Video("/elsewhere/b.mkv"), Video(os.path.join(self.tmp_dir, "a.mkv"))]
+        for name in ("out.m3u8", "out.pls"):
+            path = os.path.join(self.tmp_dir, name)
+            write_playlist_file(path, videos)
+            self.assertEqual(list(iter_playlist_file(path)),
+                             [(os.path.normpath(v.path), v.title) for v in videos])
+
+    def test_streams_large_files(self):
+        path = os.path.join(self.tmp_dir, "big.m3u")
+        with open(path, "w") as f:
+            for i in range(100000):
+                f.write(f"#EXTINF:-1,Episode {i}\nvideos/{i}.mkv\n")
+        entries = iter_playlist_file(path)
+        self.assertEqual(next(entries)[1], "Episode 0")
+        self.assertEqual(sum(1 for _ in entries), 99999)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import qInstallMessageHandler
+from PySide6.QtTest import QAbstractItemModelTester
+from PySide6.QtWidgets import QApplication
+from adapters.persistence.json_adapter import JsonPersistenceAdapter
+from adapters.ui.player_screen import PlaylistModel
+from app.services import VideoService
+
+class PlaylistModelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        player = mock.MagicMock()
+        player.supports_gapless.return_value = False
+        player.get_position.return_value = 0
+        self.service = VideoService(player, JsonPersistenceAdapter(self.tmp_dir, flush_delay=60))
+        self.model = PlaylistModel(self.service)
+        self.warnings = []
+        previous = qInstallMessageHandler(lambda mode, context, message: self.warnings.append(message))
+        self.addCleanup(qInstallMessageHandler, previous)
+        self.tester = QAbstractItemModelTester(self.model, QAbstractItemModelTester.FailureReportingMode.Warning)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def titles(self):
+        return [self.model.data(self.model.index(row)).split(". ", 1)[1] for row in range(self.model.rowCount())]
+
+    def assertMatchesPlaylist(self):
+        self.assertEqual(self.warnings, [])
+        self.assertEqual(self.titles(), [video.title for video in self.service.playlist])
+
+    def test_insert_remove_move(self):
+        self.service.add_files([f"/videos/{i:02d}.mkv" for i in range(10)])
+        self.service.add_files(["/videos/extra.mkv"])
+        self.service.remove_from_playlist(0)
+        self.service.remove_from_playlist(5)
+        self.service.remove_from_playlist(self.model.rowCount() - 1)
+        self.assertMatchesPlaylist()
+        for from_index, to_index in ((0, 5), (5, 0), (2, 3), (3, 2), (0, 7), (7, 6), (4, 4)):
+            self.service.reorder_playlist(from_index, to_index)
+            self.assertMatchesPlaylist()
+        self.assertEqual(self.model.rowCount(), 8)
+
+    def test_noop_move_through_the_model(self):
+        self.service.add_files([f"/videos/{i}.mkv" for i in range(3)])
+        self.model._on_rows_moved(1, 1, 1) # what a stray service signal would do
+        self.assertFalse(self.model.moveRows(self.model.index(0).parent(), 1, 1, self.model.index(0).parent(), 2))
+        self.assertMatchesPlaylist()
+
+    def test_reset_and_shuffle(self):
+        self.service.add_files([f"/videos/{i:02d}.mkv" for i in range(20)])
+        self.service.play_at_index(3)
+        self.service.toggle_shuffle(seed=5)
+        self.assertMatchesPlaylist()
+        self.assertEqual(self.model.data(self.model.index(0), PlaylistModel.VideoRole), self.service.current_video)
+        self.service.reorder_playlist(0, 10)
+        self.service.remove_from_playlist(2)
+        self.service.add_files(["/videos/new.mkv"])
+        self.assertMatchesPlaylist()
+        self.service.toggle_shuffle()
+        self.assertMatchesPlaylist()
+        self.service.update_playlist(self.service.playlist.to_list()[::2])
+        self.assertMatchesPlaylist()
+        self.service.cleanup_playlist()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.warnings, [])
+
+if __name__ == "__main__":
+    unittest.main()
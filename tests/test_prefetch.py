@@ -0,0 +1,69 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.prefetch import NextItemPrefetcher, SwitchTimer, warm_file_head
+
+class NextItemPrefetcherTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        self.prefetcher = NextItemPrefetcher(self.prefetch, window_ms=10000)
+
+    def prefetch(self):
+        self.calls += 1
+
+    def test_fires_once_inside_window(self):
+        self.prefetcher.reset()
+        self.prefetcher.on_position(1000) # duration not known yet
+        self.prefetcher.on_duration(60000)
+        self.prefetcher.on_position(45000)
+        self.assertEqual(self.calls, 0)
+        self.prefetcher.on_position(50000)
+        self.prefetcher.on_position(55000)
+        self.assertEqual(self.calls, 1)
+
+    def test_known_duration_and_reset(self):
+        self.prefetcher.reset(20000)
+        self.prefetcher.on_position(15000)
+        self.assertEqual(self.calls, 1)
+        self.prefetcher.reset(20000)
+        self.prefetcher.on_position(15000)
+        self.assertEqual(self.calls, 2)
+
+    def test_disabled(self):
+        self.prefetcher.reset(20000)
+        self.prefetcher.disable()
+        self.prefetcher.on_position(19000)
+        self.assertEqual(self.calls, 0)
+
+class SwitchTimerTest(unittest.TestCase):
+    def test_split_by_prefetch(self):
+        now = [0.0]
+        timer = SwitchTimer(clock=lambda: now[0])
+        timer.on_position(0) # not started: ignored
+        timer.start(prefetched=True)
+        now[0] += 0.05
+        timer.on_position(0)
+        timer.on_position(100) # only the first update counts
+        timer.start(prefetched=False)
+        now[0] += 0.4
+        timer.on_position(0)
+        stats = timer.stats()
+        self.assertEqual(stats["prefetched"]["count"], 1)
+        self.assertAlmostEqual(stats["prefetched"]["p50_ms"], 50)
+        self.assertAlmostEqual(stats["cold"]["max_ms"], 400)
+
+class WarmFileHeadTest(unittest.TestCase):
+    def test_missing_and_small_files(self):
+        warm_file_head("/nonexistent/file.mkv")
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"x" * 1000)
+            f.flush()
+            warm_file_head(f.name)
+
+if __name__ == "__main__":
+    unittest.main()
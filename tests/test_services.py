@@ -0,0 +1,266 @@
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtCore import QCoreApplication
+from adapters.persistence.json_adapter import JsonPersistenceAdapter
+from app import folder_scan
+from app.file_identity import FileIdentity
+from app.services import VideoService
+from domain.ports import WATCHED_POSITION
+from domain.models import MediaStatus
+
+class VideoServiceProgressTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = JsonPersistenceAdapter(self.tmp_dir, flush_delay=60)
+        self.paths = []
+        for name in ("a.mkv", "b.mkv"):
+            path = os.path.join(self.tmp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(name.encode() * 1000)
+            self.paths.append(path)
+        self.service = self._service()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _service(self, identity=None):
+        player = mock.MagicMock()
+        player.supports_gapless.return_value = False
+        player.get_duration.return_value = 600000
+        player.get_position.return_value = 0
+        return VideoService(player, self.store, identity=identity)
+
+    def _stored(self, path):
+        key = self.service.identity.key_for(path)
+        return self.store.progress.data.get(key), self.store.progress.data.get(path)
+
+    def test_reset_drops_path_keyed_progress(self):
+        # Saved before progress was keyed by fingerprint
+        self.store.save_progress(self.paths[0], 30000)
+        self.service.play_files([self.paths[0]])
+        self.service.player.inner.load.assert_called_with(self.paths[0], 30000)
+        self.service.close_video(reset_progress=True)
+        self.assertEqual(self._stored(self.paths[0]), (None, None))
+        self.assertEqual(self._service().load_progress(self.paths[0]), 0)
+
+    def test_finish_marks_watched_and_drops_path_keyed_progress(self):
+        self.store.save_progress(self.paths[0], 30000)
+        self.service.play_files([self.paths[0]])
+        self.service.checkpointer.checkpoint(598000)
+        self.assertEqual(self._stored(self.paths[0]), ([WATCHED_POSITION, mock.ANY], None))
+        self.assertTrue(self.service.current_video.watched)
+        self.assertEqual(self.service.load_progress(self.paths[0]), 0)
+
+    def test_auto_advance_drops_finished_progress(self):
+        self.service.play_files(self.paths)
+        first = self.service.current_video
+        # Last checkpoint a few seconds before the end
+        self.service.checkpointer.checkpoint(590000)
+        self.assertEqual(self._stored(self.paths[0])[0], [590000, mock.ANY])
+        self.service._on_media_status_changed(MediaStatus.End)
+        self.assertEqual(self.service.current_index, 1)
+        self.assertEqual(self._stored(self.paths[0]), ([WATCHED_POSITION, mock.ANY], None))
+        self.assertEqual(first.resume_position, 0)
+        self.assertTrue(first.watched)
+
+    def test_resume_positions_after_restart(self):
+        cache_path = os.path.join(self.tmp_dir, "file_identity.jsonl")
+        self.service = self._service(FileIdentity(cache_path=cache_path))
+        self.service.play_files([self.paths[0]])
+        self.service.checkpointer.checkpoint(42000)
+        self.service.shutdown()
+
+        # A new run: nothing hashed yet, the fingerprint comes from the cache file
+        identity = FileIdentity(cache_path=cache_path)
+        service = self._service(identity)
+        with mock.patch("app.file_identity.compute_fingerprint") as compute:
+            service.add_files(self.paths)
+            compute.assert_not_called()
+        self.assertEqual(service.playlist[0].resume_position, 42000)
+        self.assertIsNone(service.playlist[1].resume_position) # never played, resolved on play
+        service.shutdown()
+
+    def test_watched_survives_restart(self):
+        cache_path = os.path.join(self.tmp_dir, "file_identity.jsonl")
+        self.service = self._service(FileIdentity(cache_path=cache_path))
+        self.service.play_files(self.paths)
+        self.service.checkpointer.checkpoint(599000)
+        self.service.shutdown()
+
+        service = self._service(FileIdentity(cache_path=cache_path))
+        with mock.patch("app.file_identity.compute_fingerprint") as compute:
+            service.add_files(self.paths)
+            compute.assert_not_called()
+        watched, unplayed = service.playlist[0], service.playlist[1]
+        self.assertEqual((watched.resume_position, watched.watched), (0, True))
+        self.assertIsNone(unplayed.resume_position)
+        self.assertFalse(unplayed.watched)
+        # Rewatching from the start keeps the marker until a real position is saved
+        service.play_at_index(0)
+        service.player.inner.load.assert_called_with(self.paths[0], 0)
+        service.checkpointer.checkpoint(0)
+        self.assertTrue(watched.watched)
+        service.checkpointer.checkpoint(60000)
+        self.assertEqual((watched.resume_position, watched.watched), (60000, False))
+        service.shutdown()
+
+    def test_reset_clears_watched(self):
+        self.service.play_files([self.paths[0]])
+        self.service.checkpointer.checkpoint(599000)
+        self.service.close_video(reset_progress=True)
+        self.assertEqual(self._stored(self.paths[0]), (None, None))
+
+    def test_path_keyed_progress_migrates_on_read(self):
+        self.store.save_progress(self.paths[0], 30000)
+        self.assertEqual(self.service.load_progress(self.paths[0]), 30000)
+        key = self.service.identity.key_for(self.paths[0])
+        self.assertEqual(self.store.load_progress(key), 30000)
+        self.assertEqual(self.store.load_progress(self.paths[0]), 0)
+
+class VideoServicePlaylistTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        player = mock.MagicMock()
+        player.supports_gapless.return_value = False
+        self.service = VideoService(player, JsonPersistenceAdapter(self.tmp_dir, flush_delay=60))
+        self.service.add_files([f"/videos/{i}.mkv" for i in range(3)])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_noop_and_out_of_range_moves_emit_nothing(self):
+        emitted = []
+        self.service.playlist_rows_moved.connect(lambda *args: emitted.append(args))
+        self.service.playlist_updated.connect(lambda: emitted.append("updated"))
+        before = self.service.playlist.to_list()
+        for from_index, to_index in ((1, 1), (-1, 0), (0, 3), (3, 3)):
+            self.service.reorder_playlist(from_index, to_index)
+        self.assertEqual(emitted, [])
+        self.assertEqual(self.service.playlist.to_list(), before)
+        self.service.reorder_playlist(0, 2)
+        self.assertEqual(emitted, [(0, 0, 2), "updated"])
+
+    def test_stale_prefetch_is_replaced(self):
+        player = self.service.player.inner
+        self.service.play_at_index(0)
+        self.service._prefetch_next()
+        player.preload.assert_called_with("/videos/1.mkv")
+        # Moving another item right after the current one changes the next entry
+        self.service.reorder_playlist(2, 1)
+        player.cancel_preload.assert_called_once()
+        player.preload.assert_called_with("/videos/2.mkv")
+        # Moves that keep the next entry leave the preload alone
+        self.service.add_files(["/videos/3.mkv"])
+        self.service.reorder_playlist(3, 2)
+        player.cancel_preload.assert_called_once()
+        self.service.remove_from_playlist(1)
+        self.assertEqual(player.cancel_preload.call_count, 2)
+        player.preload.assert_called_with("/videos/3.mkv")
+        self.service.toggle_shuffle(seed=1)
+        next_video = self.service._next_video()
+        if next_video.path != "/videos/3.mkv":
+            self.assertEqual(player.cancel_preload.call_count, 3)
+        player.preload.assert_called_with(next_video.path)
+        self.assertEqual(self.service._prefetched_path, next_video.path)
+
+class VideoServiceFolderScanTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        player = mock.MagicMock()
+        player.supports_gapless.return_value = False
+        self.service = VideoService(player, JsonPersistenceAdapter(self.tmp_dir, flush_delay=60))
+        self.folders = []
+        for folder in ("one", "two"):
+            path = os.path.join(self.tmp_dir, folder)
+            os.mkdir(path)
+            for i in range(3):
+                open(os.path.join(path, f"{folder}{i}.mkv"), "wb").close()
+            self.folders.append(path)
+
+    def tearDown(self):
+        self.service.shutdown()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_overlapping_add_folders(self):
+        finished = []
+        self.service.scan_finished.connect(lambda found, cancelled: finished.append((found, cancelled)))
+        # Hold the first walk open until the second folder has been added
+        gate = threading.Event()
+        walk = folder_scan.iter_media_files
+
+        def gated_walk(root, *args):
+            gate.wait(5)
+            return walk(root, *args)
+
+        with mock.patch.object(folder_scan, "iter_media_files", gated_walk):
+            self.service.add_folders([self.folders[0]])
+            self.service.add_folders([self.folders[1]])
+            gate.set()
+            deadline = time.monotonic() + 5
+            while not finished and time.monotonic() < deadline:
+                self.app.processEvents()
+                time.sleep(0.01)
+        self.assertEqual(finished, [(6, False)])
+        titles = sorted(video.title for video in self.service.playlist)
+        self.assertEqual(titles, [f"{folder}{i}.mkv" for folder in ("one", "two") for i in range(3)])
+
+class VideoServiceGaplessTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.player = mock.MagicMock()
+        self.player.supports_gapless.return_value = True
+        self.player.get_duration.return_value = 600000
+        self.player.get_position.return_value = 0
+        self.service = VideoService(self.player, JsonPersistenceAdapter(self.tmp_dir, flush_delay=60))
+        self.service.set_gapless(True)
+        self.paths = [f"/videos/{i}.mkv" for i in range(3)]
+        self.service.add_files(self.paths)
+        self.updates = []
+        self.service.playlist_updated.connect(lambda: self.updates.append(True))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def queued(self):
+        return [c.args[0] for c in self.player.queue_next.call_args_list]
+
+    def test_track_changes_queue_next_without_playlist_updated(self):
+        self.player.queue_next.reset_mock()
+        self.service.play_at_index(0)
+        self.assertEqual(self.queued(), [self.paths[1]])
+        self.service._on_track_advanced(self.paths[1])
+        self.assertEqual(self.service.current_index, 1)
+        self.assertEqual(self.queued(), [self.paths[1], self.paths[2]])
+        # Replaying the same index reloads, which drops the engine's queue
+        self.service.play_at_index(1)
+        self.assertEqual(self.queued(), [self.paths[1], self.paths[2], self.paths[2]])
+        self.assertEqual(self.updates, [])
+
+if __name__ == "__main__":
+    unittest.main()
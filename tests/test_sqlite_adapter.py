@@ -0,0 +1,137 @@
+import sys
+import os
+import json
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adapters.persistence.sqlite_adapter import SqlitePersistenceAdapter, SCHEMA_VERSION
+from domain.ports import WATCHED_POSITION
+
+class SqliteAdapterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "user_data.db")
+        self.settings_path = os.path.join(self.tmp_dir, "settings.json")
+        self.legacy_path = os.path.join(self.tmp_dir, "user_data.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _open(self):
+        store = SqlitePersistenceAdapter(self.db_path, self.settings_path, self.legacy_path)
+        self.addCleanup(store.close)
+        return store
+
+    def _schema(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(progress)")]
+            indexes = [row[1] for row in conn.execute("PRAGMA index_list(progress)")]
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        finally:
+            conn.close()
+        return version, columns, indexes, tables
+
+    def _read_settings(self):
+        with open(self.settings_path) as f:
+            return json.load(f)
+
+    def test_imports_legacy_json(self):
+        with open(self.legacy_path, 'w') as f:
+            json.dump({
+                "/videos/a.mkv": 1500,
+                "/videos/b.mkv": 0, # finished, not imported
+                "player_engine": "mpv",
+                "subtitles": True,
+                "recent_videos": ["/videos/a.mkv", "/videos/b.mkv"],
+            }, f)
+        store = self._open()
+        self.assertEqual(store.load_progress("/videos/a.mkv"), 1500)
+        self.assertEqual(store.load_progress_many(["/videos/a.mkv", "/videos/b.mkv"]), {"/videos/a.mkv": 1500})
+        self.assertEqual(store.get_recent_videos(), ["/videos/a.mkv", "/videos/b.mkv"])
+        self.assertEqual(store.load_setting("player_engine"), "mpv")
+        self.assertEqual(self._read_settings(), {"player_engine": "mpv", "subtitles": True})
+
+        # Only done once: later edits to the old file are ignored
+        store.save_progress("/videos/a.mkv", 2500)
+        store.close()
+        store = self._open()
+        self.assertEqual(store.load_progress("/videos/a.mkv"), 2500)
+
+    def test_migrates_schema_v1(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            "CREATE TABLE progress (path TEXT PRIMARY KEY, position INTEGER NOT NULL) WITHOUT ROWID;"
+            "CREATE TABLE recent_videos (rank INTEGER PRIMARY KEY, path TEXT NOT NULL);"
+            "CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "INSERT INTO progress VALUES ('/videos/a.mkv', 1500), ('/videos/b.mkv', 0);"
+            "INSERT INTO recent_videos VALUES (0, '/videos/a.mkv');"
+            "INSERT INTO settings VALUES ('player_engine', '\"vlc\"'), ('volume', '80');"
+            "PRAGMA user_version = 1;"
+        )
+        conn.close()
+        # A value already in settings.json wins over the migrated one
+        with open(self.settings_path, 'w') as f:
+            json.dump({"volume": 50}, f)
+        # A legacy file next to a v1 database was already imported back then
+        with open(self.legacy_path, 'w') as f:
+            json.dump({"/videos/c.mkv": 700}, f)
+
+        store = self._open()
+        version, columns, indexes, tables = self._schema()
+        self.assertEqual(version, SCHEMA_VERSION)
+        self.assertIn("last_access", columns)
+        self.assertIn("progress_last_access", indexes)
+        self.assertNotIn("settings", tables)
+
+        self.assertEqual(self._read_settings(), {"volume": 50, "player_engine": "vlc"})
+        self.assertEqual(store.load_setting("player_engine"), "vlc")
+        self.assertEqual(store.get_recent_videos(), ["/videos/a.mkv"])
+        self.assertEqual(
+            store.load_progress_many(["/videos/a.mkv", "/videos/b.mkv", "/videos/c.mkv"]),
+            {"/videos/a.mkv": 1500},
+        )
+
+    def test_load_progress_many(self):
+        store = self._open()
+        paths = [f"/videos/{i:03d} 'quoted', \"name\" ✓.mkv" for i in range(50)]
+        for i, path in enumerate(paths):
+            store.save_progress(path, (i + 1) * 1000)
+        store.save_progress(paths[0], 0) # deleted
+        found = store.load_progress_many(paths + ["/videos/missing.mkv"])
+        self.assertEqual(len(found), 49)
+        self.assertNotIn(paths[0], found)
+        self.assertEqual(found[paths[49]], 50000)
+        self.assertEqual(store.load_progress_many([]), {})
+
+    def test_watched_is_kept(self):
+        store = self._open()
+        store.save_progress("/videos/a.mkv", WATCHED_POSITION)
+        store.close()
+        store = self._open()
+        self.assertEqual(store.load_progress("/videos/a.mkv"), WATCHED_POSITION)
+        self.assertEqual(store.load_progress_many(["/videos/a.mkv", "/videos/b.mkv"]),
+                         {"/videos/a.mkv": WATCHED_POSITION})
+
+    def test_reads_dont_write(self):
+        store = self._open()
+        store.save_progress("/videos/a.mkv", 1500)
+        store.save_progress("/videos/b.mkv", 2500)
+        changes = store._conn.total_changes
+        self.assertEqual(store.load_progress("/videos/a.mkv"), 1500)
+        self.assertEqual(store.load_progress_many(["/videos/a.mkv"]), {"/videos/a.mkv": 1500})
+        self.assertEqual(store._conn.total_changes, changes)
+
+        # The access time goes out with the next real write
+        store.save_progress("/videos/b.mkv", 3000)
+        self.assertEqual(store._conn.total_changes, changes + 2)
+        self.assertEqual(store._touched, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,10 @@ class MockPersistence(PersistencePort):
         print(f"MockPersistence: Saving {path} at {position}")
     def load_progress(self, path):
         return 0
+    def load_progress_many(self, paths):
+        return {}
+    def delete_progress(self, path):
+        pass
     def save_setting(self, key, value):
         pass
     def load_setting(self, key, default=None):